@@ -173,6 +173,38 @@ GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE')
 GOOGLE_WORKSPACE_ADMIN_EMAIL = os.getenv('GOOGLE_WORKSPACE_ADMIN_EMAIL')
 GOOGLE_CALENDAR_ID = os.getenv('GOOGLE_CALENDAR_ID')
 
+# TTL (segundos) de la caché en memoria de espacios de Google Meet
+GOOGLE_MEET_SPACE_CACHE_TTL = int(os.getenv('GOOGLE_MEET_SPACE_CACHE_TTL', '60'))
+
+# Peticiones por minuto a Meet API (conference records) antes de esperar localmente
+GOOGLE_MEET_API_RATE_PER_MINUTE = int(os.getenv('GOOGLE_MEET_API_RATE_PER_MINUTE', '600'))
+
+# Hilos para sincronizar grabaciones en paralelo (I/O contra Drive/Meet API)
+DRIVE_SYNC_WORKERS = int(os.getenv('DRIVE_SYNC_WORKERS', '8'))
+
+# TTL (segundos) de las grabaciones de Conference Records API en la caché de
+# Django. Una grabación FILE_GENERATED ya no cambia, así que se conserva entre
+# ejecuciones de sync_all_recordings
+MEET_RECORDING_CACHE_TTL = int(os.getenv('MEET_RECORDING_CACHE_TTL', '86400'))
+
+
+# Cache Configuration
+# Con CACHE_REDIS_URL la caché se comparte entre workers y sobrevive a
+# reinicios; si no, caché en memoria del proceso
+if os.getenv('CACHE_REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('CACHE_REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 
 # Celery Configuration (Async Tasks)
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
@@ -182,6 +214,15 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'America/Bogota'
 
+# Cola de las tareas de sincronización de grabaciones. Permite dedicarles un
+# worker propio (celery -A app worker -Q drive_sync) dimensionado según la
+# cuota de Google; por defecto usan la cola estándar.
+RECORDING_SYNC_QUEUE = os.getenv('RECORDING_SYNC_QUEUE', 'celery')
+CELERY_TASK_ROUTES = {
+    'meetings.sync_meeting_recording': {'queue': RECORDING_SYNC_QUEUE},
+    'meetings.sync_all_recordings': {'queue': RECORDING_SYNC_QUEUE},
+}
+
 # Celery Beat Schedule (Tareas Periódicas)
 from celery.schedules import crontab
 
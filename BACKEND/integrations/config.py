@@ -6,7 +6,14 @@ Define scopes, configuración de APIs y validaciones de credenciales.
 
 from django.conf import settings
 from core.exceptions import MissingCredentialsError, InvalidConfigurationError
+from typing import Optional
+import functools
+import logging
 import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
 
 
 # Scopes de Google API necesarios
@@ -29,6 +36,9 @@ GOOGLE_MEET_SCOPES = [
 # Todos los scopes combinados
 ALL_SCOPES = GOOGLE_CALENDAR_SCOPES + GOOGLE_DRIVE_SCOPES + GOOGLE_MEET_SCOPES
 
+# Plazo total (segundos) para reintentar la lectura del archivo de credenciales
+CREDENTIALS_READ_DEADLINE = 0.5
+
 
 def validate_google_credentials(raise_exception=True):
     """
@@ -96,6 +106,97 @@ def get_google_config():
     }
 
 
+def service_account_credentials(path: str, subject: Optional[str], scopes: tuple):
+    """
+    Retorna las credenciales compartidas del Service Account.
+    
+    Se cargan una vez por proceso y versión del archivo: el mtime forma
+    parte de la clave de caché, así que rotar la clave (reescribir el
+    archivo) invalida las credenciales anteriores sin reiniciar. Si hay
+    subject, aplica Domain-Wide Delegation con with_subject.
+    
+    Args:
+        path: Ruta al archivo JSON del Service Account
+        subject: Email a impersonar o None
+        scopes: Scopes solicitados
+    
+    Returns:
+        service_account.Credentials: Credenciales compartidas
+    """
+    return _load_service_account_credentials(
+        path, os.stat(path).st_mtime_ns, subject, scopes
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_service_account_credentials(path: str, mtime_ns: int,
+                                      subject: Optional[str], scopes: tuple):
+    """
+    Lee el archivo del Service Account y construye las credenciales.
+    
+    Usa from_service_account_info en lugar de from_service_account_file
+    para evitar problemas de deadlock en macOS con Docker. mtime_ns solo
+    participa en la clave de caché.
+    """
+    # Import diferido: google.oauth2 es costoso de importar y solo se
+    # necesita al construir el cliente
+    from google.oauth2 import service_account
+    from .transport import json_loads
+    
+    # Leer el archivo en memoria primero para evitar deadlock en macOS/Docker.
+    # Reintentar solo errores transitorios de E/S, acotado por un plazo
+    # total (no por número de intentos) para no bloquear al llamador
+    deadline = time.monotonic() + CREDENTIALS_READ_DEADLINE
+    while True:
+        try:
+            with open(path, 'rb') as f:
+                creds_info = json_loads(f.read())
+            break
+        except FileNotFoundError:
+            raise
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            logger.warning("Fallo al leer credenciales, reintentando...")
+            time.sleep(0.02)
+    
+    credentials = service_account.Credentials.from_service_account_info(
+        creds_info,
+        scopes=list(scopes)
+    )
+    if subject:
+        credentials = credentials.with_subject(subject)
+    return credentials
+
+
+def process_singleton(factory):
+    """
+    Decorador: convierte factory() en el getter de una instancia por proceso.
+    
+    La instancia se construye de forma perezosa en la primera llamada, con
+    doble verificación bajo un lock. Si factory() lanza no se guarda nada:
+    la siguiente llamada vuelve a intentarlo.
+    
+    Args:
+        factory: Función sin argumentos que construye la instancia
+    
+    Returns:
+        callable: Getter de la instancia compartida
+    """
+    instance = None
+    lock = threading.Lock()
+    
+    @functools.wraps(factory)
+    def getter():
+        nonlocal instance
+        if instance is None:
+            with lock:
+                if instance is None:
+                    instance = factory()
+        return instance
+    return getter
+
+
 class GoogleConfig:
     """
     Clase de configuración para Google APIs.
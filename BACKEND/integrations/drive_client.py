@@ -7,9 +7,9 @@ Maneja:
 - Obtención de metadatos de archivos
 """
 
-from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import functools
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -19,10 +19,43 @@ from core.exceptions import (
     GoogleDriveError,
     GoogleAPIQuotaExceeded
 )
-from .config import GoogleConfig
+from .config import GoogleConfig, process_singleton, service_account_credentials
+from .transport import FastJsonModel, build_request, thread_http
 
 logger = logging.getLogger(__name__)
 
+# Máximo de peticiones que Drive API acepta en un mismo batch HTTP
+DRIVE_BATCH_MAX = 100
+
+# Máscaras de campos de Drive API: solo lo que usan RecordingSyncService y los
+# endpoints (de videoMediaMetadata basta la duración)
+_FILE_FIELDS = (
+    "files(id, name, mimeType, size, createdTime, modifiedTime, "
+    "webViewLink, videoMediaMetadata/durationMillis)"
+)
+_FILE_FIELDS_ITEM = (
+    "id, name, mimeType, size, createdTime, modifiedTime, "
+    "webViewLink, properties, videoMediaMetadata/durationMillis"
+)
+_FOLDER_FIELDS = "files(id, name)"
+
+# Listados paginados: sin nextPageToken en la máscara, list_next no avanza
+_PAGED_FILE_FIELDS = "nextPageToken, " + _FILE_FIELDS
+
+# Máximo de archivos por página que acepta files.list
+DRIVE_PAGE_MAX = 1000
+
+# Formato de createdTime en las consultas de Drive (RFC 3339, UTC por defecto)
+DRIVE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# Plantillas de las consultas (q) de files.list
+_DATE_RANGE_QUERY = (
+    "mimeType='video/mp4' and createdTime >= '{start}' and "
+    "createdTime <= '{end}' and trashed=false"
+)
+_NAME_QUERY = "name contains '{name}' and mimeType='video/mp4' and trashed=false"
+_EVENT_PROPERTY_QUERY = "properties has {{ key='event_id' and value='{event_id}' }} and trashed=false"
+_FOLDER_QUERY = "'{folder_id}' in parents and mimeType='video/mp4' and trashed=false"
 
 class GoogleDriveClient:
     """
@@ -58,9 +91,9 @@ class GoogleDriveClient:
         """
         Carga credenciales del Service Account desde archivo JSON.
         
-        Incluye scopes de Drive para acceso a archivos.
-        Usa from_service_account_info en lugar de from_service_account_file
-        para evitar problemas de deadlock en macOS con Docker.
+        Incluye scopes de Drive para acceso a archivos. Las credenciales se
+        comparten con los demás clientes del proceso (ver
+        config.service_account_credentials).
         
         Returns:
             service_account.Credentials: Credenciales cargadas
@@ -69,38 +102,13 @@ class GoogleDriveClient:
             GoogleAuthenticationError: Si no se pueden cargar las credenciales
         """
         try:
-            # Leer el archivo en memoria primero para evitar deadlock en macOS/Docker
-            import json
-            import time
-            
-            # Intentar leer con retry para manejar problemas temporales
-            max_retries = 3
-            retry_delay = 0.1
-            
-            for attempt in range(max_retries):
-                try:
-                    with open(self.config.service_account_file, 'r') as f:
-                        creds_info = json.load(f)
-                    break
-                except OSError as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Intento {attempt + 1} falló al leer credenciales, reintentando...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        raise
-            
-            # Usar from_service_account_info en lugar de from_service_account_file
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_info,
-                scopes=self.config.all_scopes  # Incluye Calendar + Drive
+            credentials = service_account_credentials(
+                self.config.service_account_file,
+                self.config.admin_email,
+                tuple(self.config.all_scopes)  # Incluye Calendar + Drive
             )
-            
-            # Delegar dominio si está configurado
             if self.config.admin_email:
-                credentials = credentials.with_subject(self.config.admin_email)
                 logger.info(f"Credentials delegadas a: {self.config.admin_email}")
-            
             return credentials
             
         except Exception as e:
@@ -120,7 +128,15 @@ class GoogleDriveClient:
             GoogleAuthenticationError: Si la API no está habilitada
         """
         try:
-            return build('drive', 'v3', credentials=self.credentials)
+            return build(
+                'drive', 'v3',
+                http=thread_http(self.credentials),
+                requestBuilder=functools.partial(build_request, self.credentials),
+                # Respuestas de files.list (y de los batch) parseadas con orjson si está
+                model=FastJsonModel(),
+                cache_discovery=False,
+                static_discovery=True
+            )
         except Exception as e:
             error_msg = str(e)
             if 'not enabled' in error_msg.lower() or 'not found' in error_msg.lower():
@@ -190,6 +206,27 @@ class GoogleDriveClient:
             logger.error(f"Error inesperado al probar conexión: {e}")
             raise GoogleDriveError(f"Error inesperado: {str(e)}")
     
+    def _list_files(self, limit: int, **params) -> List[Dict[str, Any]]:
+        """
+        Ejecuta files().list paginando con list_next hasta reunir limit archivos.
+        
+        Args:
+            limit (int): Máximo de archivos a retornar
+            **params: Parámetros de files().list (q, fields, orderBy...)
+        
+        Returns:
+            List[Dict]: Archivos de las páginas consultadas, en orden
+        """
+        files = []
+        request = self.service.files().list(pageSize=min(limit, DRIVE_PAGE_MAX), **params)
+        while request is not None:
+            response = request.execute()
+            files.extend(response.get('files', []))
+            if len(files) >= limit:
+                return files[:limit]
+            request = self.service.files().list_next(request, response)
+        return files
+    
     def search_recordings_by_date_range(self, start_time: datetime, end_time: datetime, 
                                        limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -211,28 +248,20 @@ class GoogleDriveClient:
         """
         try:
             # Formatear fechas para query de Drive API (RFC 3339)
-            start_str = start_time.strftime('%Y-%m-%dT%H:%M:%S')
-            end_str = end_time.strftime('%Y-%m-%dT%H:%M:%S')
+            start_str = start_time.strftime(DRIVE_TIME_FORMAT)
+            end_str = end_time.strftime(DRIVE_TIME_FORMAT)
             
             # Query: archivos de video creados en el rango de tiempo
-            query = (
-                f"mimeType='video/mp4' and "
-                f"createdTime >= '{start_str}' and "
-                f"createdTime <= '{end_str}' and "
-                f"trashed=false"
-            )
+            query = _DATE_RANGE_QUERY.format(start=start_str, end=end_str)
             
             logger.info(f"Buscando grabaciones entre {start_str} y {end_str}")
             
-            result = self.service.files().list(
+            files = self._list_files(
+                limit,
                 q=query,
-                pageSize=limit,
-                fields="files(id, name, mimeType, size, createdTime, modifiedTime, "
-                       "webViewLink, webContentLink, videoMediaMetadata, parents)",
+                fields=_PAGED_FILE_FIELDS,
                 orderBy="createdTime desc"
-            ).execute()
-            
-            files = result.get('files', [])
+            )
             logger.info(f"Encontrados {len(files)} archivos de video en el rango")
             
             return files
@@ -272,11 +301,11 @@ class GoogleDriveClient:
         try:
             # Estrategia 1: Buscar en properties (poco probable que funcione)
             try:
-                query = f"properties has {{ key='event_id' and value='{event_id}' }}"
+                query = _EVENT_PROPERTY_QUERY.format(event_id=event_id)
                 result = self.service.files().list(
                     q=query,
                     pageSize=1,
-                    fields="files(id, name, properties)"
+                    fields=_FILE_FIELDS
                 ).execute()
                 
                 files = result.get('files', [])
@@ -287,11 +316,11 @@ class GoogleDriveClient:
                 pass  # Es normal que falle, no todos los archivos tienen properties
             
             # Estrategia 2: Buscar en nombre del archivo
-            query = f"name contains '{event_id}' and mimeType='video/mp4' and trashed=false"
+            query = _NAME_QUERY.format(name=event_id)
             result = self.service.files().list(
                 q=query,
                 pageSize=1,
-                fields="files(id, name, createdTime)"
+                fields=_FILE_FIELDS
             ).execute()
             
             files = result.get('files', [])
@@ -336,19 +365,14 @@ class GoogleDriveClient:
         """
         try:
             # Buscar archivos de video cuyo nombre contenga el código de Meet
-            query = (
-                f"name contains '{meeting_code}' and "
-                f"mimeType='video/mp4' and "
-                f"trashed=false"
-            )
+            query = _NAME_QUERY.format(name=meeting_code)
             
             logger.info(f"Buscando grabación por código de Meet: {meeting_code}")
             
             result = self.service.files().list(
                 q=query,
                 pageSize=10,
-                fields="files(id, name, mimeType, size, createdTime, modifiedTime, "
-                       "webViewLink, webContentLink, videoMediaMetadata, parents)",
+                fields=_FILE_FIELDS,
                 orderBy="createdTime desc"
             ).execute()
             
@@ -397,21 +421,141 @@ class GoogleDriveClient:
             logger.warning(f"Error inesperado al buscar por event_id: {e}")
             return None
     
+    def _list_files_bulk(self, queries: Dict[str, str], fields: str,
+                         page_size: int, order_by: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Ejecuta varias consultas files().list usando batch HTTP.
+        
+        Agrupa hasta DRIVE_BATCH_MAX consultas por petición. Las consultas
+        que fallan se omiten del resultado en lugar de lanzar excepción.
+        
+        Args:
+            queries (dict): {request_id: query de Drive}
+            fields (str): Máscara de campos de la respuesta
+            page_size (int): Resultados por consulta
+            order_by (str, optional): Orden de los resultados
+        
+        Returns:
+            dict: {request_id: lista de archivos}
+        
+        Raises:
+            GoogleDriveError: Si el batch no llega a ejecutarse (red, credenciales)
+        """
+        results = {}
+        
+        def callback(request_id, response, exception):
+            if exception is not None:
+                logger.debug(f"Consulta {request_id} falló en batch de Drive: {exception}")
+                return
+            results[request_id] = response.get('files', [])
+        
+        params = {'pageSize': page_size, 'fields': fields}
+        if order_by:
+            params['orderBy'] = order_by
+        
+        items = list(queries.items())
+        for i in range(0, len(items), DRIVE_BATCH_MAX):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for request_id, query in items[i:i + DRIVE_BATCH_MAX]:
+                batch.add(self.service.files().list(q=query, **params), request_id=request_id)
+            try:
+                batch.execute()
+            except HttpError as error:
+                logger.warning(f"Error en batch de Drive: {error}")
+            except Exception as e:
+                # Red o credenciales (TransportError, RefreshError, timeouts)
+                logger.error(f"Error inesperado en batch de Drive: {e}")
+                raise GoogleDriveError(f"Error inesperado en batch de Drive: {str(e)}")
+        
+        return results
+    
+    def search_recordings_by_meeting_codes_bulk(self, meeting_codes: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Versión en batch de search_recording_by_meeting_code.
+        
+        Args:
+            meeting_codes (list): Códigos de Meet (ej: ["ydo-jbsi-vhd"])
+        
+        Returns:
+            dict: {meeting_code: grabación más reciente o None} solo para los
+                códigos cuya consulta se completó; los que fallaron no aparecen
+        
+        Raises:
+            GoogleDriveError: Si un batch no llega a ejecutarse (ver _list_files_bulk)
+        """
+        codes = list(dict.fromkeys(meeting_codes))
+        files_by_code = self._list_files_bulk(
+            {
+                code: _NAME_QUERY.format(name=code)
+                for code in codes
+            },
+            fields=_FILE_FIELDS,
+            page_size=10,
+            order_by="createdTime desc"
+        )
+        
+        found = {}
+        for code, files in files_by_code.items():
+            # Igual que la búsqueda individual: el código debe estar al inicio del nombre
+            found[code] = next((f for f in files if f.get('name', '').startswith(code)), None)
+        
+        logger.info(
+            f"Búsqueda en batch por código de Meet: "
+            f"{sum(1 for f in found.values() if f)}/{len(codes)} grabaciones encontradas"
+        )
+        return found
+    
+    def search_recordings_by_event_ids_bulk(self, event_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Versión en batch de search_recording_by_event_id.
+        
+        Envía en el mismo batch las dos consultas de cada evento (properties
+        y nombre del archivo); la coincidencia en properties tiene prioridad.
+        
+        Args:
+            event_ids (list): IDs de eventos de Google Calendar
+        
+        Returns:
+            dict: {event_id: archivo encontrado o None} solo para los eventos
+                cuya búsqueda por nombre se completó
+        
+        Raises:
+            GoogleDriveError: Si un batch no llega a ejecutarse (ver _list_files_bulk)
+        """
+        ids = list(dict.fromkeys(event_ids))
+        queries = {}
+        for index, event_id in enumerate(ids):
+            # request_id debe ser único en el batch: se usa la posición del evento
+            queries[f"p{index}"] = _EVENT_PROPERTY_QUERY.format(event_id=event_id)
+            queries[f"n{index}"] = _NAME_QUERY.format(name=event_id)
+        files_by_request = self._list_files_bulk(
+            queries,
+            fields=_FILE_FIELDS,
+            page_size=1
+        )
+        
+        found = {}
+        for index, event_id in enumerate(ids):
+            if f"n{index}" not in files_by_request:
+                continue
+            files = files_by_request.get(f"p{index}") or files_by_request[f"n{index}"]
+            found[event_id] = files[0] if files else None
+        return found
+    
     def get_file_metadata(self, file_id: str) -> Dict[str, Any]:
         """
-        Obtiene metadatos completos de un archivo en Google Drive.
+        Obtiene metadatos de un archivo en Google Drive.
         
         Args:
             file_id (str): ID del archivo en Google Drive
         
         Returns:
-            Dict: Metadatos completos del archivo, incluyendo:
+            Dict: Metadatos del archivo (ver _FILE_FIELDS_ITEM):
                 - Información básica (id, name, mimeType, size)
                 - Fechas (createdTime, modifiedTime)
-                - Enlaces (webViewLink, webContentLink)
-                - Metadatos de video (durationMillis, width, height)
-                - Properties y appProperties
-                - Parents (carpetas)
+                - Enlace (webViewLink)
+                - Duración del video (videoMediaMetadata.durationMillis)
+                - Properties
         
         Raises:
             GoogleDriveError: Si el archivo no existe o hay error de acceso
@@ -419,10 +563,7 @@ class GoogleDriveClient:
         try:
             file_metadata = self.service.files().get(
                 fileId=file_id,
-                fields="id, name, mimeType, size, createdTime, modifiedTime, "
-                       "webViewLink, webContentLink, thumbnailLink, "
-                       "parents, properties, appProperties, description, "
-                       "videoMediaMetadata, owners, permissions"
+                fields=_FILE_FIELDS_ITEM
             ).execute()
             
             logger.debug(f"Metadatos obtenidos para archivo: {file_id}")
@@ -475,7 +616,7 @@ class GoogleDriveClient:
             result = self.service.files().list(
                 q=query,
                 pageSize=1,
-                fields="files(id, name)"
+                fields=_FOLDER_FIELDS
             ).execute()
             
             folders = result.get('files', [])
@@ -515,21 +656,14 @@ class GoogleDriveClient:
             GoogleDriveError: Si hay error al listar archivos
         """
         try:
-            query = (
-                f"'{folder_id}' in parents and "
-                f"mimeType='video/mp4' and "
-                f"trashed=false"
-            )
+            query = _FOLDER_QUERY.format(folder_id=folder_id)
             
-            result = self.service.files().list(
+            files = self._list_files(
+                limit,
                 q=query,
-                pageSize=limit,
-                fields="files(id, name, mimeType, size, createdTime, modifiedTime, "
-                       "webViewLink, videoMediaMetadata)",
+                fields=_PAGED_FILE_FIELDS,
                 orderBy="createdTime desc"
-            ).execute()
-            
-            files = result.get('files', [])
+            )
             logger.info(f"Encontrados {len(files)} archivos de video en la carpeta")
             
             return files
@@ -571,15 +705,12 @@ class GoogleDriveClient:
             # Buscar todos los archivos de video
             query = "mimeType='video/mp4' and trashed=false"
             
-            result = self.service.files().list(
+            files = self._list_files(
+                limit,
                 q=query,
-                pageSize=limit,
-                fields="files(id, name, mimeType, size, createdTime, modifiedTime, "
-                       "webViewLink, videoMediaMetadata, parents)",
+                fields=_PAGED_FILE_FIELDS,
                 orderBy="createdTime desc"
-            ).execute()
-            
-            files = result.get('files', [])
+            )
             logger.info(f"Encontrados {len(files)} archivos de video en Drive")
             
             return files
@@ -597,3 +728,20 @@ class GoogleDriveClient:
             logger.error(f"Error inesperado al listar grabaciones: {e}")
             raise GoogleDriveError(f"Error inesperado: {str(e)}")
 
+
+
+@process_singleton
+def get_drive_client() -> GoogleDriveClient:
+    """
+    Retorna la instancia compartida de GoogleDriveClient del proceso.
+    
+    Las credenciales y el servicio de Drive se construyen una sola vez; cada
+    hilo usa su propio transporte HTTP (ver transport.thread_http).
+    
+    Returns:
+        GoogleDriveClient: Cliente compartido
+    
+    Raises:
+        GoogleAuthenticationError: Si falla la inicialización del cliente
+    """
+    return GoogleDriveClient()
@@ -8,9 +8,9 @@ Maneja:
 - Gestión de eventos (actualizar, eliminar, consultar)
 """
 
-from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import functools
 import logging
 import uuid
 from datetime import datetime
@@ -21,10 +21,13 @@ from core.exceptions import (
     GoogleMeetCreationError,
     GoogleAPIQuotaExceeded
 )
-from .config import GoogleConfig
+from .config import GoogleConfig, service_account_credentials
 
 logger = logging.getLogger(__name__)
 
+# Máximo de peticiones por batch recomendado para Calendar API
+CALENDAR_BATCH_MAX = 50
+
 
 class GoogleCalendarClient:
     """
@@ -61,8 +64,11 @@ class GoogleCalendarClient:
         """
         Carga credenciales del Service Account desde archivo JSON.
         
-        Usa from_service_account_info en lugar de from_service_account_file
-        para evitar problemas de deadlock en macOS con Docker.
+        Las credenciales se comparten entre todas las instancias del proceso
+        con el mismo archivo, subject y scopes (ver
+        config.service_account_credentials): el archivo se lee una sola
+        vez y el access token obtenido se reutiliza hasta que expira, en lugar
+        de pedir uno nuevo por cada cliente construido.
         
         Returns:
             service_account.Credentials: Credenciales cargadas
@@ -71,53 +77,15 @@ class GoogleCalendarClient:
             GoogleAuthenticationError: Si no se pueden cargar las credenciales
         """
         try:
-            # Leer el archivo en memoria primero para evitar deadlock en macOS/Docker
-            # Estrategia: Leer todo el contenido de una vez en binario, luego parsear
-            import json
-            import time
-            
-            # Intentar leer con retry para manejar problemas temporales de macOS/Docker
-            max_retries = 5
-            retry_delay = 0.3
-            
-            creds_info = None
-            for attempt in range(max_retries):
-                try:
-                    # Leer el archivo completo en binario de una vez (evita múltiples reads)
-                    # Esto reduce la posibilidad de deadlock en macOS con Docker
-                    with open(self.config.service_account_file, 'rb') as f:
-                        # Leer todo el contenido de una vez
-                        content = f.read()
-                    
-                    # Parsear JSON desde el contenido en memoria (no desde el file handle)
-                    creds_info = json.loads(content.decode('utf-8'))
-                    break
-                    
-                except (OSError, IOError) as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Intento {attempt + 1}/{max_retries} falló al leer credenciales: {e}, esperando {retry_delay}s...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 1.5  # Exponential backoff
-                    else:
-                        logger.error(f"Todos los intentos fallaron al leer credenciales")
-                        raise
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error al parsear JSON de credenciales: {e}")
-                    raise GoogleAuthenticationError(f"El archivo de credenciales no es un JSON válido: {str(e)}")
-            
-            if creds_info is None:
-                raise GoogleAuthenticationError("No se pudo leer el archivo de credenciales después de múltiples intentos")
-            
-            # Usar from_service_account_info en lugar de from_service_account_file
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_info,
-                scopes=self.config.calendar_scopes
+            credentials = service_account_credentials(
+                self.config.service_account_file,
+                self.config.admin_email,
+                tuple(self.config.calendar_scopes)
             )
             
             # Delegar dominio si está configurado
             # Esto permite que el Service Account actúe en nombre de un usuario
             if self.config.admin_email:
-                credentials = credentials.with_subject(self.config.admin_email)
                 logger.info(f"Credentials delegadas a: {self.config.admin_email}")
             
             return credentials
@@ -132,10 +100,18 @@ class GoogleCalendarClient:
         """
         Construye el servicio de Google Calendar API.
         
+        Usa el documento de discovery estático incluido en la librería: sin
+        descarga desde www.googleapis.com ni caché de discovery en disco.
+        
         Returns:
             Resource: Servicio de Calendar API v3
         """
-        return build('calendar', 'v3', credentials=self.credentials)
+        return build(
+            'calendar', 'v3',
+            credentials=self.credentials,
+            cache_discovery=False,
+            static_discovery=True
+        )
     
     def _get_service_account_email(self):
         """
@@ -181,87 +157,14 @@ class GoogleCalendarClient:
             GoogleAPIQuotaExceeded: Si se excede la cuota de la API
         """
         try:
-            # Si use_description_only=True, NO incluir conferenceData (el link está en la descripción)
-            if use_description_only:
-                logger.info("Creando evento sin conferenceData (link en descripción)")
-                # No agregar conferenceData, el link ya está en la descripción
-                meet_link_from_description = existing_meet_uri  # Usar el URI que se pasó
-            elif existing_meet_uri:
-                # Usar espacio existente creado con Meet API (comportamiento anterior)
-                logger.info(f"Usando espacio existente: {existing_meet_uri}")
-                # Intentar asociar el meetingUri existente directamente
-                event_data['conferenceData'] = {
-                    'meetingUri': existing_meet_uri,
-                    'entryPoints': [
-                        {
-                            'entryPointType': 'video',
-                            'uri': existing_meet_uri,
-                            'label': 'meet.google.com'
-                        }
-                    ]
-                }
-                meet_link_from_description = None
-            else:
-                # Crear nuevo espacio (comportamiento original)
-                event_data['conferenceData'] = {
-                    'createRequest': {
-                        'requestId': f"meet-{uuid.uuid4()}",
-                        'conferenceSolutionKey': {'type': 'hangoutsMeet'}
-                    }
-                }
-                meet_link_from_description = None
-            
-            # Agregar reminders por defecto si no están configurados
-            if 'reminders' not in event_data:
-                event_data['reminders'] = {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},  # 1 día antes
-                        {'method': 'popup', 'minutes': 30},  # 30 minutos antes
-                    ],
-                }
+            insert_params = self._build_insert_params(event_data, existing_meet_uri, use_description_only)
             
             logger.info(f"Creando evento en Google Calendar: {event_data.get('summary')}")
             
             # Crear evento
-            # Si use_description_only=True, NO incluir conferenceDataVersion
-            insert_params = {
-                'calendarId': self.config.calendar_id,
-                'body': event_data,
-                'sendUpdates': 'all'  # Enviar invitaciones por email
-            }
-            
-            # Solo incluir conferenceDataVersion si hay conferenceData
-            if 'conferenceData' in event_data:
-                insert_params['conferenceDataVersion'] = 1  # Necesario para Google Meet
-            
             event = self.service.events().insert(**insert_params).execute()
             
-            # Extraer datos relevantes
-            meet_link = event.get('hangoutLink', '')
-            if not meet_link:
-                # Intentar obtener de conferenceData.entryPoints
-                conference_data = event.get('conferenceData', {})
-                entry_points = conference_data.get('entryPoints', [])
-                if entry_points:
-                    # El primer entryPoint suele ser el de Meet
-                    meet_link = entry_points[0].get('uri', '')
-                # Si aún no hay, usar el meetingUri que pasamos (si existe)
-                if not meet_link and meet_link_from_description:
-                    meet_link = meet_link_from_description
-                    logger.info(f"Usando meetingUri proporcionado como meet_link: {meet_link}")
-                elif not meet_link and existing_meet_uri:
-                    meet_link = existing_meet_uri
-                    logger.info(f"Usando meetingUri proporcionado como meet_link: {meet_link}")
-            
-            result = {
-                'event_id': event['id'],
-                'meet_link': meet_link,
-                'html_link': event.get('htmlLink', ''),
-                'status': event.get('status', 'confirmed'),
-                'created': event.get('created', ''),
-                'updated': event.get('updated', '')
-            }
+            result = self._event_result(event, existing_meet_uri)
             
             logger.info(f"Evento creado exitosamente: {result['event_id']}")
             logger.info(f"Google Meet link: {result['meet_link']}")
@@ -370,6 +273,151 @@ class GoogleCalendarClient:
                 f"Error inesperado al crear reunión: {str(e)}"
             )
     
+    def _build_insert_params(self, event_data, existing_meet_uri=None, use_description_only=False):
+        """
+        Prepara los parámetros de events().insert (ver create_event).
+        
+        Agrega conferenceData y reminders a event_data según corresponda.
+        
+        Args:
+            event_data (dict): Datos del evento
+            existing_meet_uri (str, optional): URI de Meet existente
+            use_description_only (bool, optional): Si True, NO incluye conferenceData
+        
+        Returns:
+            dict: Parámetros para events().insert
+        """
+        # Si use_description_only=True, NO incluir conferenceData (el link está en la descripción)
+        if use_description_only:
+            logger.info("Creando evento sin conferenceData (link en descripción)")
+        elif existing_meet_uri:
+            # Usar espacio existente creado con Meet API (comportamiento anterior)
+            logger.info(f"Usando espacio existente: {existing_meet_uri}")
+            # Intentar asociar el meetingUri existente directamente
+            event_data['conferenceData'] = {
+                'meetingUri': existing_meet_uri,
+                'entryPoints': [
+                    {
+                        'entryPointType': 'video',
+                        'uri': existing_meet_uri,
+                        'label': 'meet.google.com'
+                    }
+                ]
+            }
+        else:
+            # Crear nuevo espacio (comportamiento original)
+            event_data['conferenceData'] = {
+                'createRequest': {
+                    'requestId': f"meet-{uuid.uuid4()}",
+                    'conferenceSolutionKey': {'type': 'hangoutsMeet'}
+                }
+            }
+        
+        # Agregar reminders por defecto si no están configurados
+        if 'reminders' not in event_data:
+            event_data['reminders'] = {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},  # 1 día antes
+                    {'method': 'popup', 'minutes': 30},  # 30 minutos antes
+                ],
+            }
+        
+        # Si use_description_only=True, NO incluir conferenceDataVersion
+        insert_params = {
+            'calendarId': self.config.calendar_id,
+            'body': event_data,
+            'sendUpdates': 'all'  # Enviar invitaciones por email
+        }
+        
+        # Solo incluir conferenceDataVersion si hay conferenceData
+        if 'conferenceData' in event_data:
+            insert_params['conferenceDataVersion'] = 1  # Necesario para Google Meet
+        
+        return insert_params
+    
+    def _event_result(self, event, existing_meet_uri=None):
+        """
+        Extrae los datos relevantes de un evento creado (ver create_event).
+        
+        Args:
+            event (dict): Evento devuelto por events().insert
+            existing_meet_uri (str, optional): URI de Meet a usar si el evento no trae link
+        
+        Returns:
+            dict: event_id, meet_link, html_link, status, created, updated
+        """
+        meet_link = event.get('hangoutLink', '')
+        if not meet_link:
+            # Intentar obtener de conferenceData.entryPoints
+            conference_data = event.get('conferenceData', {})
+            entry_points = conference_data.get('entryPoints', [])
+            if entry_points:
+                # El primer entryPoint suele ser el de Meet
+                meet_link = entry_points[0].get('uri', '')
+            # Si aún no hay, usar el meetingUri que pasamos (si existe)
+            if not meet_link and existing_meet_uri:
+                meet_link = existing_meet_uri
+                logger.info(f"Usando meetingUri proporcionado como meet_link: {meet_link}")
+        
+        return {
+            'event_id': event['id'],
+            'meet_link': meet_link,
+            'html_link': event.get('htmlLink', ''),
+            'status': event.get('status', 'confirmed'),
+            'created': event.get('created', ''),
+            'updated': event.get('updated', '')
+        }
+    
+    def create_events_bulk(self, events):
+        """
+        Crea varios eventos usando batch HTTP (hasta 50 por petición).
+        
+        Cada elemento se procesa como en create_event. Un evento que falla
+        se devuelve como None en lugar de lanzar excepción, para no perder
+        los que sí se crearon en el mismo batch.
+        
+        Args:
+            events (list): Argumentos de create_event por evento
+                [{'event_data': {...}, 'existing_meet_uri': ..., 'use_description_only': ...}, ...]
+        
+        Returns:
+            list: Resultado de cada evento (mismo formato que create_event) o None,
+                en el mismo orden que events
+        """
+        results = [None] * len(events)
+        insert_params = [
+            self._build_insert_params(
+                item['event_data'],
+                item.get('existing_meet_uri'),
+                item.get('use_description_only', False)
+            )
+            for item in events
+        ]
+        
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                logger.warning(f"No se pudo crear evento '{events[index]['event_data'].get('summary')}' en batch: {exception}")
+                return
+            results[index] = self._event_result(response, events[index].get('existing_meet_uri'))
+        
+        for i in range(0, len(events), CALENDAR_BATCH_MAX):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for index in range(i, min(i + CALENDAR_BATCH_MAX, len(events))):
+                batch.add(
+                    self.service.events().insert(**insert_params[index]),
+                    request_id=str(index)
+                )
+            try:
+                batch.execute()
+            except HttpError as error:
+                logger.warning(f"Error en batch de creación de eventos: {error}")
+        
+        created = sum(1 for result in results if result)
+        logger.info(f"Eventos creados en batch: {created}/{len(events)}")
+        return results
+    
     def get_event(self, event_id):
         """
         Obtiene los detalles de un evento existente.
@@ -400,6 +448,47 @@ class GoogleCalendarClient:
                 logger.error(f"Error al obtener evento: {error}")
                 raise GoogleCalendarError(f"Error al obtener evento: {error}")
     
+    def get_events_bulk(self, event_ids):
+        """
+        Obtiene varios eventos usando batch HTTP (hasta 50 por petición).
+        
+        Solo pide id y summary. Los eventos que no existen o fallan se
+        omiten del resultado en lugar de lanzar excepción.
+        
+        Args:
+            event_ids (list): IDs de eventos en Google Calendar
+        
+        Returns:
+            dict: {event_id: evento}
+        """
+        events = {}
+        
+        def callback(request_id, response, exception):
+            if exception is not None:
+                logger.debug(f"No se pudo obtener evento {request_id} en batch: {exception}")
+                return
+            events[request_id] = response
+        
+        unique_ids = list(dict.fromkeys(event_ids))
+        for i in range(0, len(unique_ids), CALENDAR_BATCH_MAX):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for event_id in unique_ids[i:i + CALENDAR_BATCH_MAX]:
+                batch.add(
+                    self.service.events().get(
+                        calendarId=self.config.calendar_id,
+                        eventId=event_id,
+                        fields='id,summary'
+                    ),
+                    request_id=event_id
+                )
+            try:
+                batch.execute()
+            except HttpError as error:
+                logger.warning(f"Error en batch de eventos: {error}")
+        
+        logger.info(f"Eventos obtenidos en batch: {len(events)}/{len(unique_ids)}")
+        return events
+    
     def update_event(self, event_id, updates):
         """
         Actualiza un evento existente.
@@ -497,13 +586,36 @@ def format_datetime_for_google(dt, timezone='America/Bogota'):
     if dt is None:
         return None
     
-    # Asegurar que sea string en formato ISO 8601
-    if isinstance(dt, datetime):
-        dt_str = dt.isoformat()
-    else:
-        dt_str = str(dt)
-    
     return {
-        'dateTime': dt_str,
+        'dateTime': _datetime_to_google_str(
+            dt, getattr(dt, 'tzinfo', None), getattr(dt, 'fold', 0)
+        ),
         'timeZone': timezone
     }
+
+
+@functools.lru_cache(maxsize=2048)
+def _datetime_to_google_str(dt, tzinfo, fold):
+    """
+    Convierte un datetime a string ISO 8601 (cacheado).
+    
+    Los horarios de las reuniones se repiten mucho (bloques por hora), así
+    que se cachea la conversión y no el dict de format_datetime_for_google,
+    que el llamador puede modificar.
+    
+    Args:
+        dt (datetime|str): Valor a convertir (debe ser hashable)
+        tzinfo: Zona de dt; forma parte de la clave porque dos datetimes
+            del mismo instante en zonas distintas son iguales pero se
+            formatean distinto
+        fold: Fold de dt; forma parte de la clave porque en la hora repetida
+            de un cambio de horario los dos datetimes son iguales (misma
+            zona) pero tienen offsets distintos
+    
+    Returns:
+        str: Fecha en formato ISO 8601
+    """
+    # Asegurar que sea string en formato ISO 8601
+    if isinstance(dt, datetime):
+        return dt.isoformat()
+    return str(dt)
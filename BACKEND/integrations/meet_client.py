@@ -5,22 +5,140 @@ Maneja:
 - Configuración de grabación automática
 - Obtención de información de espacios de reunión
 - Gestión de configuraciones de reunión
+
+Requiere google-api-python-client>=2.0 (documentos de discovery estáticos).
 """
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from cachetools import TTLCache
+from django.conf import settings
+import asyncio
+import concurrent.futures
+import functools
+import inspect
 import logging
-from typing import Dict, Optional, Any
+import re
+import threading
+from typing import Dict, Iterator, Optional, Any
 
 from core.exceptions import (
     GoogleAuthenticationError,
     GoogleMeetError,
 )
-from .config import GoogleConfig
+from .config import GoogleConfig, process_singleton, service_account_credentials
 
 logger = logging.getLogger(__name__)
 
+# Pool acotado para ejecutar las llamadas bloqueantes desde contextos async;
+# cada hilo reutiliza su propia conexión HTTP (ver transport.thread_http)
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix='meet'
+)
+
+# Enlace de Meet: https://meet.google.com/{meeting_code}[/|?...]
+_MEET_RE = re.compile(r'^https?://meet\.google\.com/([a-z0-9-]+)')
+
+# Caché de respuestas de get_space: la metadata de un espacio cambia poco
+# durante la vida de una reunión. TTL configurable vía settings/env.
+_SPACE_CACHE = TTLCache(maxsize=1024, ttl=settings.GOOGLE_MEET_SPACE_CACHE_TTL)
+_SPACE_CACHE_LOCK = threading.Lock()
+
+# Máximo de altas de miembros por batch HTTP (límite de Google APIs)
+MEET_BATCH_MAX = 100
+
+
+class _MemoryDiscoveryCache:
+    """
+    Caché de documentos de discovery en memoria del proceso.
+    
+    Implementa la interfaz get/set de googleapiclient.discovery_cache. Se usa
+    para v2beta, que no trae documento estático y se descarga por red.
+    """
+    
+    def __init__(self):
+        self._docs = {}
+    
+    def get(self, url):
+        return self._docs.get(url)
+    
+    def set(self, url, content):
+        self._docs[url] = content
+
+
+_DISCOVERY_CACHE = _MemoryDiscoveryCache()
+
+
+def _invalidate_space(space_name: str) -> None:
+    """Elimina un espacio de la caché de get_space."""
+    with _SPACE_CACHE_LOCK:
+        _SPACE_CACHE.pop(space_name, None)
+
+
+_RAISE = object()
+
+_V2BETA_UNAVAILABLE = (
+    "Servicio v2beta no está disponible. La API de gestión de miembros requiere v2beta."
+)
+
+
+def _wrap_meet_errors(action: str, not_found: Any = _RAISE):
+    """
+    Traduce errores de la API a GoogleMeetError en un único punto.
+    
+    Args:
+        action: Descripción de la operación para logs/mensajes ('crear espacio')
+        not_found: Valor a retornar ante un 404; si se omite, el 404 se propaga
+    """
+    def decorator(func):
+        def translate(error):
+            from googleapiclient.errors import HttpError
+            if isinstance(error, HttpError):
+                status = error.resp.status
+                logger.error(
+                    "Error al %s: HTTP %s %s (detalles: %s)", action, status, error.reason,
+                    getattr(error, 'error_details', None),
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
+                return GoogleMeetError(f"Error al {action}: HTTP {status} {error.reason}")
+            logger.error("Error inesperado al %s: %s", action, error)
+            return GoogleMeetError(f"Error inesperado al {action}: {str(error)}")
+        
+        def is_not_found(error):
+            from googleapiclient.errors import HttpError
+            return (
+                isinstance(error, HttpError)
+                and error.resp.status == 404
+                and not_found is not _RAISE
+            )
+        
+        if inspect.isgeneratorfunction(func):
+            # Los generadores ejecutan su cuerpo al iterar, no al llamarse
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except GoogleMeetError:
+                    raise
+                except Exception as error:
+                    if is_not_found(error):
+                        logger.warning("Recurso no encontrado al %s", action)
+                        return
+                    raise translate(error) from error
+            return gen_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except GoogleMeetError:
+                raise
+            except Exception as error:
+                if is_not_found(error):
+                    logger.warning("Recurso no encontrado al %s", action)
+                    return not_found
+                raise translate(error) from error
+        return wrapper
+    return decorator
+
 
 class GoogleMeetClient:
     """
@@ -38,6 +156,10 @@ class GoogleMeetClient:
         
         Carga credenciales y construye el servicio de Meet API.
         
+        Nota: la construcción es costosa (lectura del archivo de credenciales,
+        parseo JSON y dos llamadas a build() con descarga de discovery).
+        Preferir get_meet_client() para reutilizar una instancia por proceso.
+        
         Raises:
             GoogleAuthenticationError: Si falla la autenticación
         """
@@ -45,9 +167,15 @@ class GoogleMeetClient:
             self.config = GoogleConfig()
             self.credentials = self._load_credentials()
             self.service, self.service_v2beta = self._build_service()
+            # Resources cacheados: spaces() construye un Resource nuevo en cada llamada
+            self._spaces = self.service.spaces()
+            # Disponibilidad de v2beta resuelta una sola vez: None si no hay API de miembros
+            self._members_api = (
+                self.service_v2beta.spaces().members() if self.service_v2beta else None
+            )
             logger.info("Google Meet Client inicializado correctamente")
         except Exception as e:
-            logger.error(f"Error al inicializar Google Meet Client: {e}")
+            logger.error("Error al inicializar Google Meet Client: %s", e)
             raise GoogleAuthenticationError(
                 f"Error al inicializar Google Meet Client: {str(e)}"
             )
@@ -56,8 +184,9 @@ class GoogleMeetClient:
         """
         Carga las credenciales del Service Account.
         
-        Usa from_service_account_info en lugar de from_service_account_file
-        para evitar problemas de deadlock en macOS con Docker.
+        Las credenciales se comparten entre todos los clientes del proceso con
+        el mismo archivo, subject y scopes (ver config.service_account_credentials),
+        de modo que también comparten el access token ya obtenido.
         
         Returns:
             service_account.Credentials: Credenciales con delegation si está configurado
@@ -66,45 +195,38 @@ class GoogleMeetClient:
             GoogleAuthenticationError: Si falla la carga de credenciales
         """
         try:
-            # Leer el archivo en memoria primero para evitar deadlock en macOS/Docker
-            import json
-            import time
-            
-            # Intentar leer con retry para manejar problemas temporales
-            max_retries = 3
-            retry_delay = 0.1
-            
-            for attempt in range(max_retries):
-                try:
-                    with open(self.config.service_account_file, 'r') as f:
-                        creds_info = json.load(f)
-                    break
-                except OSError as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Intento {attempt + 1} falló al leer credenciales, reintentando...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        raise
-            
-            # Usar from_service_account_info en lugar de from_service_account_file
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_info,
-                scopes=self.config.all_scopes
+            credentials = service_account_credentials(
+                self.config.service_account_file,
+                self.config.admin_email,
+                tuple(self.config.all_scopes)
             )
-            
-            # Si hay admin_email configurado, usar Domain-Wide Delegation
             if self.config.admin_email:
-                credentials = credentials.with_subject(self.config.admin_email)
-                logger.info(f"Usando Domain-Wide Delegation con: {self.config.admin_email}")
-            
+                logger.info("Usando Domain-Wide Delegation con: %s", self.config.admin_email)
             return credentials
         except Exception as e:
-            logger.error(f"Error al cargar credenciales de Google Meet: {e}")
+            logger.error("Error al cargar credenciales de Google Meet: %s", e)
             raise GoogleAuthenticationError(
                 f"Error al cargar credenciales: {str(e)}"
             )
     
+    async def _load_credentials_async(self):
+        """
+        Versión asíncrona de _load_credentials.
+        
+        Ejecuta la lectura del archivo en el pool de hilos del módulo para
+        no bloquear el event loop.
+        """
+        return await self._run_async(self._load_credentials)
+    
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Ejecuta una llamada bloqueante en _EXECUTOR y espera su resultado.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _EXECUTOR, functools.partial(func, *args, **kwargs)
+        )
+    
     def _build_service(self):
         """
         Construye los servicios de Google Meet API.
@@ -117,32 +239,62 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si falla la construcción del servicio
         """
+        from googleapiclient.discovery import build
+        from .transport import build_request, thread_http
+        
+        # Cada petición se ejecuta sobre el transporte HTTP del hilo que la lanza
+        request_builder = functools.partial(build_request, self.credentials)
+        
         try:
-            service_v2 = build('meet', 'v2', credentials=self.credentials)
+            # v2 usa el documento de discovery estático incluido en la librería:
+            # sin E/S de red ni de disco al construir el servicio
+            service_v2 = build(
+                'meet', 'v2',
+                http=thread_http(self.credentials),
+                requestBuilder=request_builder,
+                cache_discovery=False,
+                static_discovery=True
+            )
             logger.info("Servicio de Google Meet API v2 construido correctamente")
             
-            # Intentar construir v2beta, pero no fallar si no está disponible
+            # Intentar construir v2beta, pero no fallar si no está disponible.
+            # No hay documento estático para v2beta: se descarga una vez y se
+            # guarda en _DISCOVERY_CACHE para el resto del proceso.
             service_v2beta = None
             try:
-                service_v2beta = build('meet', 'v2beta', credentials=self.credentials, discoveryServiceUrl='https://meet.googleapis.com/$discovery/rest?version=v2beta')
+                service_v2beta = build(
+                    'meet', 'v2beta',
+                    http=thread_http(self.credentials),
+                    requestBuilder=request_builder,
+                    discoveryServiceUrl='https://meet.googleapis.com/$discovery/rest?version=v2beta',
+                    cache=_DISCOVERY_CACHE,
+                    static_discovery=False
+                )
                 logger.info("Servicio de Google Meet API v2beta construido correctamente")
             except Exception as v2beta_error:
-                logger.warning(f"No se pudo construir servicio v2beta: {v2beta_error}")
+                logger.warning("No se pudo construir servicio v2beta: %s", v2beta_error)
                 logger.warning("Los métodos de gestión de miembros pueden no estar disponibles")
                 # Intentar construir sin discoveryServiceUrl
                 try:
-                    service_v2beta = build('meet', 'v2beta', credentials=self.credentials)
+                    service_v2beta = build(
+                        'meet', 'v2beta',
+                        http=thread_http(self.credentials),
+                        requestBuilder=request_builder,
+                        cache=_DISCOVERY_CACHE,
+                        static_discovery=False
+                    )
                     logger.info("Servicio v2beta construido con método alternativo")
                 except Exception as e2:
-                    logger.warning(f"Método alternativo también falló: {e2}")
+                    logger.warning("Método alternativo también falló: %s", e2)
             
             return service_v2, service_v2beta
         except Exception as e:
-            logger.error(f"Error al construir servicio de Google Meet: {e}")
+            logger.error("Error al construir servicio de Google Meet: %s", e)
             raise GoogleMeetError(
                 f"Error al construir servicio de Google Meet: {str(e)}"
             )
     
+    @_wrap_meet_errors('crear espacio')
     def create_space(self, auto_recording: bool = True, public_access: bool = False) -> Dict[str, Any]:
         """
         Crea un espacio de reunión directamente usando Meet API.
@@ -159,62 +311,53 @@ class GoogleMeetClient:
                 - meetingUri: URI de la reunión (https://meet.google.com/{meeting_code})
                 - config: Configuración del espacio
         """
-        try:
-            logger.info("Creando espacio de reunión directamente con Meet API")
-            
-            # Configuración del espacio
-            space_config = {}
-            config_dict = {}
-            
-            # Configurar grabación automática
-            if auto_recording:
-                config_dict['artifactConfig'] = {
-                    'recordingConfig': {
-                        'autoRecordingGeneration': 'ON'  # 'ON' para habilitar, 'OFF' para deshabilitar
-                    }
+        logger.info("Creando espacio de reunión directamente con Meet API")
+        
+        # Configuración del espacio
+        space_config = {}
+        config_dict = {}
+        
+        # Configurar grabación automática
+        if auto_recording:
+            config_dict['artifactConfig'] = {
+                'recordingConfig': {
+                    'autoRecordingGeneration': 'ON'  # 'ON' para habilitar, 'OFF' para deshabilitar
                 }
-                logger.info("Grabación automática habilitada en configuración inicial")
-            
-            # Configurar acceso público
-            if public_access:
-                config_dict['accessType'] = 'OPEN'
-                logger.info("Acceso público habilitado (OPEN) - Cualquiera puede unirse sin solicitar permiso")
-            else:
-                # Por defecto, usar 'TRUSTED' (comportamiento estándar)
-                config_dict['accessType'] = 'TRUSTED'
-                logger.info("Acceso configurado como TRUSTED (comportamiento estándar)")
-            
-            # Construir configuración completa
-            if config_dict:
-                space_config['config'] = config_dict
-            
-            # Crear el espacio
-            space = self.service.spaces().create(body=space_config).execute()
-            
-            space_name = space.get('name', 'N/A')
-            meeting_uri = space.get('meetingUri', '')
-            
-            logger.info(f"Espacio creado exitosamente: {space_name}")
-            logger.info(f"Meeting URI: {meeting_uri}")
-            
-            return space
-            
-        except HttpError as error:
-            logger.error(f"Error al crear espacio: {error}")
-            error_details = error.error_details if hasattr(error, 'error_details') else []
-            raise GoogleMeetError(
-                f"Error al crear espacio: {str(error)}"
-            )
-        except Exception as e:
-            logger.error(f"Error inesperado al crear espacio: {e}")
-            raise GoogleMeetError(
-                f"Error inesperado al crear espacio: {str(e)}"
-            )
+            }
+            logger.info("Grabación automática habilitada en configuración inicial")
+        
+        # Configurar acceso público
+        if public_access:
+            config_dict['accessType'] = 'OPEN'
+            logger.info("Acceso público habilitado (OPEN) - Cualquiera puede unirse sin solicitar permiso")
+        else:
+            # Por defecto, usar 'TRUSTED' (comportamiento estándar)
+            config_dict['accessType'] = 'TRUSTED'
+            logger.info("Acceso configurado como TRUSTED (comportamiento estándar)")
+        
+        # Construir configuración completa
+        if config_dict:
+            space_config['config'] = config_dict
+        
+        # Crear el espacio
+        space = self._spaces.create(body=space_config).execute()
+        
+        space_name = space.get('name', 'N/A')
+        meeting_uri = space.get('meetingUri', '')
+        
+        logger.info("Espacio creado exitosamente: %s", space_name)
+        logger.debug("Meeting URI: %s", meeting_uri)
+        
+        return space
     
+    @_wrap_meet_errors('obtener espacio', not_found=None)
     def get_space(self, space_name: str) -> Optional[Dict[str, Any]]:
         """
         Obtiene información de un espacio de reunión.
         
+        Las respuestas se guardan en una caché TTL compartida por el proceso;
+        update_space_config y delete_space_member la invalidan.
+        
         Args:
             space_name: Nombre del espacio (formato: spaces/{meeting_code})
         
@@ -224,25 +367,20 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al obtener el espacio
         """
-        try:
-            logger.info(f"Obteniendo información del espacio: {space_name}")
-            space = self.service.spaces().get(name=space_name).execute()
-            logger.info(f"Espacio obtenido: {space.get('name')}")
-            return space
-        except HttpError as error:
-            if error.resp.status == 404:
-                logger.warning(f"Espacio no encontrado: {space_name}")
-                return None
-            logger.error(f"Error al obtener espacio: {error}")
-            raise GoogleMeetError(
-                f"Error al obtener espacio: {str(error)}"
-            )
-        except Exception as e:
-            logger.error(f"Error inesperado al obtener espacio: {e}")
-            raise GoogleMeetError(
-                f"Error inesperado: {str(e)}"
-            )
+        with _SPACE_CACHE_LOCK:
+            cached = _SPACE_CACHE.get(space_name)
+        if cached is not None:
+            logger.debug("Espacio obtenido desde caché: %s", space_name)
+            return cached
+        
+        logger.info("Obteniendo información del espacio: %s", space_name)
+        space = self._spaces.get(name=space_name).execute()
+        logger.info("Espacio obtenido: %s", space.get('name'))
+        with _SPACE_CACHE_LOCK:
+            _SPACE_CACHE[space_name] = space
+        return space
     
+    @_wrap_meet_errors('actualizar espacio')
     def update_space_config(self, space_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Actualiza la configuración de un espacio de reunión.
@@ -257,30 +395,19 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al actualizar
         """
-        try:
-            logger.info(f"Actualizando configuración del espacio: {space_name}")
-            # Construir updateMask correctamente para campos anidados
-            # Para config.artifactConfig.recordingConfig.autoRecordingGeneration
-            update_mask = 'config.artifactConfig.recordingConfig.autoRecordingGeneration'
-            
-            space = self.service.spaces().patch(
-                name=space_name,
-                body=config,
-                updateMask=update_mask
-            ).execute()
-            logger.info(f"Configuración actualizada: {space.get('name')}")
-            return space
-        except HttpError as error:
-            logger.error(f"Error al actualizar espacio: {error}")
-            error_details = error.error_details if hasattr(error, 'error_details') else []
-            raise GoogleMeetError(
-                f"Error al actualizar espacio: {str(error)}"
-            )
-        except Exception as e:
-            logger.error(f"Error inesperado al actualizar espacio: {e}")
-            raise GoogleMeetError(
-                f"Error inesperado: {str(e)}"
-            )
+        logger.info("Actualizando configuración del espacio: %s", space_name)
+        # Construir updateMask correctamente para campos anidados
+        # Para config.artifactConfig.recordingConfig.autoRecordingGeneration
+        update_mask = 'config.artifactConfig.recordingConfig.autoRecordingGeneration'
+        
+        space = self._spaces.patch(
+            name=space_name,
+            body=config,
+            updateMask=update_mask
+        ).execute()
+        _invalidate_space(space_name)
+        logger.info("Configuración actualizada: %s", space.get('name'))
+        return space
     
     def enable_auto_recording(self, space_name: str) -> Dict[str, Any]:
         """
@@ -295,47 +422,29 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al habilitar grabación
         """
-        try:
-            logger.info(f"Habilitando grabación automática en: {space_name}")
-            
-            # Primero obtener el espacio actual para preservar la configuración existente
-            current_space = self.get_space(space_name)
-            if not current_space:
-                raise GoogleMeetError(f"Espacio no encontrado: {space_name}")
-            
-            current_config = current_space.get('config', {})
-            
-            # Configuración para habilitar grabación automática
-            # Según documentación oficial: https://developers.google.com/workspace/meet/api/guides/meeting-spaces-configuration#auto-artifacts
-            # La estructura correcta es: config.artifactConfig.recordingConfig.autoRecordingGeneration
-            # Valores válidos: 'ON' para habilitar, 'OFF' para deshabilitar
-            config = {
-                'config': {
-                    'artifactConfig': {
-                        'recordingConfig': {
-                            'autoRecordingGeneration': 'ON'  # 'ON' para habilitar, 'OFF' para deshabilitar
-                        }
+        logger.info("Habilitando grabación automática en: %s", space_name)
+        
+        # No es necesario leer el espacio antes: el updateMask de
+        # update_space_config apunta solo a autoRecordingGeneration, así que
+        # el resto de artifactConfig no se modifica en el servidor.
+        
+        # Configuración para habilitar grabación automática
+        # Según documentación oficial: https://developers.google.com/workspace/meet/api/guides/meeting-spaces-configuration#auto-artifacts
+        # La estructura correcta es: config.artifactConfig.recordingConfig.autoRecordingGeneration
+        # Valores válidos: 'ON' para habilitar, 'OFF' para deshabilitar
+        config = {
+            'config': {
+                'artifactConfig': {
+                    'recordingConfig': {
+                        'autoRecordingGeneration': 'ON'  # 'ON' para habilitar, 'OFF' para deshabilitar
                     }
                 }
             }
-            
-            # Preservar configuración existente si existe artifactConfig
-            if 'artifactConfig' in current_config:
-                artifact_config = current_config['artifactConfig'].copy()
-                artifact_config['recordingConfig'] = config['config']['artifactConfig']['recordingConfig']
-                config['config']['artifactConfig'] = artifact_config
-            else:
-                # Si no existe artifactConfig, usar solo recordingConfig
-                pass
-            
-            space = self.update_space_config(space_name, config)
-            logger.info(f"Grabación automática habilitada en: {space_name}")
-            return space
-        except Exception as e:
-            logger.error(f"Error al habilitar grabación automática: {e}")
-            raise GoogleMeetError(
-                f"Error al habilitar grabación automática: {str(e)}"
-            )
+        }
+        
+        space = self.update_space_config(space_name, config)
+        logger.info("Grabación automática habilitada en: %s", space_name)
+        return space
     
     def get_conference_id_from_meet_link(self, meet_link: str) -> Optional[str]:
         """
@@ -347,19 +456,12 @@ class GoogleMeetClient:
         Returns:
             str: Conference ID o None si no se puede extraer
         """
-        try:
-            # Formato: https://meet.google.com/abc-defg-hij
-            # O: https://meet.google.com/oxr-hgyk-stu
-            parts = meet_link.split('/')
-            if len(parts) >= 4 and parts[2] == 'meet.google.com':
-                meeting_code = parts[3]
-                # Convertir a formato de espacio: spaces/{meeting_code}
-                space_name = f"spaces/{meeting_code}"
-                return space_name
-            return None
-        except Exception as e:
-            logger.warning(f"Error al extraer conference ID de {meet_link}: {e}")
+        if not meet_link:
             return None
+        # Formato: https://meet.google.com/abc-defg-hij (admite query string o / final)
+        match = _MEET_RE.match(meet_link)
+        # Convertir a formato de espacio: spaces/{meeting_code}
+        return f"spaces/{match.group(1)}" if match else None
     
     def configure_recording_for_meet_link(self, meet_link: str) -> Dict[str, Any]:
         """
@@ -374,21 +476,16 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al configurar
         """
-        try:
-            space_name = self.get_conference_id_from_meet_link(meet_link)
-            if not space_name:
-                raise GoogleMeetError(
-                    f"No se pudo extraer el conference ID del enlace: {meet_link}"
-                )
-            
-            logger.info(f"Configurando grabación para: {space_name}")
-            return self.enable_auto_recording(space_name)
-        except Exception as e:
-            logger.error(f"Error al configurar grabación: {e}")
+        space_name = self.get_conference_id_from_meet_link(meet_link)
+        if not space_name:
             raise GoogleMeetError(
-                f"Error al configurar grabación: {str(e)}"
+                f"No se pudo extraer el conference ID del enlace: {meet_link}"
             )
+        
+        logger.info("Configurando grabación para: %s", space_name)
+        return self.enable_auto_recording(space_name)
     
+    @_wrap_meet_errors('agregar miembro')
     def add_space_member(self, space_name: str, email: str, role: str = 'ATTENDEE') -> Dict[str, Any]:
         """
         Agrega un miembro al espacio de reunión.
@@ -406,45 +503,37 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al agregar miembro o si v2beta no está disponible
         """
-        if not self.service_v2beta:
-            raise GoogleMeetError(
-                "Servicio v2beta no está disponible. La API de gestión de miembros requiere v2beta."
-            )
-        
-        try:
-            logger.info(f"Agregando miembro {email} al espacio {space_name} con rol {role}")
-            
-            member_body = {
-                'user': {
-                    'email': email
-                },
-                'role': role
-            }
-            
-            # Usar endpoint v2beta para miembros
-            member = self.service_v2beta.spaces().members().create(
-                parent=space_name,
-                body=member_body
-            ).execute()
-            
-            logger.info(f"Miembro agregado exitosamente: {member.get('name')}")
-            return member
-            
-        except HttpError as error:
-            logger.error(f"Error al agregar miembro: {error}")
-            raise GoogleMeetError(
-                f"Error al agregar miembro: {str(error)}"
-            )
-        except Exception as e:
-            logger.error(f"Error inesperado al agregar miembro: {e}")
-            raise GoogleMeetError(
-                f"Error inesperado al agregar miembro: {str(e)}"
-            )
+        members_api = self._members_api
+        if members_api is None:
+            raise GoogleMeetError(_V2BETA_UNAVAILABLE)
+        
+        logger.info("Agregando miembro %s al espacio %s con rol %s", email, space_name, role)
+        
+        member_body = {
+            'user': {
+                'email': email
+            },
+            'role': role
+        }
+        
+        # Usar endpoint v2beta para miembros
+        member = members_api.create(
+            parent=space_name,
+            body=member_body
+        ).execute()
+        
+        logger.info("Miembro agregado exitosamente: %s", member.get('name'))
+        return member
     
     def add_space_members(self, space_name: str, emails: list, role: str = 'ATTENDEE') -> list:
         """
         Agrega múltiples miembros al espacio de reunión.
         
+        Envía las altas en peticiones batch (multipart/mixed) de hasta
+        MEET_BATCH_MAX miembros en lugar de un round trip HTTP por email. Los
+        errores se manejan por miembro y por batch: un fallo individual no
+        afecta a los demás.
+        
         Args:
             space_name: Nombre del espacio
             emails: Lista de emails a agregar
@@ -453,15 +542,174 @@ class GoogleMeetClient:
         Returns:
             list: Lista de miembros agregados exitosamente
         """
+        from googleapiclient.errors import HttpError
+        from .transport import TRANSPORT_ERRORS
+        
+        members_api = self._members_api
+        if members_api is None:
+            logger.warning(
+                "Servicio v2beta no está disponible. No se pueden agregar miembros."
+            )
+            return []
+        
         members = []
-        for email in emails:
+        
+        def _on_member_created(request_id, response, exception):
+            if exception is not None:
+                logger.warning("No se pudo agregar miembro %s: %s", request_id, exception)
+            elif response:
+                members.append(response)
+        
+        # request_id debe ser único dentro del batch: eliminar duplicados manteniendo orden
+        unique_emails = list(dict.fromkeys(emails))
+        logger.info(
+            "Agregando %s miembros al espacio %s en batch", len(unique_emails), space_name
+        )
+        for i in range(0, len(unique_emails), MEET_BATCH_MAX):
+            chunk = unique_emails[i:i + MEET_BATCH_MAX]
             try:
-                member = self.add_space_member(space_name, email, role)
-                members.append(member)
-            except Exception as e:
-                logger.warning(f"No se pudo agregar miembro {email}: {e}")
+                batch = self.service_v2beta.new_batch_http_request(callback=_on_member_created)
+                for email in chunk:
+                    batch.add(
+                        members_api.create(
+                            parent=space_name,
+                            body={'user': {'email': email}, 'role': role}
+                        ),
+                        request_id=email
+                    )
+                batch.execute()
+            except (HttpError,) + TRANSPORT_ERRORS as e:
+                logger.warning(
+                    "Error al ejecutar batch de %s miembros: %s", len(chunk), e
+                )
+        
+        return members
+    
+    def create_configured_space(self, emails: list, role: str = 'ATTENDEE',
+                                auto_recording: bool = True,
+                                public_access: bool = False) -> Dict[str, Any]:
+        """
+        Crea un espacio ya configurado y agrega sus miembros en batch.
+        
+        La grabación y el tipo de acceso viajan en el create del espacio (sin
+        PATCH posterior) y los miembros se agregan con add_space_members, un
+        round trip por cada MEET_BATCH_MAX emails.
+        
+        Args:
+            emails: Lista de emails a agregar como miembros
+            role: Rol para todos los miembros
+            auto_recording: Si True, crea el espacio con grabación automática
+            public_access: Si True, crea el espacio con acceso OPEN
+        
+        Returns:
+            dict: {
+                'space': dict,    # Espacio creado
+                'members': list   # Miembros agregados exitosamente
+            }
+        
+        Raises:
+            GoogleMeetError: Si hay error al crear el espacio
+        """
+        space = self.create_space(
+            auto_recording=auto_recording,
+            public_access=public_access
+        )
+        members = []
+        if emails:
+            members = self.add_space_members(space['name'], emails, role)
+        return {'space': space, 'members': members}
+    
+    async def create_space_async(self, auto_recording: bool = True,
+                                 public_access: bool = False) -> Dict[str, Any]:
+        """
+        Versión asíncrona de create_space (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(
+            self.create_space,
+            auto_recording=auto_recording,
+            public_access=public_access
+        )
+    
+    async def get_space_async(self, space_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Versión asíncrona de get_space (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(self.get_space, space_name)
+    
+    async def enable_auto_recording_async(self, space_name: str) -> Dict[str, Any]:
+        """
+        Versión asíncrona de enable_auto_recording (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(self.enable_auto_recording, space_name)
+    
+    async def list_space_members_async(self, space_name: str) -> list:
+        """
+        Versión asíncrona de list_space_members (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(self.list_space_members, space_name)
+    
+    async def add_space_members_async(self, space_name: str, emails: list,
+                                      role: str = 'ATTENDEE') -> list:
+        """
+        Versión asíncrona de add_space_members para contextos async.
+        
+        Cada alta se ejecuta en el pool de hilos del módulo y todas se lanzan
+        concurrentemente con asyncio.gather, sin bloquear el event loop.
+        
+        Args:
+            space_name: Nombre del espacio
+            emails: Lista de emails a agregar
+            role: Rol para todos los miembros
+        
+        Returns:
+            list: Lista de miembros agregados exitosamente
+        """
+        unique_emails = list(dict.fromkeys(emails))
+        results = await asyncio.gather(
+            *(
+                self._run_async(self.add_space_member, space_name, email, role)
+                for email in unique_emails
+            ),
+            return_exceptions=True
+        )
+        
+        members = []
+        for email, result in zip(unique_emails, results):
+            if isinstance(result, Exception):
+                logger.warning("No se pudo agregar miembro %s: %s", email, result)
+            else:
+                members.append(result)
         return members
     
+    @_wrap_meet_errors('listar miembros')
+    def iter_space_members(self, space_name: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Itera los miembros del espacio recorriendo todas las páginas.
+        
+        Los miembros se entregan a medida que llega cada página, por lo que
+        el llamador puede cortar la iteración sin pedir el resto.
+        
+        Args:
+            space_name: Nombre del espacio
+            page_size: Miembros por página solicitados a la API
+        
+        Yields:
+            dict: Miembro del espacio
+        
+        Raises:
+            GoogleMeetError: Si hay error al listar miembros o si v2beta no está disponible
+        """
+        members_api = self._members_api
+        if members_api is None:
+            raise GoogleMeetError(_V2BETA_UNAVAILABLE)
+        
+        logger.info("Listando miembros del espacio: %s", space_name)
+        request = members_api.list(parent=space_name, pageSize=page_size)
+        while request is not None:
+            response = request.execute()
+            yield from response.get('members', [])
+            request = members_api.list_next(request, response)
+    
     def list_space_members(self, space_name: str) -> list:
         """
         Lista todos los miembros del espacio.
@@ -475,30 +723,11 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al listar miembros o si v2beta no está disponible
         """
-        if not self.service_v2beta:
-            raise GoogleMeetError(
-                "Servicio v2beta no está disponible. La API de gestión de miembros requiere v2beta."
-            )
-        
-        try:
-            logger.info(f"Listando miembros del espacio: {space_name}")
-            response = self.service_v2beta.spaces().members().list(
-                parent=space_name
-            ).execute()
-            members = response.get('members', [])
-            logger.info(f"Encontrados {len(members)} miembros")
-            return members
-        except HttpError as error:
-            logger.error(f"Error al listar miembros: {error}")
-            raise GoogleMeetError(
-                f"Error al listar miembros: {str(error)}"
-            )
-        except Exception as e:
-            logger.error(f"Error inesperado al listar miembros: {e}")
-            raise GoogleMeetError(
-                f"Error inesperado al listar miembros: {str(e)}"
-            )
+        members = list(self.iter_space_members(space_name))
+        logger.info("Encontrados %s miembros", len(members))
+        return members
     
+    @_wrap_meet_errors('eliminar miembro', not_found=False)
     def delete_space_member(self, member_name: str) -> bool:
         """
         Elimina un miembro del espacio.
@@ -512,29 +741,16 @@ class GoogleMeetClient:
         Raises:
             GoogleMeetError: Si hay error al eliminar miembro o si v2beta no está disponible
         """
-        if not self.service_v2beta:
-            raise GoogleMeetError(
-                "Servicio v2beta no está disponible. La API de gestión de miembros requiere v2beta."
-            )
-        
-        try:
-            logger.info(f"Eliminando miembro: {member_name}")
-            self.service_v2beta.spaces().members().delete(name=member_name).execute()
-            logger.info("Miembro eliminado exitosamente")
-            return True
-        except HttpError as error:
-            if error.resp.status == 404:
-                logger.warning(f"Miembro no encontrado: {member_name}")
-                return False
-            logger.error(f"Error al eliminar miembro: {error}")
-            raise GoogleMeetError(
-                f"Error al eliminar miembro: {str(error)}"
-            )
-        except Exception as e:
-            logger.error(f"Error inesperado al eliminar miembro: {e}")
-            raise GoogleMeetError(
-                f"Error inesperado al eliminar miembro: {str(e)}"
-            )
+        members_api = self._members_api
+        if members_api is None:
+            raise GoogleMeetError(_V2BETA_UNAVAILABLE)
+        
+        logger.info("Eliminando miembro: %s", member_name)
+        members_api.delete(name=member_name).execute()
+        # member_name: spaces/{space}/members/{member}
+        _invalidate_space(member_name.split('/members/')[0])
+        logger.info("Miembro eliminado exitosamente")
+        return True
     
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -558,8 +774,25 @@ class GoogleMeetClient:
             logger.info("Conexión con Google Meet API exitosa")
             return result
         except Exception as e:
-            logger.error(f"Error al probar conexión: {e}")
+            logger.error("Error al probar conexión: %s", e)
             raise GoogleMeetError(
                 f"Error al probar conexión: {str(e)}"
             )
 
+
+@process_singleton
+def get_meet_client() -> GoogleMeetClient:
+    """
+    Retorna la instancia compartida de GoogleMeetClient del proceso.
+    
+    La instancia se construye de forma perezosa en la primera llamada.
+    Las credenciales y los servicios construidos son seguros para lectura
+    entre hilos y están pensados para ser de larga duración.
+    
+    Returns:
+        GoogleMeetClient: Cliente compartido
+    
+    Raises:
+        GoogleAuthenticationError: Si falla la inicialización del cliente
+    """
+    return GoogleMeetClient()
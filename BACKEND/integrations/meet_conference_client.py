@@ -6,22 +6,208 @@ https://developers.google.com/workspace/meet/api/guides/artifacts
 
 Permite obtener información sobre grabaciones usando el recurso
 conferenceRecords en lugar de solo buscar en Drive.
+
+Transporte: googleapiclient sobre httplib2 (HTTP/1.1), con una conexión
+keep-alive por hilo compartida entre instancias. Las llamadas concurrentes
+se reparten entre hilos y las lecturas masivas usan batch (una sola
+petición HTTP para hasta 100 grabaciones). No se usa el cliente gRPC
+(google-apps-meet): las respuestas ya se piden con máscara de campos y el
+coste dominante es la latencia de red, no el parseo.
 """
 
-from google.oauth2 import service_account
+from cachetools import TTLCache
+from django.conf import settings
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import asyncio
+import concurrent.futures
+import functools
+import itertools
 import logging
-from typing import Dict, Optional, Any, List
+import random
+import re
+import threading
+import time
+from typing import Dict, Iterator, Optional, Any, List, Tuple
 
 from core.exceptions import (
     GoogleAuthenticationError,
     GoogleMeetError,
 )
-from .config import GoogleConfig
+from .config import GoogleConfig, service_account_credentials
+from .transport import FastJsonModel, build_request, thread_http
 
 logger = logging.getLogger(__name__)
 
+# Código de reunión de Meet (abc-mnop-xyz), a diferencia del id de un espacio
+_MEETING_CODE_RE = re.compile(r'^[a-z]{3}-[a-z]{4}-[a-z]{3}$')
+
+# Estado de una grabación cuyo archivo ya está disponible en Drive
+STATE_READY = 'FILE_GENERATED'
+
+# TTLs (segundos) de las cachés de lookups
+RECORD_CACHE_TTL = 300
+RECORDING_CACHE_TTL = 600
+# Una grabación en FILE_GENERATED ya no cambia: se conserva por horas
+READY_RECORDING_CACHE_TTL = 6 * 3600
+# Caché negativa de 404 (records aún en aprovisionamiento tras la reunión)
+MISSING_CACHE_TTL = 10
+
+# Tamaño de página de recordings.list: 100 es el máximo de Meet v2 (valores
+# mayores se reducen a 100 en el servidor)
+RECORDINGS_PAGE_SIZE = 100
+
+# Máximo de sub-peticiones por batch HTTP admitido por Google
+BATCH_MAX_REQUESTS = 100
+
+# Máscaras de respuesta parcial (fields=): solo lo que se consume aguas abajo.
+# Las cachés guardan únicamente respuestas pedidas con estas máscaras.
+RECORD_FIELDS = 'name,startTime,endTime,space'
+RECORDING_FIELDS = 'name,state,driveDestination,startTime,endTime'
+RECORDINGS_LIST_FIELDS = f'recordings({RECORDING_FIELDS}),nextPageToken'
+
+# Estados HTTP transitorios que se reintentan con backoff exponencial
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Pool acotado para las variantes async: cada hilo usa su propio transporte
+# HTTP (httplib2.Http no es thread-safe, ver transport.thread_http)
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix='meet-conference'
+)
+
+
+class _TokenBucket:
+    """
+    Limitador token bucket thread-safe compartido por el proceso.
+    
+    Mantiene el ritmo de peticiones por debajo de la cuota del proyecto para
+    no llegar a recibir 429 (y pagar el backoff de los reintentos).
+    """
+    
+    def __init__(self, rate_per_minute: int):
+        self.capacity = max(1, rate_per_minute)
+        self.rate = self.capacity / 60.0  # tokens por segundo
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Consume tokens, esperando lo necesario. Retorna los segundos esperados.
+        """
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+_RATE_LIMITER = _TokenBucket(settings.GOOGLE_MEET_API_RATE_PER_MINUTE)
+
+
+def _throttle(tokens: int = 1) -> None:
+    """Espera turno en _RATE_LIMITER; avisa si la espera fue significativa."""
+    waited = _RATE_LIMITER.acquire(tokens)
+    if waited > 0.5:
+        logger.warning(
+            "Limitador local de Meet API: espera de %.2fs (considerar ampliar la cuota)",
+            waited
+        )
+
+
+def _quota_id(error: HttpError) -> Optional[str]:
+    """Extrae el quotaId/quota_limit de los detalles de un HttpError, si viene."""
+    for detail in getattr(error, 'error_details', None) or []:
+        if not isinstance(detail, dict):
+            continue
+        for violation in detail.get('violations', []):
+            if violation.get('quotaId'):
+                return violation['quotaId']
+        quota_limit = detail.get('metadata', {}).get('quota_limit')
+        if quota_limit:
+            return quota_limit
+    return None
+
+
+def _retry_with_backoff(max_retries: int = 5, base: float = 1.0, cap: float = 32.0):
+    """
+    Reintenta HttpError transitorios (429/5xx) con backoff exponencial y jitter.
+    
+    Respeta la cabecera Retry-After cuando la respuesta la incluye, salvo
+    que pida esperar más de cap: en ese caso el error se propaga en lugar de
+    bloquear el hilo. Otros errores se propagan sin reintentar.
+    
+    Args:
+        max_retries: Reintentos máximos tras el primer intento
+        base: Espera base en segundos
+        cap: Espera máxima en segundos (sin contar el jitter), también
+            para Retry-After
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempt = 0
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except HttpError as error:
+                    status = error.resp.status
+                    if status not in RETRYABLE_STATUSES or attempt >= max_retries:
+                        raise
+                    delay = min(cap, base * 2 ** attempt) + random.uniform(0, 1)
+                    retry_after = error.resp.get('retry-after')
+                    if retry_after and retry_after.isdigit():
+                        if float(retry_after) > cap:
+                            logger.warning(
+                                "Meet API pide esperar %ss (HTTP %s), más que el máximo de %ss; sin reintentar",
+                                retry_after, status, cap
+                            )
+                            raise
+                        delay = max(delay, float(retry_after))
+                    if status == 429:
+                        logger.warning(
+                            "Cuota de Meet API excedida (429, quotaId=%s, uri=%s); reintento %s/%s en %.1fs",
+                            _quota_id(error), error.uri, attempt + 1, max_retries, delay
+                        )
+                    else:
+                        logger.warning(
+                            "Error transitorio de Meet API (HTTP %s); reintento %s/%s en %.1fs",
+                            status, attempt + 1, max_retries, delay
+                        )
+                    time.sleep(delay)
+                    attempt += 1
+        return wrapper
+    return decorator
+
+
+# Serializa la primera construcción concurrente de credenciales/servicio
+_BUILD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _shared_service(credentials):
+    """Construye (una vez por credenciales) el servicio de Google Meet API v2."""
+    # Documento de discovery estático incluido en google-api-python-client:
+    # sin descarga por red ni caché en disco al construir el servicio
+    service = build(
+        'meet', 'v2',
+        http=thread_http(credentials),
+        requestBuilder=functools.partial(build_request, credentials),
+        model=FastJsonModel(),
+        cache_discovery=False,
+        static_discovery=True
+    )
+    logger.info("Servicio de Google Meet Conference API construido correctamente")
+    return service
+
 
 class GoogleMeetConferenceClient:
     """
@@ -44,9 +230,15 @@ class GoogleMeetConferenceClient:
             self.config = GoogleConfig()
             self.credentials = self._load_credentials()
             self.service = self._build_service()
+            self._record_cache = TTLCache(maxsize=1024, ttl=RECORD_CACHE_TTL)
+            self._recording_cache = TTLCache(maxsize=4096, ttl=RECORDING_CACHE_TTL)
+            self._ready_recording_cache = TTLCache(maxsize=4096, ttl=READY_RECORDING_CACHE_TTL)
+            self._missing_cache = TTLCache(maxsize=1024, ttl=MISSING_CACHE_TTL)
+            self._cache_lock = threading.Lock()
+            self._inflight: Dict[Any, concurrent.futures.Future] = {}
             logger.info("Google Meet Conference Client inicializado correctamente")
         except Exception as e:
-            logger.error(f"Error al inicializar Google Meet Conference Client: {e}")
+            logger.error("Error al inicializar Google Meet Conference Client: %s", e)
             raise GoogleAuthenticationError(
                 f"Error al inicializar Google Meet Conference Client: {str(e)}"
             )
@@ -55,91 +247,150 @@ class GoogleMeetConferenceClient:
         """
         Carga las credenciales del Service Account.
         
-        Usa from_service_account_info en lugar de from_service_account_file
-        para evitar problemas de deadlock en macOS con Docker.
+        Las credenciales se comparten en todo el proceso (ver
+        config.service_account_credentials); solo se vuelven a leer si el
+        archivo cambia.
         """
         try:
-            # Leer el archivo en memoria primero para evitar deadlock en macOS/Docker
-            import json
-            import time
-            
-            # Intentar leer con retry para manejar problemas temporales
-            max_retries = 3
-            retry_delay = 0.1
-            
-            for attempt in range(max_retries):
-                try:
-                    with open(self.config.service_account_file, 'r') as f:
-                        creds_info = json.load(f)
-                    break
-                except OSError as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Intento {attempt + 1} falló al leer credenciales, reintentando...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        raise
-            
-            # Usar from_service_account_info en lugar de from_service_account_file
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_info,
-                scopes=self.config.all_scopes
-            )
-            
+            with _BUILD_LOCK:
+                credentials = service_account_credentials(
+                    self.config.service_account_file,
+                    self.config.admin_email,
+                    tuple(self.config.all_scopes)
+                )
             if self.config.admin_email:
-                credentials = credentials.with_subject(self.config.admin_email)
-                logger.info(f"Usando Domain-Wide Delegation con: {self.config.admin_email}")
-            
+                logger.info("Usando Domain-Wide Delegation con: %s", self.config.admin_email)
             return credentials
         except Exception as e:
-            logger.error(f"Error al cargar credenciales: {e}")
+            logger.error("Error al cargar credenciales: %s", e)
             raise GoogleAuthenticationError(
                 f"Error al cargar credenciales: {str(e)}"
             )
     
     def _build_service(self):
-        """Construye el servicio de Google Meet API v2."""
+        """Retorna el servicio de Google Meet API v2 compartido del proceso."""
         try:
-            service = build('meet', 'v2', credentials=self.credentials)
-            logger.info("Servicio de Google Meet Conference API construido correctamente")
-            return service
+            with _BUILD_LOCK:
+                return _shared_service(self.credentials)
         except Exception as e:
-            logger.error(f"Error al construir servicio: {e}")
+            logger.error("Error al construir servicio: %s", e)
             raise GoogleMeetError(
                 f"Error al construir servicio de Google Meet: {str(e)}"
             )
     
-    def get_conference_record(self, conference_record_name: str) -> Optional[Dict[str, Any]]:
+    def _single_flight(self, key, fetch):
+        """
+        Ejecuta fetch() una sola vez por key entre llamadores concurrentes.
+        
+        El primer llamador hace la petición; los que llegan mientras está en
+        curso esperan su resultado (o su excepción) en lugar de repetirla.
+        """
+        with self._cache_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = concurrent.futures.Future()
+        if not owner:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+    
+    @_retry_with_backoff()
+    def _execute(self, request):
+        """Ejecuta una petición de la API reintentando errores transitorios."""
+        _throttle()
+        return request.execute()
+    
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Ejecuta una llamada bloqueante en _EXECUTOR y espera su resultado.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _EXECUTOR, functools.partial(func, *args, **kwargs)
+        )
+    
+    def _cache_get(self, cache: TTLCache, key):
+        """Lee una entrada de caché bajo el lock (None si no existe)."""
+        with self._cache_lock:
+            return cache.get(key)
+    
+    def _cache_set(self, cache: TTLCache, key, value) -> None:
+        """Guarda una entrada de caché bajo el lock."""
+        with self._cache_lock:
+            cache[key] = value
+    
+    def _is_missing(self, name: str) -> bool:
+        """True si el recurso respondió 404 hace menos de MISSING_CACHE_TTL."""
+        with self._cache_lock:
+            return name in self._missing_cache
+    
+    def get_conference_record(self, conference_record_name: str,
+                              fields: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Obtiene información de un conference record.
         
         Args:
             conference_record_name: Nombre del conference record
                 Formato: conferenceRecords/{conference_record_id}
+            fields: Máscara de campos; por defecto RECORD_FIELDS. Con una
+                máscara propia la respuesta no se lee ni se guarda en caché
         
         Returns:
             dict: Información del conference record o None si no existe
         """
-        try:
-            logger.info(f"Obteniendo conference record: {conference_record_name}")
-            record = self.service.conferenceRecords().get(
-                name=conference_record_name
-            ).execute()
-            logger.info(f"Conference record obtenido: {record.get('name')}")
-            return record
-        except HttpError as error:
-            if error.resp.status == 404:
-                logger.warning(f"Conference record no encontrado: {conference_record_name}")
-                return None
-            logger.error(f"Error al obtener conference record: {error}")
-            raise GoogleMeetError(
-                f"Error al obtener conference record: {str(error)}"
-            )
+        use_cache = fields is None
+        if use_cache:
+            cached = self._cache_get(self._record_cache, conference_record_name)
+            if cached is not None:
+                return cached
+        if self._is_missing(conference_record_name):
+            return None
+        
+        def fetch():
+            try:
+                logger.info("Obteniendo conference record: %s", conference_record_name)
+                record = self._execute(self.service.conferenceRecords().get(
+                    name=conference_record_name,
+                    fields=fields or RECORD_FIELDS
+                ))
+                logger.info("Conference record obtenido: %s", record.get('name'))
+                if use_cache:
+                    self._cache_set(self._record_cache, conference_record_name, record)
+                return record
+            except HttpError as error:
+                if error.resp.status == 404:
+                    logger.warning("Conference record no encontrado: %s", conference_record_name)
+                    self._cache_set(self._missing_cache, conference_record_name, True)
+                    return None
+                logger.error("Error al obtener conference record: %s", error)
+                raise GoogleMeetError(
+                    f"Error al obtener conference record: {str(error)}"
+                )
+        
+        # Llamadores concurrentes por el mismo recurso comparten una sola petición
+        return self._single_flight((conference_record_name, fields), fetch)
     
-    def list_recordings(self, conference_record_name: str, 
-                       only_ready: bool = True) -> List[Dict[str, Any]]:
+    def iter_recordings(self, conference_record_name: str,
+                        only_ready: bool = True,
+                        fields: Optional[str] = None,
+                        page_size: int = RECORDINGS_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
         """
-        Lista todas las grabaciones de un conference record.
+        Itera las grabaciones de un conference record página a página.
+        
+        Cada grabación se entrega en cuanto llega su página; el llamador que
+        solo necesita la primera puede cortar la iteración y ahorrarse las
+        páginas restantes. La API las devuelve por startTime ascendente y no
+        admite orderBy.
         
         Según documentación: https://developers.google.com/workspace/meet/api/guides/artifacts#recordings
         https://developers.google.com/workspace/meet/api/reference/rest/v2/conferenceRecords.recordings
@@ -148,102 +399,336 @@ class GoogleMeetConferenceClient:
             conference_record_name: Nombre del conference record
                 Formato: conferenceRecords/{conference_record_id}
             only_ready: Si True, filtra solo grabaciones con state == FILE_GENERATED
+            fields: Máscara de campos del list; por defecto RECORDINGS_LIST_FIELDS
+            page_size: Grabaciones por página (máximo RECORDINGS_PAGE_SIZE)
         
-        Returns:
-            List[Dict]: Lista de grabaciones con información de Drive y estado
+        Yields:
+            dict: Grabación con información de Drive y estado
         """
+        if self._is_missing(conference_record_name):
+            return
+        
         try:
-            logger.info(f"Listando grabaciones para: {conference_record_name} (only_ready={only_ready})")
+            logger.info("Listando grabaciones para: %s (only_ready=%s)", conference_record_name, only_ready)
             
-            recordings = []
             page_token = None
             
             while True:
                 request_params = {
                     'parent': conference_record_name,
-                    'pageSize': 100
+                    'pageSize': min(page_size, RECORDINGS_PAGE_SIZE),
+                    'fields': fields or RECORDINGS_LIST_FIELDS
                 }
                 
                 if page_token:
                     request_params['pageToken'] = page_token
                 
-                response = self.service.conferenceRecords().recordings().list(
+                response = self._execute(self.service.conferenceRecords().recordings().list(
                     **request_params
-                ).execute()
+                ))
                 
                 all_recordings = response.get('recordings', [])
+                # Un solo recorrido para filtrar; se reutiliza para la caché
+                ready_recordings = [
+                    r for r in all_recordings if r.get('state') == STATE_READY
+                ]
+                logger.debug(
+                    "Filtradas %d grabaciones listas de %d totales",
+                    len(ready_recordings), len(all_recordings)
+                )
+                
+                # Las grabaciones listas son inmutables: disponibles para get_recording
+                if fields is None and ready_recordings:
+                    with self._cache_lock:
+                        for recording in ready_recordings:
+                            self._ready_recording_cache[recording['name']] = recording
                 
-                if only_ready:
-                    # Filtrar solo grabaciones listas (FILE_GENERATED)
-                    ready_recordings = [
-                        r for r in all_recordings 
-                        if r.get('state') == 'FILE_GENERATED'
-                    ]
-                    recordings.extend(ready_recordings)
-                    logger.debug(f"Filtradas {len(ready_recordings)} grabaciones listas de {len(all_recordings)} totales")
-                else:
-                    recordings.extend(all_recordings)
+                yield from (ready_recordings if only_ready else all_recordings)
                 
                 page_token = response.get('nextPageToken')
                 if not page_token:
                     break
             
-            logger.info(f"Encontradas {len(recordings)} grabaciones")
-            return recordings
-            
         except HttpError as error:
             if error.resp.status == 404:
-                logger.warning(f"Conference record no encontrado: {conference_record_name}")
-                return []
-            logger.error(f"Error al listar grabaciones: {error}")
+                logger.warning("Conference record no encontrado: %s", conference_record_name)
+                self._cache_set(self._missing_cache, conference_record_name, True)
+                return
+            logger.error("Error al listar grabaciones: %s", error)
             raise GoogleMeetError(
                 f"Error al listar grabaciones: {str(error)}"
             )
     
-    def get_recording(self, recording_name: str) -> Optional[Dict[str, Any]]:
+    def list_recordings(self, conference_record_name: str, 
+                       only_ready: bool = True) -> List[Dict[str, Any]]:
+        """
+        Lista todas las grabaciones de un conference record.
+        
+        Args:
+            conference_record_name: Nombre del conference record
+                Formato: conferenceRecords/{conference_record_id}
+            only_ready: Si True, filtra solo grabaciones con state == FILE_GENERATED
+        
+        Returns:
+            List[Dict]: Lista de grabaciones con información de Drive y estado
+        """
+        cache_key = (conference_record_name, only_ready)
+        cached = self._cache_get(self._recording_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        recordings = list(self.iter_recordings(conference_record_name, only_ready))
+        logger.info("Encontradas %s grabaciones", len(recordings))
+        # Un 404 no se guarda como lista vacía: solo vive en la caché negativa
+        if not self._is_missing(conference_record_name):
+            self._cache_set(self._recording_cache, cache_key, recordings)
+        return recordings
+    
+    def list_recordings_many(self, conference_record_names: List[str],
+                             only_ready: bool = True) -> List[Dict[str, Any]]:
+        """
+        Lista las grabaciones de varios conference records en paralelo.
+        
+        Usa list_recordings_for_conferences (pool propio y acotado, no
+        _EXECUTOR), de modo que la latencia total es la del record más lento
+        y no la suma de todos.
+        
+        Args:
+            conference_record_names: Nombres de los conference records
+            only_ready: Si True, filtra solo grabaciones con state == FILE_GENERATED
+        
+        Returns:
+            List[Dict]: Grabaciones de todos los records, en el orden recibido
+        """
+        by_name = dict(
+            self.list_recordings_for_conferences(conference_record_names, only_ready)
+        )
+        return list(itertools.chain.from_iterable(
+            by_name[name] for name in dict.fromkeys(conference_record_names)
+        ))
+    
+    def list_recordings_for_conferences(self, conference_record_names: List[str],
+                                        only_ready: bool = True,
+                                        max_concurrency: int = 16
+                                        ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Lista grabaciones de muchos conference records con concurrencia acotada.
+        
+        Pensado para backfills: entrega (nombre, grabaciones) a medida que cada
+        record termina, sin esperar al resto. max_concurrency limita las
+        conexiones simultáneas; el ritmo de peticiones lo sigue controlando el
+        limitador compartido del módulo.
+        
+        Args:
+            conference_record_names: Nombres de los conference records
+            only_ready: Si True, filtra solo grabaciones con state == FILE_GENERATED
+            max_concurrency: Máximo de records listándose a la vez
+        
+        Yields:
+            tuple: (conference_record_name, lista de grabaciones)
+        """
+        names = list(dict.fromkeys(conference_record_names))
+        if not names:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(names)),
+            thread_name_prefix='meet-conference-fanout'
+        ) as executor:
+            futures = {
+                executor.submit(self.list_recordings, name, only_ready): name
+                for name in names
+            }
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.result()
+    
+    def get_recording(self, recording_name: str,
+                      fields: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Obtiene detalles de una grabación específica.
         
         Args:
             recording_name: Nombre de la grabación
                 Formato: conferenceRecords/{conference_record_id}/recordings/{recording_id}
+            fields: Máscara de campos; por defecto RECORDING_FIELDS. Con una
+                máscara propia la respuesta no se lee ni se guarda en caché
         
         Returns:
             dict: Detalles de la grabación incluyendo DriveDestination y State
         """
-        try:
-            logger.info(f"Obteniendo grabación: {recording_name}")
-            recording = self.service.conferenceRecords().recordings().get(
-                name=recording_name
-            ).execute()
-            logger.info(f"Grabación obtenida: {recording.get('name')}")
-            return recording
-        except HttpError as error:
-            if error.resp.status == 404:
-                logger.warning(f"Grabación no encontrada: {recording_name}")
-                return None
-            logger.error(f"Error al obtener grabación: {error}")
-            raise GoogleMeetError(
-                f"Error al obtener grabación: {str(error)}"
+        use_cache = fields is None
+        if use_cache:
+            cached = (
+                self._cache_get(self._ready_recording_cache, recording_name)
+                or self._cache_get(self._recording_cache, recording_name)
+            )
+            if cached is not None:
+                return cached
+        if self._is_missing(recording_name):
+            return None
+        
+        def fetch():
+            try:
+                logger.info("Obteniendo grabación: %s", recording_name)
+                recording = self._execute(self.service.conferenceRecords().recordings().get(
+                    name=recording_name,
+                    fields=fields or RECORDING_FIELDS
+                ))
+                logger.info("Grabación obtenida: %s", recording.get('name'))
+                if use_cache:
+                    if recording.get('state') == STATE_READY:
+                        self._cache_set(self._ready_recording_cache, recording_name, recording)
+                    else:
+                        self._cache_set(self._recording_cache, recording_name, recording)
+                return recording
+            except HttpError as error:
+                if error.resp.status == 404:
+                    logger.warning("Grabación no encontrada: %s", recording_name)
+                    self._cache_set(self._missing_cache, recording_name, True)
+                    return None
+                logger.error("Error al obtener grabación: %s", error)
+                raise GoogleMeetError(
+                    f"Error al obtener grabación: {str(error)}"
+                )
+        
+        # Llamadores concurrentes por el mismo recurso comparten una sola petición
+        return self._single_flight((recording_name, fields), fetch)
+    
+    def get_recordings_batch(self, recording_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene varias grabaciones con peticiones batch (multipart/mixed).
+        
+        Las grabaciones en caché no se piden; el resto se agrupa en batches de
+        hasta BATCH_MAX_REQUESTS sub-peticiones, un round trip por batch. Si el
+        endpoint batch falla, se recurre a get_recording secuencial. Un 429 en
+        una sub-petición solo omite esa grabación (el llamador puede reintentar
+        con get_recording).
+        
+        Args:
+            recording_names: Nombres de las grabaciones
+        
+        Returns:
+            dict: {recording_name: grabación} solo para las encontradas
+        """
+        found = {}
+        pending = []
+        for name in dict.fromkeys(recording_names):
+            cached = (
+                self._cache_get(self._ready_recording_cache, name)
+                or self._cache_get(self._recording_cache, name)
             )
+            if cached is not None:
+                found[name] = cached
+            elif not self._is_missing(name):
+                pending.append(name)
+        
+        def _on_recording(request_id, response, exception):
+            if exception is None:
+                found[request_id] = response
+                cache = (
+                    self._ready_recording_cache
+                    if response.get('state') == STATE_READY
+                    else self._recording_cache
+                )
+                self._cache_set(cache, request_id, response)
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                self._cache_set(self._missing_cache, request_id, True)
+            else:
+                logger.warning("No se pudo obtener grabación %s: %s", request_id, exception)
+        
+        recordings_api = self.service.conferenceRecords().recordings()
+        for start in range(0, len(pending), BATCH_MAX_REQUESTS):
+            chunk = pending[start:start + BATCH_MAX_REQUESTS]
+            batch = self.service.new_batch_http_request(callback=_on_recording)
+            for name in chunk:
+                batch.add(
+                    recordings_api.get(name=name, fields=RECORDING_FIELDS),
+                    request_id=name
+                )
+            try:
+                logger.info("Obteniendo %s grabaciones en batch", len(chunk))
+                # Cada sub-petición consume cuota por separado
+                _throttle(len(chunk))
+                batch.execute()
+            except HttpError as error:
+                logger.warning("Batch de grabaciones falló, usando peticiones individuales: %s", error)
+                for name in chunk:
+                    if name not in found:
+                        recording = self.get_recording(name)
+                        if recording:
+                            found[name] = recording
+        
+        return found
+    
+    async def get_conference_record_async(self, conference_record_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Versión asíncrona de get_conference_record (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(self.get_conference_record, conference_record_name)
+    
+    async def list_recordings_async(self, conference_record_name: str,
+                                    only_ready: bool = True) -> List[Dict[str, Any]]:
+        """
+        Versión asíncrona de list_recordings (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(
+            self.list_recordings, conference_record_name, only_ready=only_ready
+        )
+    
+    async def get_recording_async(self, recording_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Versión asíncrona de get_recording (se ejecuta en el pool de hilos).
+        """
+        return await self._run_async(self.get_recording, recording_name)
     
     def find_conference_record_by_space(self, space_name: str) -> Optional[str]:
         """
-        Intenta encontrar el conference record asociado a un espacio.
+        Encuentra el conference record más reciente asociado a un espacio.
         
-        Nota: Esto puede requerir buscar en conferenceRecords usando el meeting_code
-        o esperar a que se genere el conference record después de la reunión.
+        Usa conferenceRecords.list con filtro del lado del servidor; la API
+        devuelve los records por startTime descendente, así que basta con el
+        primero. El resultado se cachea RECORD_CACHE_TTL segundos; si aún no
+        existe record (la reunión no ha ocurrido), se cachea MISSING_CACHE_TTL.
         
         Args:
-            space_name: Nombre del espacio (formato: spaces/{meeting_code})
+            space_name: Nombre del espacio (formato: spaces/{space_id} o
+                spaces/{meeting_code}, como lo genera GoogleMeetClient)
         
         Returns:
             str: Nombre del conference record o None si no se encuentra
         """
-        # La relación entre space y conference record no es directa
-        # El conference record se crea cuando la reunión tiene lugar
-        # Por ahora, retornamos None ya que necesitaríamos buscar
-        # en conferenceRecords por meeting_code o esperar a que se genere
-        logger.warning("find_conference_record_by_space no implementado completamente")
-        return None
+        cache_key = ('space', space_name)
+        cached = self._cache_get(self._record_cache, cache_key)
+        if cached is not None:
+            return cached
+        if self._is_missing(cache_key):
+            return None
+        
+        space_id = space_name.split('/', 1)[-1]
+        if _MEETING_CODE_RE.match(space_id):
+            record_filter = f'space.meeting_code = "{space_id}"'
+        else:
+            record_filter = f'space.name = "{space_name}"'
+        
+        try:
+            logger.info("Buscando conference record para: %s", space_name)
+            response = self._execute(self.service.conferenceRecords().list(
+                filter=record_filter,
+                pageSize=1,
+                fields='conferenceRecords(name,startTime)'
+            ))
+        except HttpError as error:
+            logger.error("Error al buscar conference record: %s", error)
+            raise GoogleMeetError(
+                f"Error al buscar conference record: {str(error)}"
+            )
+        
+        records = response.get('conferenceRecords', [])
+        if not records:
+            logger.info("Sin conference record aún para: %s", space_name)
+            self._cache_set(self._missing_cache, cache_key, True)
+            return None
+        
+        record_name = records[0]['name']
+        self._cache_set(self._record_cache, cache_key, record_name)
+        return record_name
 
@@ -7,21 +7,80 @@ Maneja la lógica de negocio para:
 - Crear/actualizar registros de grabaciones en la base de datos
 """
 
+import bisect
+import concurrent.futures
+import itertools
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Optional, Dict, Any, List, Set, Tuple
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
-from django.db import transaction, models
-from django.db.models import Case, When, IntegerField
+from django.db import connections, transaction, models
+from django.db.models import Case, Exists, F, IntegerField, OuterRef, When
 
-from .drive_client import GoogleDriveClient
-from .meet_conference_client import GoogleMeetConferenceClient
+from .drive_client import DRIVE_TIME_FORMAT, get_drive_client
+from .meet_conference_client import GoogleMeetConferenceClient, STATE_READY
+from .transport import TRANSPORT_ERRORS
 from meetings.models import Meeting, MeetingRecording
-from core.exceptions import GoogleDriveError, GoogleMeetError
+from core.exceptions import GoogleAPIError, GoogleDriveError, GoogleMeetError
 
 logger = logging.getLogger(__name__)
 
+# Errores de las búsquedas en Google que se tratan como "sin resultado": los
+# de la API y los de red/credenciales que los clientes no traducen
+_LOOKUP_ERRORS = (GoogleAPIError,) + TRANSPORT_ERRORS
+
+# Código de Meet dentro del enlace: https://meet.google.com/{meeting_code}[/|?...]
+MEET_CODE_RE = re.compile(r'meet\.google\.com/([a-z0-9-]+)')
+
+# Máximo de archivos a precargar de Drive por bloque de reuniones
+DRIVE_PREFETCH_MAX = 1000
+
+# Reuniones por bloque en sync_all_recordings: se leen con iterator() y cada
+# bloque comparte la precarga de Drive/Calendar y el upsert en lote
+SYNC_CHUNK_SIZE = 500
+
+# Candidatos por reunión en la búsqueda por rango de fechas: la ventana ya
+# acota createdTime en la consulta, así que basta con los más recientes
+DRIVE_WINDOW_CANDIDATES = 10
+
+# Clave en la caché de Django de la grabación lista de una conferencia;
+# persiste entre ejecuciones (ver MEET_RECORDING_CACHE_TTL)
+MEET_RECORDING_CACHE_KEY = 'meet_recording:{}'
+
+# Filas por INSERT en los upserts de _bulk_save_recordings (acota el número
+# de parámetros por sentencia en sincronizaciones grandes)
+RECORDING_BULK_BATCH_SIZE = 500
+
+# Campos de Drive que usa _create_or_update_recording_from_drive
+DRIVE_METADATA_FIELDS = ('createdTime', 'webViewLink')
+
+
+def _meeting_has_recording(meeting: Meeting) -> Optional[MeetingRecording]:
+    """
+    Retorna la grabación asociada a la reunión, o None si no tiene.
+    
+    Si la relación inversa ya está en caché (select_related('recording')
+    o un acceso previo) o la reunión viene anotada con has_recording no
+    consulta la BD; a diferencia de hasattr, no
+    oculta otros AttributeError.
+    """
+    # Reuniones de _pending_meetings_qs: la consulta ya comprobó que no tienen
+    if getattr(meeting, 'has_recording', None) is False:
+        return None
+    cache = meeting._state.fields_cache
+    if 'recording' in cache:
+        return cache['recording']
+    return MeetingRecording.objects.filter(meeting_id=meeting.id).first()
+
+
+def _name_words(drive_file: Dict[str, Any]) -> Set[str]:
+    """Palabras (en minúsculas) del nombre de un archivo de Drive."""
+    return set(drive_file.get('name', '').lower().split())
+
 
 class RecordingSyncService:
     """
@@ -36,7 +95,7 @@ class RecordingSyncService:
     def __init__(self):
         """Inicializa el servicio con los clientes de Drive y Meet Conference."""
         try:
-            self.drive_client = GoogleDriveClient()
+            self.drive_client = get_drive_client()
             try:
                 self.conference_client = GoogleMeetConferenceClient()
                 logger.info("RecordingSyncService inicializado con Conference Client")
@@ -48,7 +107,10 @@ class RecordingSyncService:
             logger.error(f"Error al inicializar RecordingSyncService: {e}")
             raise
     
-    def sync_meeting_recording(self, meeting: Meeting) -> Optional[MeetingRecording]:
+    def sync_meeting_recording(self, meeting: Meeting,
+                               recording_index: Optional[Dict[str, Any]] = None,
+                               event_cache: Optional[Dict[str, Any]] = None,
+                               now: Optional[datetime] = None) -> Optional[MeetingRecording]:
         """
         Sincroniza la grabación para una reunión específica.
         
@@ -58,6 +120,12 @@ class RecordingSyncService:
         
         Args:
             meeting (Meeting): Reunión para la cual buscar grabación
+            recording_index (dict, optional): Índice de grabaciones de Drive
+                precargado por sync_all_recordings (ver _build_recording_index)
+            event_cache (dict, optional): Eventos de Calendar precargados
+                {event_id: evento} (ver _fetch_event_cache)
+            now (datetime, optional): Instante de referencia para decidir si la
+                reunión ya ocurrió; por defecto timezone.now()
         
         Returns:
             MeetingRecording: Grabación encontrada y asociada, o None si no se encuentra
@@ -69,31 +137,18 @@ class RecordingSyncService:
             logger.info(f"Sincronizando grabación para Meeting {meeting.id} (Event ID: {meeting.google_event_id})")
             
             # Verificar si ya tiene grabación
-            if hasattr(meeting, 'recording'):
+            existing = _meeting_has_recording(meeting)
+            if existing:
                 logger.info(f"Meeting {meeting.id} ya tiene grabación asociada")
-                return meeting.recording
-            
-            # Estrategia 1: Intentar obtener desde Conference Records API (si tenemos ID)
-            if meeting.conference_record_id and self.conference_client:
-                recording_data = self._find_recording_from_conference_record(meeting)
-                if recording_data:
-                    logger.info(f"Grabación encontrada desde Conference Records API para Meeting {meeting.id}")
-                    recording = self._create_or_update_recording_from_api(meeting, recording_data)
-                    logger.info(f"Grabación sincronizada exitosamente desde API para Meeting {meeting.id}")
-                    return recording
-            
-            # Estrategia 2: Buscar en Drive (fallback)
-            logger.debug(f"Buscando grabación en Drive para Meeting {meeting.id}")
-            drive_file = self._find_recording_in_drive(meeting)
-            
-            if not drive_file:
-                logger.info(f"No se encontró grabación para Meeting {meeting.id}")
+                return existing
+            
+            defaults = self._resolve_recording_defaults(meeting, recording_index, event_cache, now)
+            if not defaults:
                 return None
             
-            # Crear o actualizar registro de grabación desde Drive
-            recording = self._create_or_update_recording_from_drive(meeting, drive_file)
+            recording, _ = self._save_recording(meeting, defaults)
             
-            logger.info(f"Grabación sincronizada exitosamente desde Drive para Meeting {meeting.id}")
+            logger.info(f"Grabación sincronizada exitosamente para Meeting {meeting.id}")
             return recording
             
         except (GoogleDriveError, GoogleMeetError) as e:
@@ -105,7 +160,48 @@ class RecordingSyncService:
             # No fallar completamente, solo loguear
             return None
     
-    def sync_all_recordings(self, limit: Optional[int] = None) -> Dict[str, Any]:
+    def _resolve_recording_defaults(self, meeting: Meeting,
+                                    recording_index: Optional[Dict[str, Any]] = None,
+                                    event_cache: Optional[Dict[str, Any]] = None,
+                                    now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Busca la grabación de una reunión y retorna sus campos, sin escribir en la BD.
+        
+        1. Si tenemos conference_record_id, usar Conference Records API (más preciso)
+        2. Si no, buscar en Drive como fallback
+        
+        Args:
+            meeting (Meeting): Reunión para la cual buscar grabación
+            recording_index (dict, optional): Índice de _build_recording_index
+            event_cache (dict, optional): Eventos de _fetch_event_cache
+            now (datetime, optional): Instante de referencia (ver _get_search_window)
+        
+        Returns:
+            dict: Campos para MeetingRecording, o None si no se encuentra
+        
+        Raises:
+            GoogleDriveError: Si hay error al buscar en Drive
+        """
+        # Estrategia 1: Intentar obtener desde Conference Records API (si tenemos ID)
+        if meeting.conference_record_id and self.conference_client:
+            recording_data = self._find_recording_from_conference_record(meeting)
+            if recording_data:
+                logger.info(f"Grabación encontrada desde Conference Records API para Meeting {meeting.id}")
+                return self._recording_defaults_from_api(meeting, recording_data)
+        
+        # Estrategia 2: Buscar en Drive (fallback)
+        logger.debug(f"Buscando grabación en Drive para Meeting {meeting.id}")
+        drive_file = self._find_recording_in_drive(
+            meeting, recording_index=recording_index, event_cache=event_cache, now=now
+        )
+        
+        if not drive_file:
+            logger.info(f"No se encontró grabación para Meeting {meeting.id}")
+            return None
+        
+        return self._recording_defaults_from_drive(meeting, drive_file)
+    
+    def sync_all_recordings(self, limit: Optional[int] = None, force: bool = False) -> Dict[str, Any]:
         """
         Sincroniza grabaciones para todas las reuniones sin grabación.
         
@@ -119,6 +215,8 @@ class RecordingSyncService:
         
         Args:
             limit (int, optional): Límite de reuniones a procesar
+            force (bool): Si True, descarta las grabaciones de Conference
+                Records API cacheadas y las vuelve a consultar
         
         Returns:
             dict: Estadísticas de sincronización
@@ -131,45 +229,6 @@ class RecordingSyncService:
         try:
             logger.info("Iniciando sincronización masiva de grabaciones")
             
-            # Obtener reuniones sin grabación
-            # Criterios:
-            # 1. No tener grabación asociada
-            # 2. Tener meet_link (necesario para búsqueda por código de Meet)
-            # 3. Priorizar reuniones con conference_record_id (más precisas)
-            base_queryset = Meeting.objects.exclude(
-                recording__isnull=False
-            ).filter(
-                meet_link__isnull=False  # Requerido para búsqueda por código de Meet
-            )
-            
-            # Priorizar reuniones con conference_record_id (búsqueda más precisa)
-            # Ordenar: primero las que tienen conference_record_id (prioridad 0), luego las que no (prioridad 1)
-            # Luego ordenar por fecha más reciente (scheduled_start si existe, sino created_at)
-            queryset = base_queryset.annotate(
-                has_conference_id=Case(
-                    When(conference_record_id__isnull=False, then=0),
-                    default=1,
-                    output_field=IntegerField()
-                )
-            ).order_by(
-                'has_conference_id',  # 0 primero (tienen conference_record_id), 1 después
-                '-scheduled_start',  # Más recientes primero (NULLs al final)
-                '-created_at'  # Fallback si no hay scheduled_start
-            )
-            
-            if limit:
-                queryset = queryset[:limit]
-            
-            meetings = list(queryset)
-            logger.info(f"Encontradas {len(meetings)} reuniones sin grabación")
-            
-            # Log de estadísticas de las reuniones encontradas
-            with_conference_id = sum(1 for m in meetings if m.conference_record_id)
-            with_scheduled = sum(1 for m in meetings if m.scheduled_start)
-            logger.info(f"  - Con conference_record_id: {with_conference_id}")
-            logger.info(f"  - Con scheduled_start: {with_scheduled}")
-            logger.info(f"  - Sin scheduled_start (usará created_at): {len(meetings) - with_scheduled}")
-            
             stats = {
                 'processed': 0,
                 'found': 0,
@@ -177,27 +236,28 @@ class RecordingSyncService:
                 'updated': 0,
                 'errors': 0
             }
+            with_conference_id = 0
+            with_scheduled = 0
             
-            for meeting in meetings:
-                try:
-                    stats['processed'] += 1
-                    
-                    # Sincronizar grabación
-                    recording = self.sync_meeting_recording(meeting)
-                    
-                    if recording:
-                        stats['found'] += 1
-                        # Verificar si fue creada o actualizada
-                        # Comparar timestamps con tolerancia de 1 segundo (por posibles diferencias de precisión)
-                        time_diff = abs((recording.created_at - meeting.created_at).total_seconds())
-                        if time_diff < 1:
-                            stats['created'] += 1
-                        else:
-                            stats['updated'] += 1
-                    
-                except Exception as e:
-                    stats['errors'] += 1
-                    logger.error(f"Error al sincronizar Meeting {meeting.id}: {e}")
+            # Un único "ahora" para toda la sincronización, en vez de uno por reunión
+            now = timezone.now()
+            
+            # iterator(): las reuniones se leen por bloques (cursor del lado del
+            # servidor en PostgreSQL) en lugar de cargar todo el queryset en memoria
+            meetings_iter = self._pending_meetings_qs(limit).iterator(chunk_size=SYNC_CHUNK_SIZE)
+            while True:
+                meetings = list(itertools.islice(meetings_iter, SYNC_CHUNK_SIZE))
+                if not meetings:
+                    break
+                for m in meetings:
+                    with_conference_id += bool(m.conference_record_id)
+                    with_scheduled += bool(m.scheduled_start)
+                self._sync_chunk(meetings, stats, force, now)
+            
+            logger.info(f"Encontradas {stats['processed']} reuniones sin grabación")
+            logger.info(f"  - Con conference_record_id: {with_conference_id}")
+            logger.info(f"  - Con scheduled_start: {with_scheduled}")
+            logger.info(f"  - Sin scheduled_start (usó created_at): {stats['processed'] - with_scheduled}")
             
             logger.info(f"Sincronización masiva completada: {stats}")
             return stats
@@ -206,7 +266,348 @@ class RecordingSyncService:
             logger.error(f"Error inesperado en sincronización masiva: {e}")
             raise
     
-    def _find_recording_in_drive(self, meeting: Meeting) -> Optional[Dict[str, Any]]:
+    def _sync_chunk(self, meetings: List[Meeting], stats: Dict[str, int],
+                    force: bool = False, now: Optional[datetime] = None) -> None:
+        """
+        Sincroniza un bloque de reuniones de sync_all_recordings y acumula stats.
+        
+        Args:
+            meetings (List[Meeting]): Reuniones del bloque (hasta SYNC_CHUNK_SIZE)
+            stats (dict): Estadísticas de sync_all_recordings (se actualizan)
+            force (bool): Si True, descarta las grabaciones de Conference
+                Records API cacheadas del bloque
+            now (datetime, optional): Instante de referencia (ver _get_search_window)
+        """
+        if force:
+            cache.delete_many([
+                MEET_RECORDING_CACHE_KEY.format(m.conference_record_id)
+                for m in meetings if m.conference_record_id
+            ])
+        
+        # Una sola búsqueda en Drive para todo el bloque; cada reunión se
+        # resuelve contra el índice y solo consulta la API si no aparece
+        recording_index = self._build_recording_index(meetings, now)
+        recording_index = self._find_recordings_in_drive_batch(meetings, recording_index)
+        event_cache = self._fetch_event_cache(meetings)
+        
+        # Los hilos solo consultan las APIs; las grabaciones encontradas
+        # se guardan al final del bloque con upserts en lote
+        pending = []
+        for meeting, defaults, error in self._iter_sync_results(meetings, recording_index, event_cache, now):
+            stats['processed'] += 1
+            if error:
+                stats['errors'] += 1
+                logger.error(f"Error al sincronizar Meeting {meeting.id}: {error}")
+            elif defaults:
+                pending.append((meeting, defaults))
+        
+        created, updated = self._bulk_save_recordings(pending)
+        stats['found'] += len(pending)
+        stats['created'] += created
+        stats['updated'] += updated
+    
+    def _pending_meetings_qs(self, limit: Optional[int] = None) -> models.QuerySet:
+        """
+        Reuniones sin grabación a sincronizar, en orden de prioridad.
+        
+        Criterios:
+        1. No tener grabación asociada (NOT EXISTS, sin JOIN con las grabaciones)
+        2. Tener meet_link (necesario para búsqueda por código de Meet)
+        3. Priorizar reuniones con conference_record_id (más precisas)
+        
+        Args:
+            limit (int, optional): Límite de reuniones
+        
+        Returns:
+            QuerySet: Reuniones anotadas con has_recording=False
+        """
+        queryset = Meeting.objects.annotate(
+            has_recording=Exists(MeetingRecording.objects.filter(meeting=OuterRef('pk')))
+        ).filter(
+            has_recording=False,
+            meet_link__isnull=False  # Requerido para búsqueda por código de Meet
+        ).only(
+            # Solo los campos que usa la sincronización (evita invited_emails, etc.)
+            'id', 'google_event_id', 'conference_record_id', 'meet_link', 'meet_code',
+            'scheduled_start', 'scheduled_end', 'created_at'
+        )
+        
+        # Ordenar: primero las que tienen conference_record_id (prioridad 0), luego las que no (prioridad 1)
+        # Luego ordenar por fecha más reciente (scheduled_start si existe, sino created_at)
+        # alias(): la expresión solo se usa en ORDER BY, no se agrega al SELECT
+        queryset = queryset.alias(
+            has_conference_id=Case(
+                When(conference_record_id__isnull=False, then=0),
+                default=1,
+                output_field=IntegerField()
+            )
+        ).order_by(
+            'has_conference_id',  # 0 primero (tienen conference_record_id), 1 después
+            F('scheduled_start').desc(nulls_last=True),  # Más recientes primero (NULLs al final)
+            '-created_at'  # Fallback si no hay scheduled_start
+        )
+        
+        if limit:
+            queryset = queryset[:limit]
+        return queryset
+    
+    def _iter_sync_results(self, meetings: List[Meeting],
+                           recording_index: Optional[Dict[str, Any]] = None,
+                           event_cache: Optional[Dict[str, Any]] = None,
+                           now: Optional[datetime] = None):
+        """
+        Busca la grabación de cada reunión y produce (meeting, campos, error).
+        
+        El trabajo está dominado por I/O (Drive/Meet API) y es independiente
+        por reunión, así que se reparte en un pool de DRIVE_SYNC_WORKERS
+        hilos. No escribe en la BD: el guardado lo hace _bulk_save_recordings.
+        Con un solo worker se ejecuta en serie en el hilo actual.
+        
+        Args:
+            meetings (List[Meeting]): Reuniones a sincronizar
+            recording_index (dict, optional): Índice de _build_recording_index
+            event_cache (dict, optional): Eventos de _fetch_event_cache
+            now (datetime, optional): Instante de referencia (ver _get_search_window)
+        
+        Yields:
+            tuple: (Meeting, campos de la grabación o None, Exception o None)
+        """
+        def resolve(meeting):
+            if _meeting_has_recording(meeting):
+                return None
+            try:
+                return self._resolve_recording_defaults(meeting, recording_index, event_cache, now)
+            except (GoogleDriveError, GoogleMeetError) as e:
+                # No es crítico, puede que simplemente no haya grabación
+                logger.warning(f"Error de Google API al sincronizar Meeting {meeting.id}: {e}")
+                return None
+        
+        workers = max(1, min(settings.DRIVE_SYNC_WORKERS, len(meetings)))
+        if workers == 1:
+            for meeting in meetings:
+                try:
+                    yield meeting, resolve(meeting), None
+                except Exception as e:
+                    yield meeting, None, e
+            return
+        
+        def sync_one(meeting):
+            try:
+                return resolve(meeting)
+            finally:
+                # Cada hilo del pool abre su propia conexión a la BD
+                connections.close_all()
+        
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='recording-sync'
+        ) as executor:
+            futures = {executor.submit(sync_one, meeting): meeting for meeting in meetings}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], None, e
+    
+    def _get_search_window(self, meeting: Meeting,
+                           now: Optional[datetime] = None) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Calcula el rango de fechas en el que buscar la grabación de una reunión.
+        
+        Usa scheduled_start/scheduled_end si están en el pasado; si no,
+        una ventana alrededor de created_at.
+        
+        Args:
+            meeting (Meeting): Reunión para la cual buscar
+            now (datetime, optional): Instante de referencia; por defecto timezone.now()
+        
+        Returns:
+            tuple: (inicio, fin) del rango, o None si la reunión no tiene fechas
+        """
+        if now is None:
+            now = timezone.now()
+        if meeting.scheduled_start and meeting.scheduled_start <= now:
+            # Si scheduled_start es válido y en el pasado, usarlo
+            search_start = meeting.scheduled_start - timedelta(minutes=5)
+            if meeting.scheduled_end:
+                search_end = meeting.scheduled_end + timedelta(minutes=15)
+            else:
+                search_end = meeting.scheduled_start + timedelta(hours=2)
+            return search_start, search_end
+        if meeting.created_at:
+            # Si scheduled_start es futuro o no existe, usar fecha de creación del meeting
+            # Las grabaciones se crean poco después de que termina la reunión
+            return meeting.created_at - timedelta(hours=1), meeting.created_at + timedelta(hours=2)
+        return None
+    
+    def _build_recording_index(self, meetings: List[Meeting],
+                               now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Precarga en una sola consulta las grabaciones de Drive de un lote de reuniones.
+        
+        Busca en el rango que cubre las ventanas de todas las reuniones y
+        construye un índice por código de Meet y una lista ordenada por
+        createdTime para resolver búsquedas por rango con bisect.
+        
+        Args:
+            meetings (List[Meeting]): Reuniones del lote
+            now (datetime, optional): Instante de referencia (ver _get_search_window)
+        
+        Returns:
+            dict: Índice con las claves:
+                - by_code: {meeting_code: archivo más reciente}
+                - files: archivos ordenados por createdTime ascendente
+                - times: createdTime (UTC, 'YYYY-MM-DDTHH:MM:SS') de cada archivo
+                - complete: True si la consulta no se truncó por el límite
+                - words: {file id: palabras del nombre} para _filter_recordings_by_meeting
+            o None si no hay reuniones con fechas o la búsqueda falla
+        """
+        if now is None:
+            now = timezone.now()
+        windows = [w for w in (self._get_search_window(m, now) for m in meetings) if w]
+        if not windows:
+            return None
+        
+        min_start = min(start for start, _ in windows).astimezone(dt_timezone.utc)
+        max_end = max(end for _, end in windows).astimezone(dt_timezone.utc)
+        limit = min(len(meetings) * 3, DRIVE_PREFETCH_MAX)
+        
+        try:
+            recordings = self.drive_client.search_recordings_by_date_range(
+                min_start,
+                max_end,
+                limit=limit
+            )
+        except GoogleDriveError as e:
+            logger.warning(f"No se pudo precargar grabaciones de Drive: {e}")
+            return None
+        
+        # Drive devuelve createdTime desc: el primero por código es el más reciente
+        by_code = {}
+        for recording in recordings:
+            code = recording.get('name', '').split(' ', 1)[0]
+            if code:
+                by_code.setdefault(code, recording)
+        
+        files = sorted(recordings, key=lambda r: r.get('createdTime', ''))
+        logger.info(f"Precargadas {len(recordings)} grabaciones de Drive para {len(meetings)} reuniones")
+        return {
+            'by_code': by_code,
+            'files': files,
+            'times': [r.get('createdTime', '')[:19] for r in files],
+            'complete': len(recordings) < limit,
+            'words': {
+                r['id']: _name_words(r) for r in recordings if r.get('id')
+            },
+        }
+    
+    def _find_recordings_in_drive_batch(self, meetings: List[Meeting],
+                                        recording_index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Resuelve con batch HTTP las búsquedas por código de Meet y event_id del lote.
+        
+        Las reuniones cuyo código no aparece en el índice precargado se
+        consultan en batches de hasta 100 peticiones (en lugar de una
+        petición por reunión), y las que siguen sin grabación se buscan por
+        event_id de la misma forma. Los resultados se agregan al índice para
+        que _find_recording_in_drive no repita esas consultas.
+        
+        Args:
+            meetings (List[Meeting]): Reuniones del lote
+            recording_index (dict, optional): Índice de _build_recording_index
+        
+        Returns:
+            dict: Índice con las claves adicionales:
+                - searched_codes: códigos ya consultados en Drive
+                - by_event: {event_id: archivo o None} de las búsquedas completadas
+        """
+        if recording_index is None:
+            recording_index = {'by_code': {}, 'files': [], 'times': [], 'complete': False}
+        by_code = recording_index['by_code']
+        
+        # Las reuniones con conference_record_id se resuelven con Conference
+        # Records API; solo van a Drive (una a una) si allí no hay grabación
+        if self.conference_client:
+            meetings = [m for m in meetings if not m.conference_record_id]
+        
+        codes = {}
+        for meeting in meetings:
+            code = self._get_meet_code(meeting)
+            if code and len(code) > 5 and code not in by_code:
+                codes[meeting.id] = code
+        
+        searched_codes = set()
+        if codes:
+            try:
+                found = self.drive_client.search_recordings_by_meeting_codes_bulk(list(codes.values()))
+            except GoogleAPIError as e:
+                logger.warning(f"No se pudo buscar grabaciones por código en batch: {e}")
+                found = {}
+            searched_codes.update(found)
+            by_code.update((code, drive_file) for code, drive_file in found.items() if drive_file)
+        
+        event_ids = [
+            m.google_event_id for m in meetings
+            if m.google_event_id and self._get_meet_code(m) not in by_code
+        ]
+        by_event = {}
+        if event_ids:
+            try:
+                by_event = self.drive_client.search_recordings_by_event_ids_bulk(event_ids)
+            except GoogleAPIError as e:
+                logger.warning(f"No se pudo buscar grabaciones por event_id en batch: {e}")
+        
+        recording_index['searched_codes'] = searched_codes
+        recording_index['by_event'] = by_event
+        return recording_index
+    
+    def _fetch_event_cache(self, meetings: List[Meeting]) -> Optional[Dict[str, Any]]:
+        """
+        Precarga con batch HTTP los eventos de Calendar de un lote de reuniones.
+        
+        _filter_recordings_by_meeting usa el título del evento para elegir
+        entre varias grabaciones; con este caché no consulta Calendar (ni
+        crea un cliente) por cada reunión.
+        
+        Args:
+            meetings (List[Meeting]): Reuniones del lote
+        
+        Returns:
+            dict: {event_id: evento}, o None si no se pudo consultar Calendar
+        """
+        event_ids = [m.google_event_id for m in meetings if m.google_event_id]
+        if not event_ids:
+            return None
+        try:
+            from integrations.google_client import GoogleCalendarClient
+            return GoogleCalendarClient().get_events_bulk(event_ids)
+        except _LOOKUP_ERRORS as e:
+            logger.warning(f"No se pudieron precargar eventos de Calendar: {e}")
+            return None
+    
+    def _get_meet_code(self, meeting: Meeting) -> Optional[str]:
+        """
+        Retorna el código de Meet de la reunión.
+        
+        Usa la columna generada meet_code (calculada por la BD a partir de
+        meet_link); solo parsea meet_link si el enlace no tiene el formato
+        estándar (query string, otro prefijo).
+        
+        Args:
+            meeting (Meeting): Reunión con meet_link
+        
+        Returns:
+            str: Código de Meet (ej: "abc-defg-hij"), o None si no hay enlace válido
+        """
+        meet_code = meeting.meet_code
+        if meet_code and '/' not in meet_code and '?' not in meet_code:
+            return meet_code
+        match = MEET_CODE_RE.search(meeting.meet_link or '')
+        return match.group(1) if match else None
+    
+    def _find_recording_in_drive(self, meeting: Meeting,
+                                 recording_index: Optional[Dict[str, Any]] = None,
+                                 event_cache: Optional[Dict[str, Any]] = None,
+                                 now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """
         Busca grabación en Google Drive para una reunión.
         
@@ -217,8 +618,14 @@ class RecordingSyncService:
         4. Buscar por rango de fechas usando created_at
         5. Filtrar resultados por nombre si hay múltiples
         
+        Con recording_index, las estrategias 1 y 3 se resuelven primero contra
+        el índice precargado y solo se consulta Drive si no hay coincidencia.
+        
         Args:
             meeting (Meeting): Reunión para la cual buscar
+            recording_index (dict, optional): Índice de _build_recording_index
+            event_cache (dict, optional): Eventos de _fetch_event_cache
+            now (datetime, optional): Instante de referencia (ver _get_search_window)
         
         Returns:
             dict: Información del archivo de Drive, o None si no se encuentra
@@ -226,52 +633,50 @@ class RecordingSyncService:
         try:
             # Estrategia 1: Buscar por código de Meet en el nombre (MÁS CONFIABLE)
             # Las grabaciones se guardan como: "{meeting_code} (YYYY-MM-DD HH:MM GMT-5)"
-            if meeting.meet_link:
-                # Extraer código de Meet del link
-                # Formato: https://meet.google.com/{meeting_code} o https://meet.google.com/{meeting_code}?...
-                try:
-                    meeting_code = meeting.meet_link.split('meet.google.com/')[-1].split('?')[0].split('/')[0]
-                    if meeting_code and len(meeting_code) > 5:  # Validar que sea un código válido
-                        logger.info(f"Buscando grabación por código de Meet: {meeting_code}")
-                        drive_file = self.drive_client.search_recording_by_meeting_code(meeting_code)
-                        if drive_file:
-                            logger.info(f"✅ Grabación encontrada por código de Meet para Meeting {meeting.id}")
-                            return drive_file
-                except Exception as e:
-                    logger.debug(f"No se pudo extraer código de Meet: {e}")
+            meeting_code = self._get_meet_code(meeting)
+            if meeting_code:
+                if recording_index and meeting_code in recording_index['by_code']:
+                    logger.info(f"✅ Grabación encontrada en índice precargado para Meeting {meeting.id}")
+                    return recording_index['by_code'][meeting_code]
+                searched = recording_index and meeting_code in recording_index.get('searched_codes', ())
+                if len(meeting_code) > 5 and not searched:  # Validar que sea un código válido
+                    logger.info(f"Buscando grabación por código de Meet: {meeting_code}")
+                    drive_file = self.drive_client.search_recording_by_meeting_code(meeting_code)
+                    if drive_file:
+                        logger.info(f"✅ Grabación encontrada por código de Meet para Meeting {meeting.id}")
+                        return drive_file
             
             # Estrategia 2: Buscar por event_id (poco probable)
             if meeting.google_event_id:
-                drive_file = self.drive_client.search_recording_by_event_id(meeting.google_event_id)
+                by_event = recording_index.get('by_event', {}) if recording_index else {}
+                if meeting.google_event_id in by_event:
+                    drive_file = by_event[meeting.google_event_id]
+                else:
+                    drive_file = self.drive_client.search_recording_by_event_id(meeting.google_event_id)
                 if drive_file:
                     logger.info(f"Grabación encontrada por event_id para Meeting {meeting.id}")
                     return drive_file
             
             # Estrategia 3: Buscar por rango de fechas
-            # Determinar qué fecha usar para la búsqueda
-            if meeting.scheduled_start and meeting.scheduled_start <= timezone.now():
-                # Si scheduled_start es válido y en el pasado, usarlo
-                search_start = meeting.scheduled_start - timedelta(minutes=5)
-                if meeting.scheduled_end:
-                    search_end = meeting.scheduled_end + timedelta(minutes=15)
-                else:
-                    search_end = meeting.scheduled_start + timedelta(hours=2)
-                logger.debug(f"Buscando grabación usando scheduled_start: {search_start} a {search_end}")
-            elif meeting.created_at:
-                # Si scheduled_start es futuro o no existe, usar fecha de creación del meeting
-                # Las grabaciones se crean poco después de que termina la reunión
-                search_start = meeting.created_at - timedelta(hours=1)
-                search_end = meeting.created_at + timedelta(hours=2)
-                logger.info(f"scheduled_start no válido o futuro. Buscando usando created_at: {search_start} a {search_end}")
-            else:
+            window = self._get_search_window(meeting, now)
+            if not window:
                 logger.debug(f"Meeting {meeting.id} no tiene scheduled_start ni created_at, no se puede buscar")
                 return None
+            search_start, search_end = window
+            logger.debug(f"Buscando grabación entre {search_start} y {search_end}")
             
-            recordings = self.drive_client.search_recordings_by_date_range(
-                search_start, 
-                search_end, 
-                limit=20
-            )
+            if recording_index and recording_index['complete']:
+                # El índice cubre todo el rango del lote: bisect en vez de otra consulta
+                times = recording_index['times']
+                lo = bisect.bisect_left(times, search_start.astimezone(dt_timezone.utc).strftime(DRIVE_TIME_FORMAT))
+                hi = bisect.bisect_right(times, search_end.astimezone(dt_timezone.utc).strftime(DRIVE_TIME_FORMAT))
+                recordings = recording_index['files'][lo:hi][::-1][:DRIVE_WINDOW_CANDIDATES]
+            else:
+                recordings = self.drive_client.search_recordings_by_date_range(
+                    search_start, 
+                    search_end, 
+                    limit=DRIVE_WINDOW_CANDIDATES
+                )
             
             if not recordings:
                 logger.debug(f"No se encontraron grabaciones en el rango para Meeting {meeting.id}")
@@ -282,18 +687,17 @@ class RecordingSyncService:
                 logger.debug(f"Múltiples grabaciones encontradas ({len(recordings)}), filtrando...")
                 
                 # Intentar filtrar por código de Meet si está disponible
-                if meeting.meet_link:
-                    try:
-                        meeting_code = meeting.meet_link.split('meet.google.com/')[-1].split('?')[0].split('/')[0]
-                        matching = [r for r in recordings if meeting_code in r.get('name', '')]
-                        if matching:
-                            logger.info(f"Grabación filtrada por código de Meet: {meeting_code}")
-                            return matching[0]
-                    except Exception:
-                        pass
+                if meeting_code:
+                    matching = [r for r in recordings if meeting_code in r.get('name', '')]
+                    if matching:
+                        logger.info(f"Grabación filtrada por código de Meet: {meeting_code}")
+                        return matching[0]
                 
                 # Filtrar por nombre del evento si es posible
-                filtered = self._filter_recordings_by_meeting(recordings, meeting)
+                filtered = self._filter_recordings_by_meeting(
+                    recordings, meeting, event_cache,
+                    recording_words=recording_index.get('words') if recording_index else None
+                )
                 if filtered:
                     return filtered
                 # Si no se puede filtrar, usar la más reciente
@@ -304,15 +708,15 @@ class RecordingSyncService:
             logger.debug(f"Grabación única encontrada para Meeting {meeting.id}")
             return recordings[0]
             
-        except GoogleDriveError as e:
+        except _LOOKUP_ERRORS as e:
             logger.warning(f"Error de Google Drive al buscar grabación: {e}")
             return None
-        except Exception as e:
-            logger.error(f"Error inesperado al buscar grabación: {e}")
-            return None
     
     def _filter_recordings_by_meeting(self, recordings: List[Dict[str, Any]], 
-                                     meeting: Meeting) -> Optional[Dict[str, Any]]:
+                                     meeting: Meeting,
+                                     event_cache: Optional[Dict[str, Any]] = None,
+                                     recording_words: Optional[Dict[str, Set[str]]] = None
+                                     ) -> Optional[Dict[str, Any]]:
         """
         Filtra grabaciones por nombre del evento si es posible.
         
@@ -322,15 +726,25 @@ class RecordingSyncService:
         Args:
             recordings (List[Dict]): Lista de grabaciones encontradas
             meeting (Meeting): Reunión para filtrar
+            event_cache (dict, optional): Eventos precargados {event_id: evento};
+                si se pasa, no se consulta Calendar
+            recording_words (dict, optional): Palabras del nombre por file id
+                (índice 'words' de _build_recording_index); las grabaciones
+                que no aparecen se calculan localmente
         
         Returns:
             dict: Grabación que mejor coincide, o None
         """
         try:
             # Obtener título del evento desde Google Calendar
-            from integrations.google_client import GoogleCalendarClient
-            calendar_client = GoogleCalendarClient()
-            event = calendar_client.get_event(meeting.google_event_id)
+            if event_cache is not None:
+                event = event_cache.get(meeting.google_event_id)
+                if event is None:
+                    return None
+            else:
+                from integrations.google_client import GoogleCalendarClient
+                calendar_client = GoogleCalendarClient()
+                event = calendar_client.get_event(meeting.google_event_id)
             
             event_title = event.get('summary', '').lower()
             if not event_title:
@@ -342,12 +756,16 @@ class RecordingSyncService:
             best_match = None
             best_score = 0
             
+            precomputed = recording_words or {}
             for recording in recordings:
-                recording_name = recording.get('name', '').lower()
-                recording_words = set(recording_name.split())
+                # Con el índice precargado las palabras ya están calculadas;
+                # los dicts de Drive no se modifican (se comparten entre reuniones)
+                words = precomputed.get(recording.get('id'))
+                if words is None:
+                    words = _name_words(recording)
                 
                 # Calcular score: palabras comunes
-                common_words = event_words.intersection(recording_words)
+                common_words = event_words.intersection(words)
                 score = len(common_words)
                 
                 if score > best_score:
@@ -360,7 +778,7 @@ class RecordingSyncService:
             
             return None
             
-        except Exception as e:
+        except _LOOKUP_ERRORS as e:
             logger.debug(f"Error al filtrar por nombre (puede ser normal): {e}")
             return None
     
@@ -381,38 +799,56 @@ class RecordingSyncService:
             if not meeting.conference_record_id or not self.conference_client:
                 return None
             
-            conference_name = f"conferenceRecords/{meeting.conference_record_id}"
-            
-            # Listar grabaciones (solo las listas: FILE_GENERATED)
-            recordings = self.conference_client.list_recordings(
-                conference_name, 
-                only_ready=True
-            )
+            # Una grabación FILE_GENERATED no cambia: se reutiliza entre ejecuciones
+            cache_key = MEET_RECORDING_CACHE_KEY.format(meeting.conference_record_id)
+            recording = cache.get(cache_key)
+            if recording:
+                logger.debug(f"Grabación de Meeting {meeting.id} obtenida de caché")
+                return recording
             
-            if recordings:
-                # Usar la más reciente si hay múltiples
-                # Ordenar por endTime descendente
-                recordings.sort(
-                    key=lambda x: x.get('endTime', ''),
-                    reverse=True
-                )
+            recording = self._latest_conference_recording(meeting.conference_record_id)
+            if recording:
                 logger.info(f"Encontrada grabación desde API para Meeting {meeting.id}")
-                return recordings[0]
+                if recording.get('state') == STATE_READY:
+                    cache.set(cache_key, recording, timeout=settings.MEET_RECORDING_CACHE_TTL)
+                return recording
             
             logger.debug(f"No se encontraron grabaciones listas para Meeting {meeting.id}")
             return None
             
-        except GoogleMeetError as e:
+        except _LOOKUP_ERRORS as e:
             logger.warning(f"Error al obtener grabación desde API: {e}")
             return None
-        except Exception as e:
-            logger.warning(f"Error inesperado al obtener desde API: {e}")
+    
+    def _latest_conference_recording(self, conference_record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna la grabación lista más reciente de una conferencia.
+        
+        No se cachea aquí: las grabaciones listas ya se guardan en la caché de
+        Django (MEET_RECORDING_CACHE_KEY) y en la del cliente de Conference
+        Records, y un "aún no hay grabación" debe volver a consultarse.
+        
+        Args:
+            conference_record_id (str): ID del conference record (sin prefijo)
+        
+        Returns:
+            dict: Datos de la grabación desde API, o None si no hay ninguna lista
+        """
+        # Listar grabaciones (solo las listas: FILE_GENERATED)
+        recordings = self.conference_client.list_recordings(
+            f"conferenceRecords/{conference_record_id}",
+            only_ready=True
+        )
+        if not recordings:
             return None
+        # Usar la más reciente si hay múltiples (sin reordenar la lista,
+        # que puede venir de la caché del cliente)
+        return max(recordings, key=lambda x: x.get('endTime', ''))
     
-    def _create_or_update_recording_from_api(self, meeting: Meeting, 
-                                            recording_data: Dict[str, Any]) -> MeetingRecording:
+    def _recording_defaults_from_api(self, meeting: Meeting,
+                                     recording_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Crea o actualiza grabación desde datos de Conference Records API.
+        Construye los campos de MeetingRecording desde datos de Conference Records API.
         
         Extrae información de:
         - driveDestination.file: fileId directo
@@ -425,60 +861,153 @@ class RecordingSyncService:
             recording_data (dict): Datos de la grabación desde API
         
         Returns:
-            MeetingRecording: Grabación creada o actualizada
+            dict: Campos para MeetingRecording, o None si no hay fileId
         """
-        try:
-            # Extraer driveDestination
-            drive_dest = recording_data.get('driveDestination', {})
-            file_id = drive_dest.get('file')
-            file_url = drive_dest.get('exportUri')
-            
-            if not file_id:
-                logger.warning(f"No se encontró fileId en recording_data para Meeting {meeting.id}")
-                return None
-            
-            # Extraer estado
-            recording_state = recording_data.get('state')
-            
-            # Calcular duración desde timestamps
-            duration_seconds = self._calculate_duration_from_timestamps(
-                recording_data.get('startTime'),
-                recording_data.get('endTime')
-            )
-            
-            # Parsear timestamps
-            recording_start_time = self._parse_timestamp(recording_data.get('startTime'))
-            recording_end_time = self._parse_timestamp(recording_data.get('endTime'))
-            
+        # Extraer driveDestination
+        drive_dest = recording_data.get('driveDestination', {})
+        file_id = drive_dest.get('file')
+        file_url = drive_dest.get('exportUri')
+        
+        if not file_id:
+            logger.warning(f"No se encontró fileId en recording_data para Meeting {meeting.id}")
+            return None
+        
+        # Parsear timestamps (una sola vez; la duración reutiliza los datetimes)
+        recording_start_time = self._parse_timestamp(recording_data.get('startTime'))
+        recording_end_time = self._parse_timestamp(recording_data.get('endTime'))
+        
+        return {
+            'drive_file_id': file_id,
+            'drive_file_url': file_url,
+            'duration_seconds': self._calculate_duration_from_timestamps(
+                recording_start_time,
+                recording_end_time
+            ),
+            'recording_state': recording_data.get('state'),
+            'recording_start_time': recording_start_time,
+            'recording_end_time': recording_end_time,
             # Usar endTime como available_at si está disponible
-            available_at = recording_end_time
-            
-            # Crear o actualizar registro
-            with transaction.atomic():
-                recording, created = MeetingRecording.objects.update_or_create(
-                    meeting=meeting,
-                    defaults={
-                        'drive_file_id': file_id,
-                        'drive_file_url': file_url,
-                        'duration_seconds': duration_seconds,
-                        'recording_state': recording_state,
-                        'recording_start_time': recording_start_time,
-                        'recording_end_time': recording_end_time,
-                        'available_at': available_at,
-                    }
+            'available_at': recording_end_time,
+        }
+    
+    def _recording_defaults_from_drive(self, meeting: Meeting,
+                                       drive_file_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Construye los campos de MeetingRecording desde un archivo de Drive.
+        
+        Args:
+            meeting (Meeting): Reunión asociada
+            drive_file_info (dict): Información del archivo de Drive
+        
+        Returns:
+            dict: Campos para MeetingRecording
+        """
+        file_id = drive_file_info.get('id')
+        
+        # Las búsquedas de Drive ya piden createdTime, webViewLink y
+        # videoMediaMetadata (_FILE_FIELDS): solo se hace un files.get extra
+        # si el archivo viene de otra fuente sin esos campos
+        if all(field in drive_file_info for field in DRIVE_METADATA_FIELDS):
+            metadata = drive_file_info
+        else:
+            metadata = self.drive_client.get_file_metadata(file_id)
+        
+        return {
+            'drive_file_id': file_id,
+            'drive_file_url': metadata.get('webViewLink') or self.drive_client.get_file_url(file_id),
+            'duration_seconds': self._extract_duration_from_metadata(metadata),
+            'available_at': self._extract_available_date(metadata),
+        }
+    
+    def _save_recording(self, meeting: Meeting,
+                        defaults: Dict[str, Any]) -> Tuple[MeetingRecording, bool]:
+        """
+        Crea o actualiza la grabación de una reunión con los campos dados.
+        
+        Args:
+            meeting (Meeting): Reunión asociada
+            defaults (dict): Campos de _recording_defaults_from_api/_drive
+        
+        Returns:
+            tuple: (MeetingRecording creada o actualizada, True si fue creada)
+        """
+        with transaction.atomic():
+            recording, created = MeetingRecording.objects.update_or_create(
+                meeting=meeting,
+                defaults=defaults
+            )
+        
+        action = "creada" if created else "actualizada"
+        logger.info(f"Grabación {action} para Meeting {meeting.id}: {defaults['drive_file_id']}")
+        
+        return recording, created
+    
+    def _bulk_save_recordings(self, pending: List[Tuple[Meeting, Dict[str, Any]]]) -> Tuple[int, int]:
+        """
+        Guarda las grabaciones de un lote con upserts en una sola transacción.
+        
+        Usa bulk_create(update_conflicts=True) sobre la relación única con la
+        reunión, un INSERT por cada conjunto de campos (API o Drive) y cada
+        RECORDING_BULK_BATCH_SIZE filas, en lugar de un update_or_create por
+        reunión.
+        
+        Args:
+            pending (List[Tuple]): Pares (Meeting, campos de la grabación)
+        
+        Returns:
+            tuple: (grabaciones creadas, grabaciones actualizadas)
+        """
+        if not pending:
+            return 0, 0
+        
+        # Las grabaciones desde API y desde Drive actualizan campos distintos
+        groups = {}
+        for meeting, defaults in pending:
+            groups.setdefault(tuple(sorted(defaults)), []).append(
+                MeetingRecording(meeting=meeting, **defaults)
+            )
+        
+        with transaction.atomic():
+            existing = MeetingRecording.objects.filter(
+                meeting_id__in=[meeting.id for meeting, _ in pending]
+            ).count()
+            for fields, recordings in groups.items():
+                MeetingRecording.objects.bulk_create(
+                    recordings,
+                    update_conflicts=True,
+                    unique_fields=['meeting'],
+                    update_fields=list(fields),
+                    batch_size=RECORDING_BULK_BATCH_SIZE
                 )
-                
-                action = "creada" if created else "actualizada"
-                logger.info(f"Grabación {action} desde API para Meeting {meeting.id}: {file_id}")
-                
-                return recording
+        
+        created = len(pending) - existing
+        logger.info(f"Grabaciones guardadas en lote: {created} creadas, {existing} actualizadas")
+        return created, existing
+    
+    def _create_or_update_recording_from_api(self, meeting: Meeting, 
+                                            recording_data: Dict[str, Any]) -> Tuple[Optional[MeetingRecording], bool]:
+        """
+        Crea o actualiza grabación desde datos de Conference Records API.
+        
+        Args:
+            meeting (Meeting): Reunión asociada
+            recording_data (dict): Datos de la grabación desde API
+        
+        Returns:
+            tuple: (MeetingRecording o None si no hay fileId, True si fue creada)
+        """
+        try:
+            defaults = self._recording_defaults_from_api(meeting, recording_data)
+            if not defaults:
+                return None, False
+            return self._save_recording(meeting, defaults)
                 
         except Exception as e:
             logger.error(f"Error al crear/actualizar grabación desde API: {e}")
             raise
     
     def _create_or_update_recording_from_drive(self, meeting: Meeting, 
-                                              drive_file_info: Dict[str, Any]) -> MeetingRecording:
+                                              drive_file_info: Dict[str, Any]) -> Tuple[MeetingRecording, bool]:
         """
         Crea o actualiza grabación desde datos de Drive (método legacy).
         
@@ -487,35 +1016,11 @@ class RecordingSyncService:
             drive_file_info (dict): Información del archivo de Drive
         
         Returns:
-            MeetingRecording: Grabación creada o actualizada
+            tuple: (MeetingRecording creada o actualizada, True si fue creada)
         """
         try:
-            file_id = drive_file_info.get('id')
-            
-            # Obtener metadatos completos del archivo
-            metadata = self.drive_client.get_file_metadata(file_id)
-            
-            # Extraer información
-            duration_seconds = self._extract_duration_from_metadata(metadata)
-            available_at = self._extract_available_date(metadata)
-            file_url = metadata.get('webViewLink') or self.drive_client.get_file_url(file_id)
-            
-            # Crear o actualizar registro
-            with transaction.atomic():
-                recording, created = MeetingRecording.objects.update_or_create(
-                    meeting=meeting,
-                    defaults={
-                        'drive_file_id': file_id,
-                        'drive_file_url': file_url,
-                        'duration_seconds': duration_seconds,
-                        'available_at': available_at,
-                    }
-                )
-                
-                action = "creada" if created else "actualizada"
-                logger.info(f"Grabación {action} desde Drive para Meeting {meeting.id}: {file_id}")
-                
-                return recording
+            defaults = self._recording_defaults_from_drive(meeting, drive_file_info)
+            return self._save_recording(meeting, defaults)
                 
         except Exception as e:
             logger.error(f"Error al crear/actualizar grabación desde Drive: {e}")
@@ -528,50 +1033,8 @@ class RecordingSyncService:
         
         Mantenido para compatibilidad.
         """
-        return self._create_or_update_recording_from_drive(meeting, drive_file_info)
-        """
-        Crea o actualiza un registro de MeetingRecording.
-        
-        Extrae metadatos del archivo de Drive y los guarda en la base de datos.
-        
-        Args:
-            meeting (Meeting): Reunión asociada
-            drive_file_info (dict): Información del archivo de Drive
-        
-        Returns:
-            MeetingRecording: Grabación creada o actualizada
-        """
-        try:
-            file_id = drive_file_info.get('id')
-            
-            # Obtener metadatos completos del archivo
-            metadata = self.drive_client.get_file_metadata(file_id)
-            
-            # Extraer información
-            duration_seconds = self._extract_duration_from_metadata(metadata)
-            available_at = self._extract_available_date(metadata)
-            file_url = metadata.get('webViewLink') or self.drive_client.get_file_url(file_id)
-            
-            # Crear o actualizar registro
-            with transaction.atomic():
-                recording, created = MeetingRecording.objects.update_or_create(
-                    meeting=meeting,
-                    defaults={
-                        'drive_file_id': file_id,
-                        'drive_file_url': file_url,
-                        'duration_seconds': duration_seconds,
-                        'available_at': available_at,
-                    }
-                )
-                
-                action = "creada" if created else "actualizada"
-                logger.info(f"Grabación {action} para Meeting {meeting.id}: {file_id}")
-                
-                return recording
-                
-        except Exception as e:
-            logger.error(f"Error al crear/actualizar grabación: {e}")
-            raise
+        recording, _ = self._create_or_update_recording_from_drive(meeting, drive_file_info)
+        return recording
     
     def _extract_duration_from_metadata(self, metadata: Dict[str, Any]) -> Optional[int]:
         """
@@ -595,7 +1058,7 @@ class RecordingSyncService:
             
             return None
             
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             logger.warning(f"Error al extraer duración: {e}")
             return None
     
@@ -615,9 +1078,9 @@ class RecordingSyncService:
             created_time_str = metadata.get('createdTime')
             
             if created_time_str:
-                # Parsear fecha ISO 8601
+                # Parsear fecha ISO 8601 (fromisoformat acepta el sufijo 'Z')
                 # Formato: "2025-12-26T10:35:00.000Z"
-                created_time = datetime.fromisoformat(created_time_str.replace('Z', '+00:00'))
+                created_time = datetime.fromisoformat(created_time_str)
                 # Convertir a timezone aware si es necesario
                 if timezone.is_naive(created_time):
                     created_time = timezone.make_aware(created_time)
@@ -627,40 +1090,32 @@ class RecordingSyncService:
             
             return None
             
-        except Exception as e:
+        except (AttributeError, ValueError) as e:
             logger.warning(f"Error al extraer fecha de disponibilidad: {e}")
             return None
     
-    def _calculate_duration_from_timestamps(self, start_time: Optional[str], 
-                                           end_time: Optional[str]) -> Optional[int]:
+    def _calculate_duration_from_timestamps(self, start: Optional[datetime], 
+                                           end: Optional[datetime]) -> Optional[int]:
         """
         Calcula duración en segundos desde timestamps de la API.
         
+        Recibe los datetimes ya parseados con _parse_timestamp para no
+        volver a parsear los mismos strings ISO 8601.
+        
         Args:
-            start_time: Timestamp ISO 8601 (ej: "2025-01-15T10:00:00Z")
-            end_time: Timestamp ISO 8601 (ej: "2025-01-15T11:30:00Z")
+            start: Inicio de la grabación (startTime parseado)
+            end: Fin de la grabación (endTime parseado)
         
         Returns:
             int: Duración en segundos, o None si hay error
         """
-        try:
-            if not start_time or not end_time:
-                return None
-            
-            start = self._parse_timestamp(start_time)
-            end = self._parse_timestamp(end_time)
-            
-            if start and end:
-                duration = (end - start).total_seconds()
-                duration_seconds = int(duration)
-                logger.debug(f"Duración calculada desde timestamps: {duration_seconds} segundos")
-                return duration_seconds
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error al calcular duración desde timestamps: {e}")
-            return None
+        if start and end:
+            duration = (end - start).total_seconds()
+            duration_seconds = int(duration)
+            logger.debug(f"Duración calculada desde timestamps: {duration_seconds} segundos")
+            return duration_seconds
+        
+        return None
     
     def _parse_timestamp(self, timestamp_str: Optional[str]) -> Optional[datetime]:
         """
@@ -676,10 +1131,7 @@ class RecordingSyncService:
             if not timestamp_str:
                 return None
             
-            # Reemplazar 'Z' con '+00:00' para compatibilidad con fromisoformat
-            if timestamp_str.endswith('Z'):
-                timestamp_str = timestamp_str[:-1] + '+00:00'
-            
+            # fromisoformat (Python 3.11+) acepta el sufijo 'Z' directamente
             dt = datetime.fromisoformat(timestamp_str)
             
             # Convertir a timezone aware si es necesario
@@ -688,7 +1140,7 @@ class RecordingSyncService:
             
             return dt
             
-        except Exception as e:
+        except (AttributeError, ValueError) as e:
             logger.warning(f"Error al parsear timestamp {timestamp_str}: {e}")
             return None
 
@@ -6,15 +6,55 @@ la lógica de negocio de integración.
 """
 
 import logging
+import re
+import threading
 from datetime import datetime, timedelta
 
+from django.utils.dateparse import parse_datetime
+
 from .google_client import GoogleCalendarClient, format_datetime_for_google
-from .meet_client import GoogleMeetClient
-from .config import validate_google_credentials
+from .meet_client import get_meet_client
+from .config import process_singleton, validate_google_credentials
 from core.exceptions import GoogleMeetCreationError, GoogleCalendarError, GoogleMeetError
 
 logger = logging.getLogger(__name__)
 
+# Fecha (y hora opcional) ISO 8601 que datetime.fromisoformat acepta directamente
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$')
+
+# Duración y antelación por defecto de las reuniones sin fechas
+_ONE_HOUR = timedelta(hours=1)
+
+# Descripción por defecto de los eventos de Calendar
+_DESC_TMPL = "Reunión organizada por {org}\n\nParticipantes:\n{list}"
+
+
+def _parse_dt(value):
+    """
+    Convierte un string ISO 8601 a datetime.
+    
+    Si el string tiene el formato habitual de la API (_ISO_RE, incluido el
+    sufijo 'Z') usa datetime.fromisoformat, implementado en C; solo los
+    demás formatos pasan por parse_datetime de Django. Así el caso común no
+    paga el costo de lanzar y capturar una excepción.
+    
+    Args:
+        value (str): Fecha/hora en formato ISO 8601
+    
+    Returns:
+        datetime: Fecha parseada, o None si el formato no es válido
+    """
+    if _ISO_RE.match(value):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            # Bien formado pero fuera de rango (ej: mes 13)
+            return None
+    try:
+        return parse_datetime(value)
+    except (ValueError, TypeError):
+        return None
+
 
 class GoogleMeetService:
     """
@@ -28,28 +68,98 @@ class GoogleMeetService:
     """
     
     def __init__(self):
-        """Inicializa el servicio con los clientes de Calendar y Meet."""
-        # Inicializar Calendar client solo si Google está configurado
-        self.calendar_client = None
-        try:
-            if validate_google_credentials(raise_exception=False):
-        self.calendar_client = GoogleCalendarClient()
-            else:
-                logger.warning("Google Calendar Client no disponible (credenciales no configuradas)")
-        except Exception as e:
-            logger.warning(f"No se pudo inicializar Google Calendar Client: {e}")
-            self.calendar_client = None
+        """
+        Inicializa el servicio sin construir los clientes de Calendar y Meet.
         
-        # Inicializar Meet client solo si Google está configurado
+        Cada cliente se construye en su primer uso (ver calendar_client y
+        meet_client): un flujo que solo consulta Calendar no paga la
+        autenticación ni el discovery de Meet, y viceversa.
+        """
+        self._credentials_ok = None
+        self._calendar_client = None
+        self._calendar_client_loaded = False
+        self._meet_client = None
+        self._meet_client_loaded = False
+        self._clients_lock = threading.Lock()
+    
+    def _google_configured(self):
+        """
+        Valida las credenciales de Google.
+        
+        Solo se recuerda el resultado positivo: si el archivo aún no está
+        disponible (por ejemplo, el volumen se monta después del arranque)
+        se vuelve a validar en el siguiente acceso.
+        """
+        if not self._credentials_ok:
+            self._credentials_ok = validate_google_credentials(raise_exception=False)
+        return self._credentials_ok
+    
+    def _build_client(self, client_class, name):
+        """
+        Construye un cliente de Google, o retorna None si no es posible.
+        
+        El fallo no se recuerda: la instancia es la compartida del proceso
+        (get_meet_service), así que un error transitorio al construir no debe
+        dejar el cliente en None durante toda la vida del worker.
+        
+        Args:
+            client_class: GoogleCalendarClient, o get_meet_client (cliente
+                de Meet compartido del proceso)
+            name (str): Nombre del cliente para los logs
+        
+        Returns:
+            Cliente construido, o None
+        """
+        if not self._google_configured():
+            logger.warning("%s no disponible (credenciales no configuradas)", name)
+            return None
         try:
-            if validate_google_credentials(raise_exception=False):
-                self.meet_client = GoogleMeetClient()
-            else:
-                self.meet_client = None
-                logger.warning("Google Meet Client no disponible (credenciales no configuradas)")
+            return client_class()
         except Exception as e:
-            logger.warning(f"No se pudo inicializar Google Meet Client: {e}")
-            self.meet_client = None
+            logger.warning("No se pudo inicializar %s: %s", name, e)
+            return None
+    
+    @property
+    def calendar_client(self):
+        """
+        Cliente de Google Calendar, construido en el primer acceso con éxito.
+        
+        Returns:
+            GoogleCalendarClient: Cliente, o None si Google no está configurado
+                o la inicialización falló (se reintenta en el siguiente acceso)
+        """
+        if not self._calendar_client_loaded:
+            with self._clients_lock:
+                if not self._calendar_client_loaded:
+                    self._calendar_client = self._build_client(GoogleCalendarClient, "Google Calendar Client")
+                    self._calendar_client_loaded = self._calendar_client is not None
+        return self._calendar_client
+    
+    @calendar_client.setter
+    def calendar_client(self, client):
+        self._calendar_client = client
+        self._calendar_client_loaded = True
+    
+    @property
+    def meet_client(self):
+        """
+        Cliente de Google Meet, construido en el primer acceso con éxito.
+        
+        Returns:
+            GoogleMeetClient: Cliente, o None si Google no está configurado
+                o la inicialización falló (se reintenta en el siguiente acceso)
+        """
+        if not self._meet_client_loaded:
+            with self._clients_lock:
+                if not self._meet_client_loaded:
+                    self._meet_client = self._build_client(get_meet_client, "Google Meet Client")
+                    self._meet_client_loaded = self._meet_client is not None
+        return self._meet_client
+    
+    @meet_client.setter
+    def meet_client(self, client):
+        self._meet_client = client
+        self._meet_client_loaded = True
     
     def create_meeting_event(self, organizer_email, invited_emails,
                             scheduled_start=None, scheduled_end=None,
@@ -89,156 +199,253 @@ class GoogleMeetService:
             GoogleMeetCreationError: Si no se puede crear la reunión
         """
         try:
-            # Convertir fechas de string ISO a datetime si es necesario
-            if scheduled_start and isinstance(scheduled_start, str):
-                try:
-                    from django.utils.dateparse import parse_datetime
-                    scheduled_start = parse_datetime(scheduled_start)
-                except:
-                    try:
-                        scheduled_start = datetime.fromisoformat(scheduled_start.replace('Z', '+00:00'))
-                    except:
-                        pass
-            
-            if scheduled_end and isinstance(scheduled_end, str):
-                try:
-                    from django.utils.dateparse import parse_datetime
-                    scheduled_end = parse_datetime(scheduled_end)
-                except:
-                    try:
-                        scheduled_end = datetime.fromisoformat(scheduled_end.replace('Z', '+00:00'))
-                    except:
-                        pass
-            
-            # Generar título por defecto si no se proporciona
-            if not title:
-                if scheduled_start:
-                    if isinstance(scheduled_start, datetime):
-                    title = f"Reunión - {scheduled_start.strftime('%d/%m/%Y %H:%M')}"
-                    else:
-                        title = "Reunión de videollamada"
-                else:
-                    title = "Reunión de videollamada"
-            
-            # Si no hay fechas, usar fecha actual + 1 hora de duración
-            if not scheduled_start:
-                scheduled_start = datetime.now() + timedelta(hours=1)
-            
-            if not scheduled_end:
-                scheduled_end = scheduled_start + timedelta(hours=1)
-            
-            # Construir lista de asistentes
-            attendees = [{'email': email} for email in invited_emails]
-            
-            # NUEVO FLUJO: Crear espacio PRIMERO con acceso público y grabación automática
-            # REQUISITO DE NEGOCIO: Todos los eventos con Calendar deben tener:
-            # - Acceso público (public_access=True)
-            # - Grabación automática (auto_record=True)
-            # Esto permite inyectar el link en la descripción ANTES de crear el evento
-            meeting_uri = None
-            space_name = None
-            recording_enabled = False
-            use_description_with_link = False  # Flag para indicar si usar descripción con link
-            
-            # Para eventos con Calendar, SIEMPRE crear espacio con ambos habilitados
-            if self.meet_client:
-                try:
-                    logger.info("Creando espacio directamente con Meet API (antes de crear evento)...")
-                    logger.info("  Configuración: auto_record=True, public_access=True (requisito de negocio)")
-                    space = self.meet_client.create_space(
-                        auto_recording=True,  # SIEMPRE habilitado para eventos con Calendar
-                        public_access=True   # SIEMPRE habilitado para eventos con Calendar
-                    )
-                    
-                    meeting_uri = space.get('meetingUri')
-                    space_name = space.get('name')
-                    
-                    if meeting_uri:
-                        logger.info(f"Espacio creado exitosamente: {space_name}")
-                        logger.info(f"Meeting URI: {meeting_uri}")
-                        recording_enabled = True  # SIEMPRE habilitado para eventos con Calendar
-                        use_description_with_link = True  # Usar descripción con link en lugar de conferenceData
-                        
-                        # Verificar configuración del espacio creado
-                        config = space.get('config', {})
-                        access_type = config.get('accessType', 'N/A')
-                        artifact_config = config.get('artifactConfig', {})
-                        recording_config = artifact_config.get('recordingConfig', {})
-                        auto_recording = recording_config.get('autoRecordingGeneration', 'N/A')
-                        
-                        logger.info(f"  Verificación de configuración:")
-                        logger.info(f"    - accessType: {access_type} (esperado: OPEN)")
-                        logger.info(f"    - autoRecordingGeneration: {auto_recording} (esperado: ON)")
-                        
-                        if access_type != 'OPEN':
-                            logger.warning(f"  ⚠️  PROBLEMA: accessType={access_type}, esperado OPEN")
-                        if auto_recording != 'ON':
-                            logger.warning(f"  ⚠️  PROBLEMA: autoRecordingGeneration={auto_recording}, esperado ON")
-                    else:
-                        logger.warning("Espacio creado pero no se obtuvo meetingUri")
-                        
-                except Exception as e:
-                    logger.warning(f"Error al crear espacio directamente: {e}")
-                    logger.warning("Continuando con creación de evento sin espacio pre-creado")
-                    # Continuar sin espacio pre-creado (fallback al comportamiento original)
-            
-            # Construir descripción (con link si tenemos meeting_uri)
-            if not description:
-                description = (
-                    f"Reunión organizada por {organizer_email}\n\n"
-                    f"Participantes:\n" +
-                    "\n".join([f"- {email}" for email in invited_emails])
-                )
-            
-            # Inyectar link de Meet en la descripción si tenemos meeting_uri
-            if meeting_uri and use_description_with_link:
-                description += f"\n\n🔗 Unirse a la reunión: {meeting_uri}"
-                logger.info(f"Link de Meet agregado a la descripción: {meeting_uri}")
-            
-            # Construir datos del evento para Google Calendar
-            event_data = {
-                'summary': title,
-                'description': description,
-                'start': format_datetime_for_google(scheduled_start),
-                'end': format_datetime_for_google(scheduled_end),
-                'attendees': attendees,
-                'guestsCanModify': False,
-                'guestsCanInviteOthers': False,
-                'guestsCanSeeOtherGuests': True,
-            }
+            prepared = self._prepare_meeting_event(
+                organizer_email, invited_emails,
+                scheduled_start=scheduled_start, scheduled_end=scheduled_end,
+                title=title, description=description
+            )
+            use_description_with_link = prepared['use_description_with_link']
             
-            logger.info(f"Creando evento de Google Meet para: {organizer_email}")
+            logger.info("Creando evento de Google Meet para: %s", organizer_email)
             
             # Crear evento usando el cliente
             # Si use_description_with_link=True, crear sin conferenceData (el link está en la descripción)
             # Si use_description_with_link=False, usar comportamiento original (conferenceData)
             result = self.calendar_client.create_event(
-                event_data, 
-                existing_meet_uri=None if use_description_with_link else meeting_uri,
+                prepared['event_data'], 
+                existing_meet_uri=None if use_description_with_link else prepared['meeting_uri'],
                 use_description_only=use_description_with_link
             )
             
-            logger.info(f"Evento creado exitosamente: {result['event_id']}")
+            logger.info("Evento creado exitosamente: %s", result['event_id'])
             
-            # Si usamos descripción con link, asegurar que meet_link esté en el resultado
-            if use_description_with_link and meeting_uri:
-                result['meet_link'] = meeting_uri
-                logger.info(f"Meet link desde espacio pre-creado: {meeting_uri}")
+            return self._complete_event_result(result, prepared)
             
-            result['recording_enabled'] = recording_enabled
-            if space_name:
-                result['space_name'] = space_name
+        except GoogleCalendarError as e:
+            logger.error("Error de Google Calendar: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Error inesperado al crear reunión: %s", e)
+            raise GoogleMeetCreationError(
+                f"Error al crear reunión de Google Meet: {str(e)}"
+            )
+    
+    def create_meeting_events_bulk(self, meetings):
+        """
+        Crea varios eventos de reunión con Google Meet.
+        
+        Cada reunión se prepara como en create_meeting_event (incluida la
+        creación del espacio de Meet), pero los eventos de Calendar se
+        insertan con batch HTTP: una petición por cada 50 eventos, que es
+        el máximo recomendado por Calendar API (CALENDAR_BATCH_MAX).
+        
+        Args:
+            meetings (list): Argumentos de create_meeting_event por reunión
+                [{'organizer_email': ..., 'invited_emails': [...], 'scheduled_start': ..., ...}, ...]
+        
+        Returns:
+            list: Datos de cada evento creado (mismo formato que create_meeting_event)
+                o None si ese evento falló, en el mismo orden que meetings
+        
+        Raises:
+            GoogleMeetCreationError: Si no se puede preparar o enviar el lote
+        """
+        try:
+            prepared_list = [
+                self._prepare_meeting_event(
+                    meeting['organizer_email'], meeting.get('invited_emails', []),
+                    scheduled_start=meeting.get('scheduled_start'),
+                    scheduled_end=meeting.get('scheduled_end'),
+                    title=meeting.get('title'),
+                    description=meeting.get('description')
+                )
+                for meeting in meetings
+            ]
+            
+            logger.info("Creando %s eventos de Google Meet en batch", len(prepared_list))
+            
+            results = self.calendar_client.create_events_bulk([
+                {
+                    'event_data': prepared['event_data'],
+                    'existing_meet_uri': None if prepared['use_description_with_link'] else prepared['meeting_uri'],
+                    'use_description_only': prepared['use_description_with_link'],
+                }
+                for prepared in prepared_list
+            ])
             
-            return result
+            return [
+                self._complete_event_result(result, prepared) if result else None
+                for result, prepared in zip(results, prepared_list)
+            ]
             
         except GoogleCalendarError as e:
-            logger.error(f"Error de Google Calendar: {e}")
+            logger.error("Error de Google Calendar: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error inesperado al crear reunión: {e}")
+            logger.error("Error inesperado al crear reuniones en batch: %s", e)
             raise GoogleMeetCreationError(
-                f"Error al crear reunión de Google Meet: {str(e)}"
+                f"Error al crear reuniones de Google Meet: {str(e)}"
+            )
+    
+    def _prepare_meeting_event(self, organizer_email, invited_emails,
+                               scheduled_start=None, scheduled_end=None,
+                               title=None, description=None):
+        """
+        Prepara los datos del evento de Calendar de una reunión.
+        
+        Crea antes el espacio de Meet (si el cliente está disponible) para
+        inyectar su link en la descripción (ver create_meeting_event).
+        
+        Args:
+            organizer_email (str): Email del organizador
+            invited_emails (list): Lista de emails de invitados
+            scheduled_start (datetime|str, optional): Fecha/hora de inicio
+            scheduled_end (datetime|str, optional): Fecha/hora de fin
+            title (str, optional): Título personalizado del evento
+            description (str, optional): Descripción del evento
+        
+        Returns:
+            dict: Datos preparados
+                - event_data: Cuerpo del evento para Google Calendar
+                - meeting_uri: URI del espacio pre-creado, o None
+                - space_name: Nombre del espacio pre-creado, o None
+                - recording_enabled: True si el espacio tiene grabación automática
+                - use_description_with_link: True si el link va en la descripción
+        """
+        # Convertir fechas de string ISO a datetime si es necesario
+        if scheduled_start and isinstance(scheduled_start, str):
+            scheduled_start = _parse_dt(scheduled_start)
+        
+        if scheduled_end and isinstance(scheduled_end, str):
+            scheduled_end = _parse_dt(scheduled_end)
+        
+        # Generar título por defecto si no se proporciona
+        if not title:
+            if scheduled_start:
+                if isinstance(scheduled_start, datetime):
+                    title = f"Reunión - {scheduled_start:%d/%m/%Y %H:%M}"
+                else:
+                    title = "Reunión de videollamada"
+            else:
+                title = "Reunión de videollamada"
+        
+        # Si no hay fechas, usar fecha actual + 1 hora de duración
+        scheduled_start = scheduled_start or (datetime.now() + _ONE_HOUR)
+        scheduled_end = scheduled_end or (scheduled_start + _ONE_HOUR)
+        
+        # NUEVO FLUJO: Crear espacio PRIMERO con acceso público y grabación automática
+        # REQUISITO DE NEGOCIO: Todos los eventos con Calendar deben tener:
+        # - Acceso público (public_access=True)
+        # - Grabación automática (auto_record=True)
+        # Esto permite inyectar el link en la descripción ANTES de crear el evento
+        meeting_uri = None
+        space_name = None
+        recording_enabled = False
+        use_description_with_link = False  # Flag para indicar si usar descripción con link
+        
+        # Para eventos con Calendar, SIEMPRE crear espacio con ambos habilitados
+        if self.meet_client:
+            try:
+                logger.info("Creando espacio directamente con Meet API (antes de crear evento)...")
+                logger.info("  Configuración: auto_record=True, public_access=True (requisito de negocio)")
+                space = self.meet_client.create_space(
+                    auto_recording=True,  # SIEMPRE habilitado para eventos con Calendar
+                    public_access=True   # SIEMPRE habilitado para eventos con Calendar
+                )
+                
+                meeting_uri = space.get('meetingUri')
+                space_name = space.get('name')
+                
+                if meeting_uri:
+                    logger.info("Espacio creado exitosamente: %s", space_name)
+                    logger.info("Meeting URI: %s", meeting_uri)
+                    recording_enabled = True  # SIEMPRE habilitado para eventos con Calendar
+                    use_description_with_link = True  # Usar descripción con link en lugar de conferenceData
+                    
+                    # Verificar configuración del espacio creado
+                    config = space.get('config', {})
+                    access_type = config.get('accessType', 'N/A')
+                    try:
+                        auto_recording = config['artifactConfig']['recordingConfig']['autoRecordingGeneration']
+                    except KeyError:
+                        auto_recording = 'N/A'
+                    
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("  Verificación de configuración:")
+                        logger.info("    - accessType: %s (esperado: OPEN)", access_type)
+                        logger.info("    - autoRecordingGeneration: %s (esperado: ON)", auto_recording)
+                    
+                    if access_type != 'OPEN':
+                        logger.warning("  ⚠️  PROBLEMA: accessType=%s, esperado OPEN", access_type)
+                    if auto_recording != 'ON':
+                        logger.warning("  ⚠️  PROBLEMA: autoRecordingGeneration=%s, esperado ON", auto_recording)
+                else:
+                    logger.warning("Espacio creado pero no se obtuvo meetingUri")
+                    
+            except Exception as e:
+                logger.warning("Error al crear espacio directamente: %s", e)
+                logger.warning("Continuando con creación de evento sin espacio pre-creado")
+                # Continuar sin espacio pre-creado (fallback al comportamiento original)
+        
+        # Construir descripción (con link si tenemos meeting_uri)
+        if not description:
+            description = _DESC_TMPL.format(
+                org=organizer_email,
+                # Un solo join sin formatear cada email (sin invitados: lista vacía)
+                list="- " + "\n- ".join(invited_emails) if invited_emails else ""
             )
+        
+        # Inyectar link de Meet en la descripción si tenemos meeting_uri
+        if meeting_uri and use_description_with_link:
+            description += f"\n\n🔗 Unirse a la reunión: {meeting_uri}"
+            logger.info("Link de Meet agregado a la descripción: %s", meeting_uri)
+        
+        # Construir lista de asistentes (después de crear el espacio, que puede fallar)
+        attendees = [{'email': email} for email in invited_emails]
+        
+        # Construir datos del evento para Google Calendar
+        event_data = {
+            'summary': title,
+            'description': description,
+            'start': format_datetime_for_google(scheduled_start),
+            'end': format_datetime_for_google(scheduled_end),
+            'attendees': attendees,
+            'guestsCanModify': False,
+            'guestsCanInviteOthers': False,
+            'guestsCanSeeOtherGuests': True,
+        }
+        
+        return {
+            'event_data': event_data,
+            'meeting_uri': meeting_uri,
+            'space_name': space_name,
+            'recording_enabled': recording_enabled,
+            'use_description_with_link': use_description_with_link,
+        }
+    
+    def _complete_event_result(self, result, prepared):
+        """
+        Completa el resultado de create_event con los datos del espacio pre-creado.
+        
+        Args:
+            result (dict): Resultado de GoogleCalendarClient.create_event
+            prepared (dict): Datos de _prepare_meeting_event
+        
+        Returns:
+            dict: result con meet_link, recording_enabled y space_name
+        """
+        meeting_uri = prepared['meeting_uri']
+        
+        # Si usamos descripción con link, asegurar que meet_link esté en el resultado
+        if prepared['use_description_with_link'] and meeting_uri:
+            result['meet_link'] = meeting_uri
+            logger.info("Meet link desde espacio pre-creado: %s", meeting_uri)
+        
+        result['recording_enabled'] = prepared['recording_enabled']
+        if prepared['space_name']:
+            result['space_name'] = prepared['space_name']
+        
+        return result
     
     def create_meeting_space_only(self, auto_record=False, 
                                   invited_emails=None,
@@ -274,7 +481,7 @@ class GoogleMeetService:
             
             # 1. Crear espacio con grabación automática y configuración de acceso
             logger.info("Creando espacio de Meet sin Calendar...")
-            logger.info(f"  Parámetros recibidos: auto_record={auto_record}, public_access={public_access}")
+            logger.info("  Parámetros recibidos: auto_record=%s, public_access=%s", auto_record, public_access)
             space = self.meet_client.create_space(
                 auto_recording=auto_record,
                 public_access=public_access
@@ -283,9 +490,9 @@ class GoogleMeetService:
             # Verificar configuración del espacio creado
             config = space.get('config', {})
             access_type = config.get('accessType', 'N/A')
-            logger.info(f"  Espacio creado con accessType: {access_type}")
+            logger.info("  Espacio creado con accessType: %s", access_type)
             if access_type != 'OPEN' and public_access:
-                logger.warning(f"  ⚠️  PROBLEMA: Se solicitó public_access=True pero el espacio tiene accessType={access_type}")
+                logger.warning("  ⚠️  PROBLEMA: Se solicitó public_access=True pero el espacio tiene accessType=%s", access_type)
             
             meeting_uri = space.get('meetingUri')
             space_name = space.get('name')
@@ -293,46 +500,37 @@ class GoogleMeetService:
             if not meeting_uri or not space_name:
                 raise GoogleMeetError("No se pudo obtener meetingUri o space_name del espacio creado")
             
-            logger.info(f"Espacio creado: {space_name}, URI: {meeting_uri}")
+            logger.info("Espacio creado: %s, URI: %s", space_name, meeting_uri)
             
             # 2. Agregar miembros para acceso directo (solo si NO es acceso público y v2beta está disponible)
             members_added = 0
             
             if not public_access:
                 # Solo agregar miembros si NO es acceso público
-                all_emails = []
-                
-                # Agregar organizador si se proporciona
-                if organizer_email:
-                    all_emails.append(organizer_email)
-                
-                # Agregar invitados
-                if invited_emails:
-                    all_emails.extend(invited_emails)
-                
-                # Eliminar duplicados manteniendo orden
-                seen = set()
-                unique_emails = []
-                for email in all_emails:
-                    if email not in seen:
-                        seen.add(email)
-                        unique_emails.append(email)
+                # Organizador (si se proporciona) e invitados, sin duplicados y manteniendo orden
+                unique_emails = list(dict.fromkeys(filter(None, [organizer_email, *(invited_emails or [])])))
                 
                 # Intentar agregar miembros solo si v2beta está disponible
                 if self.meet_client.service_v2beta:
-                    # Agregar cada miembro
-                    for email in unique_emails:
+                    # Organizador como COHOST
+                    if organizer_email:
                         try:
-                            # Organizador como COHOST, otros como ATTENDEE
-                            role = 'COHOST' if email == organizer_email else 'ATTENDEE'
-                            self.meet_client.add_space_member(space_name, email, role)
+                            self.meet_client.add_space_member(space_name, organizer_email, 'COHOST')
                             members_added += 1
-                            logger.info(f"Miembro agregado: {email} con rol {role}")
+                            logger.info("Miembro agregado: %s con rol COHOST", organizer_email)
                         except Exception as e:
-                            logger.warning(f"No se pudo agregar miembro {email}: {e}")
+                            logger.warning("No se pudo agregar miembro %s: %s", organizer_email, e)
                             # Continuar con los demás miembros aunque uno falle
                     
-                    logger.info(f"Espacio creado con {members_added} miembros agregados")
+                    # Invitados como ATTENDEE en batch (un round trip por cada MEET_BATCH_MAX)
+                    # (add_space_members maneja los errores por miembro)
+                    attendee_emails = [email for email in unique_emails if email != organizer_email]
+                    if attendee_emails:
+                        members_added += len(
+                            self.meet_client.add_space_members(space_name, attendee_emails, 'ATTENDEE')
+                        )
+                    
+                    logger.info("Espacio creado con %s miembros agregados", members_added)
                 else:
                     logger.warning(
                         "⚠️  API v2beta no está disponible. Los miembros NO se agregaron automáticamente. "
@@ -353,7 +551,7 @@ class GoogleMeetService:
         except GoogleMeetError:
             raise
         except Exception as e:
-            logger.error(f"Error inesperado al crear espacio sin Calendar: {e}")
+            logger.error("Error inesperado al crear espacio sin Calendar: %s", e)
             raise GoogleMeetError(
                 f"Error al crear espacio: {str(e)}"
             )
@@ -372,7 +570,7 @@ class GoogleMeetService:
         try:
             return self.calendar_client.update_event(event_id, updates)
         except Exception as e:
-            logger.error(f"Error al actualizar evento: {e}")
+            logger.error("Error al actualizar evento: %s", e)
             raise GoogleCalendarError(f"Error al actualizar evento: {e}")
     
     def cancel_meeting_event(self, event_id):
@@ -388,7 +586,7 @@ class GoogleMeetService:
         try:
             return self.calendar_client.cancel_event(event_id)
         except Exception as e:
-            logger.error(f"Error al cancelar evento: {e}")
+            logger.error("Error al cancelar evento: %s", e)
             raise GoogleCalendarError(f"Error al cancelar evento: {e}")
     
     def delete_meeting_event(self, event_id):
@@ -404,7 +602,7 @@ class GoogleMeetService:
         try:
             return self.calendar_client.delete_event(event_id)
         except Exception as e:
-            logger.error(f"Error al eliminar evento: {e}")
+            logger.error("Error al eliminar evento: %s", e)
             raise GoogleCalendarError(f"Error al eliminar evento: {e}")
     
     def get_meeting_event(self, event_id):
@@ -420,5 +618,20 @@ class GoogleMeetService:
         try:
             return self.calendar_client.get_event(event_id)
         except Exception as e:
-            logger.error(f"Error al obtener evento: {e}")
+            logger.error("Error al obtener evento: %s", e)
             raise GoogleCalendarError(f"Error al obtener evento: {e}")
+
+
+@process_singleton
+def get_meet_service():
+    """
+    Retorna la instancia compartida de GoogleMeetService del proceso.
+    
+    Se construye de forma perezosa en la primera llamada; así los clientes
+    de Calendar y Meet (credenciales, documentos de discovery y conexiones
+    HTTP) se reutilizan entre peticiones en lugar de crearse en cada una.
+    
+    Returns:
+        GoogleMeetService: Servicio compartido
+    """
+    return GoogleMeetService()
@@ -0,0 +1,142 @@
+"""
+Dobles de prueba compartidos por los tests de integraciones.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from integrations.google_client import GoogleCalendarClient
+
+
+def make_fake_drive(list_response=None, get_response=None,
+                    list_side_effect=None, get_side_effect=None, list_pages=None):
+    """
+    Construye un servicio de Drive API falso ya cableado.
+    
+    files().list(...).execute() y files().get(...).execute() retornan las
+    respuestas dadas (o lanzan los side effects), sin armar la cadena de
+    Mocks en cada test.
+    
+    Args:
+        list_response (dict, optional): Respuesta de files().list().execute()
+        get_response (dict, optional): Respuesta de files().get().execute()
+        list_side_effect (Exception, optional): Error de files().list().execute()
+        get_side_effect (Exception, optional): Error de files().get().execute()
+        list_pages (list, optional): Respuestas sucesivas de files().list();
+            list_next avanza mientras la página tenga nextPageToken
+    
+    Returns:
+        Mock: Servicio con files() preconfigurado; las llamadas se consultan
+            en service.files.return_value.list / .get
+    """
+    service = Mock()
+    files = service.files.return_value
+    files.list.return_value.execute.return_value = (
+        list_response if list_response is not None else {'files': []}
+    )
+    files.list.return_value.execute.side_effect = list_pages or list_side_effect
+    files.list_next.side_effect = (
+        lambda request, response: request if response.get('nextPageToken') else None
+    )
+    files.get.return_value.execute.return_value = get_response
+    files.get.return_value.execute.side_effect = get_side_effect
+    return service
+
+
+class FakeBatch:
+    """
+    BatchHttpRequest falso: execute() invoca el callback por cada petición.
+    
+    respond(request_id, request) da la respuesta de cada sub-petición; si
+    lanza, la excepción se entrega al callback como fallo de esa petición.
+    Con reverse=True las respuestas llegan en orden inverso, como puede
+    ocurrir en un batch real.
+    """
+    
+    def __init__(self, callback, respond, reverse=False):
+        self.callback = callback
+        self.respond = respond
+        self.reverse = reverse
+        self.requests = []
+    
+    def add(self, request, callback=None, request_id=None):
+        if request_id is None:
+            # Mismo esquema que googleapiclient: ids secuenciales desde 1
+            request_id = str(len(self.requests) + 1)
+        self.requests.append((request_id, request))
+    
+    def execute(self):
+        requests = reversed(self.requests) if self.reverse else self.requests
+        for request_id, request in requests:
+            try:
+                response = self.respond(request_id, request)
+            except Exception as error:
+                self.callback(request_id, None, error)
+            else:
+                self.callback(request_id, response, None)
+
+
+def make_fake_batch_service(respond, reverse=False):
+    """
+    Construye un servicio falso cuyo new_batch_http_request retorna FakeBatch.
+    
+    Args:
+        respond (callable): respond(request_id, request) -> respuesta o excepción
+        reverse (bool): Si True, cada batch responde en orden inverso
+    
+    Returns:
+        Mock: Servicio con new_batch_http_request cableado; los batches
+            creados quedan en service.batches
+    """
+    service = Mock()
+    service.batches = []
+    
+    def new_batch_http_request(callback=None):
+        batch = FakeBatch(callback, respond, reverse)
+        service.batches.append(batch)
+        return batch
+    
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    return service
+
+
+def make_fake_calendar_client(respond, reverse=True):
+    """
+    Construye un GoogleCalendarClient sin credenciales con Calendar falso.
+    
+    events().insert(**params) retorna un objeto con los parámetros, y los
+    batches responden en orden inverso para ejercitar el mapeo por request_id.
+    
+    Args:
+        respond (callable): respond(request_id, request) -> evento o excepción
+        reverse (bool): Si True, cada batch responde en orden inverso
+    
+    Returns:
+        GoogleCalendarClient: Cliente cuyo service es el de make_fake_batch_service
+    """
+    client = GoogleCalendarClient.__new__(GoogleCalendarClient)
+    client.config = Mock(calendar_id='primary')
+    client.service = make_fake_batch_service(respond, reverse=reverse)
+    client.service.events.return_value.insert.side_effect = (
+        lambda **params: SimpleNamespace(**params)
+    )
+    return client
+
+
+def echo_event(request_id, request):
+    """
+    Responde cada insert con un evento cuyo id refleja el summary.
+    
+    Los summaries que empiezan con 'fail' responden con HttpError 400.
+    """
+    summary = request.body['summary']
+    if summary.startswith('fail'):
+        raise HttpError(httplib2.Response({'status': 400}), b'')
+    return {
+        'id': f'evt-{summary}',
+        'hangoutLink': f'https://meet.google.com/{summary}',
+        'htmlLink': f'https://calendar.google.com/{summary}',
+    }
@@ -15,6 +15,21 @@ from django.utils import timezone
 
 from integrations.drive_client import GoogleDriveClient
 from integrations.config import validate_google_credentials
+from integrations.tests.fakes import make_fake_drive
+
+# Archivo de grabación de ejemplo (compartido; los tests no lo modifican)
+MOCK_FILE = {
+    'id': 'test_file_id_123',
+    'name': 'Reunión de Google Meet - 2025-12-26T15:00:00Z.mp4',
+    'mimeType': 'video/mp4',
+    'createdTime': '2025-12-26T15:00:00.000Z',
+    'modifiedTime': '2025-12-26T16:00:00.000Z',
+    'size': '524288000',
+    'webViewLink': 'https://drive.google.com/file/d/test_file_id_123/view',
+    'properties': {
+        'event_id': 'test_event_123'
+    }
+}
 
 
 class GoogleDriveClientTestCase(TestCase):
@@ -23,18 +38,7 @@ class GoogleDriveClientTestCase(TestCase):
     def setUp(self):
         """Configuración inicial para cada test"""
         self.client = GoogleDriveClient()
-        self.mock_file = {
-            'id': 'test_file_id_123',
-            'name': 'Reunión de Google Meet - 2025-12-26T15:00:00Z.mp4',
-            'mimeType': 'video/mp4',
-            'createdTime': '2025-12-26T15:00:00.000Z',
-            'modifiedTime': '2025-12-26T16:00:00.000Z',
-            'size': '524288000',
-            'webViewLink': 'https://drive.google.com/file/d/test_file_id_123/view',
-            'properties': {
-                'event_id': 'test_event_123'
-            }
-        }
+        self.mock_file = MOCK_FILE
 
     @patch('integrations.drive_client.validate_google_credentials')
     @patch('integrations.drive_client.service_account.Credentials.from_service_account_file')
@@ -55,129 +59,71 @@ class GoogleDriveClientTestCase(TestCase):
         with self.assertRaises(Exception):
             GoogleDriveClient()
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_test_connection_success(self, mock_build_service):
+    def test_test_connection_success(self):
         """Test de conexión exitosa"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
-        mock_list.execute.return_value = {
-            'files': [self.mock_file],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(list_response={'files': [self.mock_file]})
         
         result = self.client.test_connection()
         
         self.assertTrue(result['success'])
         self.assertEqual(result['files_found'], 1)
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_test_connection_error(self, mock_build_service):
+    def test_test_connection_error(self):
         """Test de conexión con error"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
-        mock_list.execute.side_effect = Exception("API Error")
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(list_side_effect=Exception("API Error"))
         
         result = self.client.test_connection()
         
         self.assertFalse(result['success'])
         self.assertIn('error', result)
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_search_recordings_by_date_range(self, mock_build_service):
+    def test_search_recordings_by_date_range(self):
         """Test de búsqueda de grabaciones por rango de fechas"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
         start_time = timezone.now() - timedelta(days=1)
         end_time = timezone.now()
-        
-        mock_list.execute.return_value = {
-            'files': [self.mock_file],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(list_response={'files': [self.mock_file]})
         
         results = self.client.search_recordings_by_date_range(start_time, end_time)
         
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]['id'], 'test_file_id_123')
-        mock_files.list.assert_called_once()
+        self.client.service.files.return_value.list.assert_called_once()
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_search_recording_by_event_id(self, mock_build_service):
+    def test_search_recording_by_event_id(self):
         """Test de búsqueda de grabación por event_id"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
-        mock_list.execute.return_value = {
-            'files': [self.mock_file],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(list_response={'files': [self.mock_file]})
         
         result = self.client.search_recording_by_event_id('test_event_123')
         
         self.assertIsNotNone(result)
         self.assertEqual(result['id'], 'test_file_id_123')
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_search_recording_by_event_id_not_found(self, mock_build_service):
-        """Test de búsqueda de grabación por event_id no encontrada"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
+    def test_search_recording_by_event_id_q_string(self):
+        """Test de las consultas q que envía la búsqueda por event_id"""
+        self.client.service = make_fake_drive(list_response={'files': []})
         
-        mock_list.execute.return_value = {
-            'files': [],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
+        self.client.search_recording_by_event_id('test_event_123')
         
-        self.client._service = mock_service
+        queries = [
+            call.kwargs['q']
+            for call in self.client.service.files.return_value.list.call_args_list
+        ]
+        self.assertEqual(queries, [
+            "properties has { key='event_id' and value='test_event_123' } and trashed=false",
+            "name contains 'test_event_123' and mimeType='video/mp4' and trashed=false",
+        ])
+
+    def test_search_recording_by_event_id_not_found(self):
+        """Test de búsqueda de grabación por event_id no encontrada"""
+        self.client.service = make_fake_drive(list_response={'files': []})
         
         result = self.client.search_recording_by_event_id('non_existent_event')
         
         self.assertIsNone(result)
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_get_file_metadata(self, mock_build_service):
+    def test_get_file_metadata(self):
         """Test de obtención de metadatos de archivo"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_get = Mock()
-        
-        mock_get.execute.return_value = self.mock_file
-        mock_files.get.return_value = mock_get
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(get_response=self.mock_file)
         
         result = self.client.get_file_metadata('test_file_id_123')
         
@@ -185,23 +131,15 @@ class GoogleDriveClientTestCase(TestCase):
         self.assertEqual(result['id'], 'test_file_id_123')
         self.assertEqual(result['name'], self.mock_file['name'])
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_get_file_metadata_not_found(self, mock_build_service):
+    def test_get_file_metadata_not_found(self):
         """Test de obtención de metadatos de archivo no encontrado"""
         from googleapiclient.errors import HttpError
         
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_get = Mock()
-        
         error_response = Mock()
         error_response.status = 404
-        mock_get.execute.side_effect = HttpError(error_response, b'Not Found')
-        mock_files.get.return_value = mock_get
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(
+            get_side_effect=HttpError(error_response, b'Not Found')
+        )
         
         result = self.client.get_file_metadata('non_existent_file_id')
         
@@ -216,74 +154,78 @@ class GoogleDriveClientTestCase(TestCase):
         
         self.assertEqual(url, expected_url)
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_find_meet_recordings_folder(self, mock_build_service):
+    def test_find_meet_recordings_folder(self):
         """Test de búsqueda de carpeta 'Meet Recordings'"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
         folder_file = {
             'id': 'folder_id_123',
             'name': 'Meet Recordings',
             'mimeType': 'application/vnd.google-apps.folder'
         }
-        
-        mock_list.execute.return_value = {
-            'files': [folder_file],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(list_response={'files': [folder_file]})
         
         folder_id = self.client.find_meet_recordings_folder()
         
         self.assertEqual(folder_id, 'folder_id_123')
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_list_recordings_in_folder(self, mock_build_service):
+    def test_list_recordings_in_folder(self):
         """Test de listado de grabaciones en carpeta"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
-        mock_list.execute.return_value = {
-            'files': [self.mock_file],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+        self.client.service = make_fake_drive(list_response={'files': [self.mock_file]})
         
         results = self.client.list_recordings_in_folder('folder_id_123')
         
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]['id'], 'test_file_id_123')
 
-    @patch.object(GoogleDriveClient, '_build_service')
-    def test_list_recordings(self, mock_build_service):
-        """Test de listado genérico de grabaciones"""
-        mock_service = Mock()
-        mock_files = Mock()
-        mock_list = Mock()
-        
-        mock_list.execute.return_value = {
-            'files': [self.mock_file],
-            'nextPageToken': None
-        }
-        mock_files.list.return_value = mock_list
-        mock_service.files.return_value = mock_files
-        mock_build_service.return_value = mock_service
-        
-        self.client._service = mock_service
+    def test_list_recordings(self):
+        """Test de listado genérico de grabaciones (dos páginas)"""
+        second_file = {**self.mock_file, 'id': 'test_file_id_456'}
+        self.client.service = make_fake_drive(list_pages=[
+            {'files': [self.mock_file], 'nextPageToken': 'abc'},
+            {'files': [second_file], 'nextPageToken': None},
+        ])
         
         results = self.client.list_recordings(limit=10)
         
-        self.assertEqual(len(results), 1)
+        self.assertEqual(len(results), 2)
         self.assertEqual(results[0]['id'], 'test_file_id_123')
+        self.assertEqual(results[1]['id'], 'test_file_id_456')
+        self.assertEqual(self.client.service.files.return_value.list_next.call_count, 2)
 
+    def test_list_recordings_uses_narrow_fields(self):
+        """Test de que files.list pide solo los campos que se usan"""
+        self.client.service = make_fake_drive()
+        
+        self.client.list_recordings(limit=10)
+        
+        self.assertEqual(
+            self.client.service.files.return_value.list.call_args.kwargs['fields'],
+            "nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, "
+            "webViewLink, videoMediaMetadata/durationMillis)"
+        )
+
+    def test_search_recordings_by_meeting_codes_bulk(self):
+        """Test de búsqueda por código de Meet en un solo batch HTTP"""
+        mock_service = Mock()
+        batches = []
+        
+        def new_batch(callback):
+            batch = Mock()
+            requests = []
+            batch.add.side_effect = lambda request, request_id: requests.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, {'files': [self.mock_file] if request_id == 'abc-defg-hij' else []}, None)
+                for request_id in requests
+            ]
+            batches.append(batch)
+            return batch
+        
+        mock_service.new_batch_http_request.side_effect = new_batch
+        self.mock_file = {**MOCK_FILE, 'name': 'abc-defg-hij (2025-12-26 10:00 GMT-5)'}
+        self.client.service = mock_service
+        
+        results = self.client.search_recordings_by_meeting_codes_bulk(['abc-defg-hij', 'xyz-wxyz-xyz'])
+        
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].add.call_count, 2)
+        self.assertEqual(results['abc-defg-hij']['id'], 'test_file_id_123')
+        self.assertIsNone(results['xyz-wxyz-xyz'])
@@ -0,0 +1,119 @@
+"""
+Tests unitarios para google_client.
+
+Pruebas de:
+- Formateo de fechas para Calendar API (format_datetime_for_google)
+- Creación de eventos en batch (create_events_bulk)
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+from django.test import TestCase
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from integrations.google_client import (
+    CALENDAR_BATCH_MAX,
+    format_datetime_for_google,
+)
+from integrations.tests.fakes import echo_event, make_fake_calendar_client
+
+
+def make_events(*summaries):
+    """Argumentos de create_events_bulk para los summaries dados."""
+    return [{'event_data': {'summary': summary}} for summary in summaries]
+
+
+class FormatDatetimeForGoogleTestCase(TestCase):
+    """Tests para format_datetime_for_google"""
+
+    def test_repeated_hour_keeps_offset_of_each_fold(self):
+        """Test de que la caché distingue los dos 01:30 del cambio de horario"""
+        new_york = ZoneInfo('America/New_York')
+        first = datetime(2026, 11, 1, 1, 30, tzinfo=new_york)
+        second = first.replace(fold=1)
+
+        self.assertEqual(
+            format_datetime_for_google(first)['dateTime'], '2026-11-01T01:30:00-04:00'
+        )
+        self.assertEqual(
+            format_datetime_for_google(second)['dateTime'], '2026-11-01T01:30:00-05:00'
+        )
+
+    def test_string_passes_through(self):
+        """Test de que un string ya formateado se retorna sin cambios"""
+        result = format_datetime_for_google('2026-01-15T10:00:00-05:00', 'America/Bogota')
+
+        self.assertEqual(result, {
+            'dateTime': '2026-01-15T10:00:00-05:00',
+            'timeZone': 'America/Bogota',
+        })
+
+    def test_none(self):
+        """Test de que None se retorna como None"""
+        self.assertIsNone(format_datetime_for_google(None))
+
+
+class CreateEventsBulkTestCase(TestCase):
+    """Tests para GoogleCalendarClient.create_events_bulk"""
+
+    def test_results_follow_input_order(self):
+        """Test de que cada respuesta vuelve a su posición por request_id"""
+        client = make_fake_calendar_client(echo_event)
+
+        results = client.create_events_bulk(make_events('a', 'b', 'c'))
+
+        self.assertEqual([r['event_id'] for r in results], ['evt-a', 'evt-b', 'evt-c'])
+        self.assertEqual(results[1]['meet_link'], 'https://meet.google.com/b')
+        batch = client.service.batches[0]
+        self.assertEqual([rid for rid, _ in batch.requests], ['0', '1', '2'])
+
+    def test_failed_event_is_none(self):
+        """Test de que un evento fallido deja None solo en su posición"""
+        client = make_fake_calendar_client(echo_event)
+
+        results = client.create_events_bulk(make_events('a', 'fail-b', 'c'))
+
+        self.assertIsNone(results[1])
+        self.assertEqual(results[0]['event_id'], 'evt-a')
+        self.assertEqual(results[2]['event_id'], 'evt-c')
+
+    def test_all_failed(self):
+        """Test de que si todos fallan se retorna None para cada uno"""
+        client = make_fake_calendar_client(echo_event)
+
+        results = client.create_events_bulk(make_events('fail-a', 'fail-b'))
+
+        self.assertEqual(results, [None, None])
+
+    def test_splits_in_batches_of_max(self):
+        """Test de que se envía un batch por cada CALENDAR_BATCH_MAX eventos"""
+        client = make_fake_calendar_client(echo_event)
+        summaries = [f'e{i}' for i in range(CALENDAR_BATCH_MAX * 2 + 3)]
+
+        results = client.create_events_bulk(make_events(*summaries))
+
+        sizes = [len(batch.requests) for batch in client.service.batches]
+        self.assertEqual(sizes, [CALENDAR_BATCH_MAX, CALENDAR_BATCH_MAX, 3])
+        self.assertEqual([r['event_id'] for r in results], [f'evt-{s}' for s in summaries])
+
+    def test_batch_http_error_leaves_its_slots_empty(self):
+        """Test de que un HttpError del batch completo no afecta a los demás batches"""
+        client = make_fake_calendar_client(echo_event)
+        real_new_batch = client.service.new_batch_http_request.side_effect
+
+        def new_batch(callback=None):
+            batch = real_new_batch(callback=callback)
+            if len(client.service.batches) == 2:
+                batch.execute = Mock(side_effect=HttpError(httplib2.Response({'status': 500}), b''))
+            return batch
+
+        client.service.new_batch_http_request.side_effect = new_batch
+        summaries = [f'e{i}' for i in range(CALENDAR_BATCH_MAX + 1)]
+
+        results = client.create_events_bulk(make_events(*summaries))
+
+        self.assertTrue(all(results[:CALENDAR_BATCH_MAX]))
+        self.assertIsNone(results[CALENDAR_BATCH_MAX])
@@ -0,0 +1,148 @@
+"""
+Tests unitarios para GoogleMeetClient.
+
+Pruebas de:
+- Alta de miembros en batch (add_space_members)
+- Creación de espacios configurados (create_configured_space)
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from django.test import TestCase
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from integrations.meet_client import GoogleMeetClient, MEET_BATCH_MAX
+from integrations.tests.fakes import make_fake_batch_service
+
+
+def make_meet_client(respond):
+    """
+    Construye un GoogleMeetClient sin credenciales con v2beta falso.
+
+    members().create(...) retorna un objeto con el parent y el body
+    recibidos, para que respond decida la respuesta según el email.
+    """
+    client = GoogleMeetClient.__new__(GoogleMeetClient)
+    client.service_v2beta = make_fake_batch_service(respond)
+    client._members_api = Mock()
+    client._members_api.create.side_effect = lambda parent, body: SimpleNamespace(parent=parent, body=body)
+    return client
+
+
+def echo_member(request_id, request):
+    """Responde cada alta con un miembro que refleja el email y el rol."""
+    return {
+        'name': f"{request.parent}/members/{request_id}",
+        'user': request.body['user'],
+        'role': request.body['role'],
+    }
+
+
+class AddSpaceMembersTestCase(TestCase):
+    """Tests para GoogleMeetClient.add_space_members"""
+
+    def test_adds_unique_members_in_one_batch(self):
+        """Test de que los emails duplicados se envían una sola vez"""
+        client = make_meet_client(echo_member)
+
+        members = client.add_space_members(
+            'spaces/abc', ['a@x.com', 'b@x.com', 'a@x.com'], 'COHOST'
+        )
+
+        self.assertEqual(len(client.service_v2beta.batches), 1)
+        batch = client.service_v2beta.batches[0]
+        self.assertEqual([rid for rid, _ in batch.requests], ['a@x.com', 'b@x.com'])
+        self.assertEqual([m['user']['email'] for m in members], ['a@x.com', 'b@x.com'])
+        self.assertTrue(all(m['role'] == 'COHOST' for m in members))
+
+    def test_splits_in_batches_of_max(self):
+        """Test de que se envía un batch por cada MEET_BATCH_MAX emails"""
+        client = make_meet_client(echo_member)
+        emails = [f'user{i}@x.com' for i in range(MEET_BATCH_MAX * 2 + 5)]
+
+        members = client.add_space_members('spaces/abc', emails)
+
+        sizes = [len(batch.requests) for batch in client.service_v2beta.batches]
+        self.assertEqual(sizes, [MEET_BATCH_MAX, MEET_BATCH_MAX, 5])
+        self.assertEqual(len(members), len(emails))
+
+    def test_member_failure_is_skipped(self):
+        """Test de que el fallo de un miembro no afecta a los demás"""
+        def respond(request_id, request):
+            if request_id == 'bad@x.com':
+                raise HttpError(httplib2.Response({'status': 400}), b'')
+            return echo_member(request_id, request)
+
+        client = make_meet_client(respond)
+
+        members = client.add_space_members('spaces/abc', ['a@x.com', 'bad@x.com', 'b@x.com'])
+
+        self.assertEqual([m['user']['email'] for m in members], ['a@x.com', 'b@x.com'])
+
+    def test_transport_error_skips_only_its_batch(self):
+        """Test de que un error de red en un batch no detiene los siguientes"""
+        client = make_meet_client(echo_member)
+        emails = [f'user{i}@x.com' for i in range(MEET_BATCH_MAX + 1)]
+        real_new_batch = client.service_v2beta.new_batch_http_request.side_effect
+
+        def new_batch(callback=None):
+            batch = real_new_batch(callback=callback)
+            if len(client.service_v2beta.batches) == 1:
+                batch.execute = Mock(side_effect=OSError('connection reset'))
+            return batch
+
+        client.service_v2beta.new_batch_http_request.side_effect = new_batch
+
+        members = client.add_space_members('spaces/abc', emails)
+
+        self.assertEqual([m['user']['email'] for m in members], [emails[-1]])
+
+    def test_unexpected_error_propagates(self):
+        """Test de que un error de programación no se silencia"""
+        client = make_meet_client(echo_member)
+        client._members_api.create.side_effect = TypeError('bad body')
+
+        with self.assertRaises(TypeError):
+            client.add_space_members('spaces/abc', ['a@x.com'])
+
+    def test_without_v2beta_returns_empty(self):
+        """Test de que sin v2beta no se intenta ningún batch"""
+        client = make_meet_client(echo_member)
+        client._members_api = None
+
+        self.assertEqual(client.add_space_members('spaces/abc', ['a@x.com']), [])
+        client.service_v2beta.new_batch_http_request.assert_not_called()
+
+
+class CreateConfiguredSpaceTestCase(TestCase):
+    """Tests para GoogleMeetClient.create_configured_space"""
+
+    def setUp(self):
+        """Cliente con create_space simulado y v2beta falso"""
+        self.client = make_meet_client(echo_member)
+        self.client.create_space = Mock(return_value={'name': 'spaces/abc'})
+
+    def test_creates_space_and_adds_members(self):
+        """Test de que el espacio se crea configurado y los miembros van en batch"""
+        result = self.client.create_configured_space(
+            ['a@x.com', 'b@x.com', 'a@x.com'], auto_recording=False, public_access=True
+        )
+
+        self.client.create_space.assert_called_once_with(
+            auto_recording=False, public_access=True
+        )
+        self.assertEqual(result['space'], {'name': 'spaces/abc'})
+        self.assertEqual(
+            [m['name'] for m in result['members']],
+            ['spaces/abc/members/a@x.com', 'spaces/abc/members/b@x.com']
+        )
+        self.assertEqual(len(self.client.service_v2beta.batches), 1)
+
+    def test_without_emails_skips_members(self):
+        """Test de que sin emails no se envía ningún batch"""
+        result = self.client.create_configured_space([])
+
+        self.assertEqual(result, {'space': {'name': 'spaces/abc'}, 'members': []})
+        self.client.service_v2beta.new_batch_http_request.assert_not_called()
@@ -0,0 +1,305 @@
+"""
+Tests unitarios de las primitivas de GoogleMeetConferenceClient.
+
+Pruebas de:
+- Reintentos con backoff exponencial (_retry_with_backoff)
+- Deduplicación de peticiones concurrentes (_single_flight)
+- Limitador token bucket (_TokenBucket)
+- Listado de grabaciones de varios records (list_recordings_many)
+"""
+
+import concurrent.futures
+import threading
+from unittest.mock import Mock, patch
+from django.test import TestCase
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from integrations.meet_conference_client import (
+    GoogleMeetConferenceClient,
+    _TokenBucket,
+    _retry_with_backoff,
+)
+
+
+def make_http_error(status, retry_after=None):
+    """Construye un HttpError con el estado (y Retry-After) indicados."""
+    headers = {'status': status}
+    if retry_after is not None:
+        headers['retry-after'] = retry_after
+    return HttpError(httplib2.Response(headers), b'', uri='https://meet.googleapis.com/v2/test')
+
+
+class CountingLock:
+    """Lock que cuenta cuántas veces se liberó (para sincronizar los tests)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._released = threading.Condition()
+        self.releases = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        with self._released:
+            self.releases += 1
+            self._released.notify_all()
+
+    def wait_releases(self, count, timeout):
+        with self._released:
+            return self._released.wait_for(lambda: self.releases >= count, timeout)
+
+
+class FakeClock:
+    """Reloj falso: time.sleep() avanza time.monotonic() sin esperar."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@patch('integrations.meet_conference_client.random.uniform', return_value=0)
+@patch('integrations.meet_conference_client.time.sleep')
+class RetryWithBackoffTestCase(TestCase):
+    """Tests para _retry_with_backoff"""
+
+    def test_retries_transient_errors(self, mock_sleep, mock_uniform):
+        """Test de que 429 y 5xx se reintentan con espera exponencial"""
+        func = Mock(side_effect=[make_http_error(429), make_http_error(503), 'ok'])
+
+        result = _retry_with_backoff(base=1.0)(func)()
+
+        self.assertEqual(result, 'ok')
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.0, 2.0])
+
+    def test_does_not_retry_client_errors(self, mock_sleep, mock_uniform):
+        """Test de que un 4xx distinto de 429 se propaga sin reintentar"""
+        func = Mock(side_effect=make_http_error(404))
+
+        with self.assertRaises(HttpError):
+            _retry_with_backoff()(func)()
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_gives_up_after_max_retries(self, mock_sleep, mock_uniform):
+        """Test de que tras max_retries se propaga el último error"""
+        func = Mock(side_effect=make_http_error(500))
+
+        with self.assertRaises(HttpError):
+            _retry_with_backoff(max_retries=2)(func)()
+
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_backoff_is_capped(self, mock_sleep, mock_uniform):
+        """Test de que la espera no supera cap"""
+        func = Mock(side_effect=[make_http_error(502)] * 3 + ['ok'])
+
+        _retry_with_backoff(base=4.0, cap=5.0)(func)()
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [4.0, 5.0, 5.0])
+
+    def test_honors_retry_after(self, mock_sleep, mock_uniform):
+        """Test de que Retry-After amplía la espera cuando supera el backoff"""
+        func = Mock(side_effect=[make_http_error(429, retry_after='7'), 'ok'])
+
+        _retry_with_backoff(base=1.0)(func)()
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_gives_up_when_retry_after_exceeds_cap(self, mock_sleep, mock_uniform):
+        """Test de que un Retry-After mayor que cap se propaga sin esperar"""
+        func = Mock(side_effect=[make_http_error(429, retry_after='120'), 'ok'])
+
+        with self.assertRaises(HttpError):
+            _retry_with_backoff(base=1.0, cap=32.0)(func)()
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_ignores_non_numeric_retry_after(self, mock_sleep, mock_uniform):
+        """Test de que un Retry-After con fecha HTTP no rompe el backoff"""
+        func = Mock(side_effect=[
+            make_http_error(503, retry_after='Wed, 21 Oct 2015 07:28:00 GMT'), 'ok'
+        ])
+
+        _retry_with_backoff(base=1.0)(func)()
+
+        mock_sleep.assert_called_once_with(1.0)
+
+
+class SingleFlightTestCase(TestCase):
+    """Tests para GoogleMeetConferenceClient._single_flight"""
+
+    def setUp(self):
+        """Cliente sin credenciales: solo el estado que usa _single_flight"""
+        self.client = GoogleMeetConferenceClient.__new__(GoogleMeetConferenceClient)
+        self.client._cache_lock = threading.Lock()
+        self.client._inflight = {}
+
+    def test_owner_returns_and_clears_inflight(self):
+        """Test de que el primer llamador ejecuta fetch y libera la clave"""
+        fetch = Mock(return_value='record')
+
+        result = self.client._single_flight('key', fetch)
+
+        self.assertEqual(result, 'record')
+        fetch.assert_called_once()
+        self.assertEqual(self.client._inflight, {})
+
+    def test_waiter_gets_owner_result(self):
+        """Test de que un llamador concurrente recibe el resultado sin repetir fetch"""
+        lock = CountingLock()
+        self.client._cache_lock = lock
+        started = threading.Event()
+        release = threading.Event()
+
+        def owner_fetch():
+            started.set()
+            release.wait(5)
+            return 'record'
+
+        waiter_fetch = Mock(return_value='other')
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            owner = pool.submit(self.client._single_flight, 'key', owner_fetch)
+            self.assertTrue(started.wait(5))
+            waiter = pool.submit(self.client._single_flight, 'key', waiter_fetch)
+            # El segundo paso por el lock es el del llamador que encuentra la petición en curso
+            self.assertTrue(lock.wait_releases(2, 5))
+            release.set()
+            self.assertEqual(owner.result(5), 'record')
+            self.assertEqual(waiter.result(5), 'record')
+        waiter_fetch.assert_not_called()
+
+    def test_owner_exception_reaches_waiters(self):
+        """Test de que la excepción del primer llamador se entrega a los que esperan"""
+        error = RuntimeError('boom')
+        seen = {}
+
+        def fetch():
+            seen['future'] = self.client._inflight['key']
+            raise error
+
+        with self.assertRaises(RuntimeError):
+            self.client._single_flight('key', fetch)
+
+        self.assertIs(seen['future'].exception(), error)
+        self.assertEqual(self.client._inflight, {})
+
+    def test_waiter_raises_inflight_exception(self):
+        """Test de que quien llega con una petición en curso recibe su excepción"""
+        future = concurrent.futures.Future()
+        future.set_exception(RuntimeError('boom'))
+        self.client._inflight['key'] = future
+        fetch = Mock()
+
+        with self.assertRaisesMessage(RuntimeError, 'boom'):
+            self.client._single_flight('key', fetch)
+
+        fetch.assert_not_called()
+
+
+class TokenBucketTestCase(TestCase):
+    """Tests para _TokenBucket"""
+
+    def setUp(self):
+        """Reloj falso para controlar el paso del tiempo"""
+        self.clock = FakeClock()
+        patcher = patch('integrations.meet_conference_client.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_up_to_capacity(self):
+        """Test de que el bucket lleno admite una ráfaga sin esperar"""
+        bucket = _TokenBucket(60)
+
+        waits = [bucket.acquire() for _ in range(60)]
+
+        self.assertEqual(sum(waits), 0)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_waits_when_empty(self):
+        """Test de que con el bucket vacío se espera lo necesario para un token"""
+        bucket = _TokenBucket(60)  # 1 token por segundo
+        for _ in range(60):
+            bucket.acquire()
+
+        waited = bucket.acquire()
+
+        self.assertAlmostEqual(waited, 1.0)
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    def test_refills_over_time(self):
+        """Test de que los tokens se reponen con el tiempo transcurrido"""
+        bucket = _TokenBucket(60)
+        for _ in range(60):
+            bucket.acquire()
+
+        self.clock.now += 10
+        waits = [bucket.acquire() for _ in range(10)]
+
+        self.assertEqual(sum(waits), 0)
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+
+    def test_refill_is_capped(self):
+        """Test de que el bucket no acumula más tokens que su capacidad"""
+        bucket = _TokenBucket(60)
+
+        self.clock.now += 3600
+        for _ in range(60):
+            bucket.acquire()
+
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+
+
+class ListRecordingsManyTestCase(TestCase):
+    """Tests para GoogleMeetConferenceClient.list_recordings_many"""
+
+    def setUp(self):
+        """Cliente sin credenciales con list_recordings simulado"""
+        self.recordings = {
+            'conferenceRecords/a': [{'name': 'conferenceRecords/a/recordings/1'}],
+            'conferenceRecords/b': [],
+            'conferenceRecords/c': [
+                {'name': 'conferenceRecords/c/recordings/1'},
+                {'name': 'conferenceRecords/c/recordings/2'},
+            ],
+        }
+        self.client = GoogleMeetConferenceClient.__new__(GoogleMeetConferenceClient)
+        self.client.list_recordings = Mock(
+            side_effect=lambda name, only_ready=True: self.recordings[name]
+        )
+
+    @patch('integrations.meet_conference_client._EXECUTOR')
+    def test_keeps_input_order_without_shared_executor(self, mock_executor):
+        """Test de que el resultado sigue el orden recibido y no usa _EXECUTOR"""
+        names = ['conferenceRecords/c', 'conferenceRecords/a',
+                 'conferenceRecords/b', 'conferenceRecords/c']
+
+        result = self.client.list_recordings_many(names, only_ready=False)
+
+        self.assertEqual([r['name'] for r in result], [
+            'conferenceRecords/c/recordings/1',
+            'conferenceRecords/c/recordings/2',
+            'conferenceRecords/a/recordings/1',
+        ])
+        self.assertEqual(self.client.list_recordings.call_count, 3)
+        self.client.list_recordings.assert_any_call('conferenceRecords/a', False)
+        self.assertEqual(mock_executor.mock_calls, [])
+
+    def test_empty_input(self):
+        """Test de que sin records no se lista nada"""
+        self.assertEqual(self.client.list_recordings_many([]), [])
+        self.client.list_recordings.assert_not_called()
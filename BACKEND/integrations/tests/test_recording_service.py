@@ -9,37 +9,40 @@ Pruebas de:
 
 from unittest.mock import Mock, patch, MagicMock
 from django.test import TestCase
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from django.utils import timezone
 
 from integrations.recording_service import RecordingSyncService
 from meetings.models import Meeting, MeetingRecording
+from meetings.tests.factories import make_finished_meetings
+from integrations.tests.fakes import make_fake_drive
 from accounts.models import User
 
 
 class RecordingSyncServiceTestCase(TestCase):
     """Tests para RecordingSyncService"""
 
-    def setUp(self):
-        """Configuración inicial para cada test"""
-        self.service = RecordingSyncService()
-        
-        # Crear usuario de prueba
-        self.user = User.objects.create_user(
-            username='test_user',
-            email='test@example.com',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Datos compartidos por todos los tests (se crean una sola vez)"""
+        # Crear usuario de prueba (sin contraseña: evita el hasher)
+        cls.user = User(username='test_user', email='test@example.com')
+        cls.user.set_unusable_password()
+        cls.user.save()
         
         # Crear reunión de prueba
-        self.meeting = Meeting.objects.create(
-            organizer=self.user,
+        cls.meeting = Meeting.objects.create(
+            organizer=cls.user,
             google_event_id='test_event_123',
             meet_link='https://meet.google.com/test',
             scheduled_start=timezone.now() - timedelta(days=1),
             scheduled_end=timezone.now() - timedelta(days=1) + timedelta(hours=1),
             status='FINISHED'
         )
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.service = RecordingSyncService()
         
         self.mock_drive_file = {
             'id': 'drive_file_123',
@@ -65,7 +68,9 @@ class RecordingSyncServiceTestCase(TestCase):
         self.assertIsInstance(result, MeetingRecording)
         self.assertEqual(result.drive_file_id, 'drive_file_123')
         self.assertEqual(result.meeting, self.meeting)
-        mock_find.assert_called_once_with(self.meeting)
+        mock_find.assert_called_once_with(
+            self.meeting, recording_index=None, event_cache=None, now=None
+        )
 
     @patch.object(RecordingSyncService, '_find_recording_in_drive')
     def test_sync_meeting_recording_not_found(self, mock_find):
@@ -75,7 +80,9 @@ class RecordingSyncServiceTestCase(TestCase):
         result = self.service.sync_meeting_recording(self.meeting)
         
         self.assertIsNone(result)
-        mock_find.assert_called_once_with(self.meeting)
+        mock_find.assert_called_once_with(
+            self.meeting, recording_index=None, event_cache=None, now=None
+        )
 
     @patch.object(RecordingSyncService, '_find_recording_in_drive')
     def test_sync_meeting_recording_updates_existing(self, mock_find):
@@ -135,21 +142,13 @@ class RecordingSyncServiceTestCase(TestCase):
     def test_sync_all_recordings_with_limit(self, mock_find):
         """Test de sincronización masiva con límite"""
         # Crear múltiples reuniones
-        for i in range(5):
-            Meeting.objects.create(
-                organizer=self.user,
-                google_event_id=f'test_event_{i}',
-                meet_link=f'https://meet.google.com/test{i}',
-                scheduled_start=timezone.now() - timedelta(days=i+1),
-                scheduled_end=timezone.now() - timedelta(days=i+1) + timedelta(hours=1),
-                status='FINISHED'
-            )
+        make_finished_meetings(self.user, 5)
         
         mock_find.return_value = None
         
         result = self.service.sync_all_recordings(limit=3)
         
-        self.assertEqual(result['total_processed'], 3)
+        self.assertEqual(result['processed'], 3)
         self.assertEqual(mock_find.call_count, 3)
 
     @patch.object(RecordingSyncService, '_find_recording_in_drive')
@@ -169,7 +168,46 @@ class RecordingSyncServiceTestCase(TestCase):
         self.assertEqual(result['skipped'], 1)
         mock_find.assert_not_called()
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch.object(RecordingSyncService, '_find_recording_in_drive')
+    def test_sync_all_recordings_streams_without_materializing(self, mock_find):
+        """Test de que sync_all lee las reuniones con iterator() sin evaluar el queryset"""
+        from django.db.models.query import QuerySet
+        
+        mock_find.return_value = None
+        self.service.drive_client = Mock()
+        self.service.drive_client.search_recordings_by_date_range.return_value = []
+        self.service.drive_client.search_recordings_by_meeting_codes_bulk.return_value = {}
+        self.service.drive_client.search_recordings_by_event_ids_bulk.return_value = {}
+        self.service.conference_client = None
+        
+        with patch.object(RecordingSyncService, '_fetch_event_cache', return_value=None), \
+                patch.object(QuerySet, '__iter__', side_effect=AssertionError('queryset evaluado')):
+            result = self.service.sync_all_recordings(limit=10)
+        
+        self.assertEqual(result['processed'], 1)
+        mock_find.assert_called_once()
+
+    def test_sync_all_recordings_survives_batch_transport_error(self):
+        """Test de que un fallo de red en el batch de Drive no aborta la sincronización masiva"""
+        from google.auth.exceptions import TransportError
+        from integrations.drive_client import GoogleDriveClient
+        
+        drive = GoogleDriveClient.__new__(GoogleDriveClient)
+        drive.service = make_fake_drive()
+        drive.service.new_batch_http_request.return_value.execute.side_effect = TransportError('sin red')
+        self.service.drive_client = drive
+        self.service.conference_client = None
+        make_finished_meetings(self.user, 2)
+        
+        with patch.object(RecordingSyncService, '_fetch_event_cache', return_value=None):
+            result = self.service.sync_all_recordings(limit=10)
+        
+        self.assertEqual(result['processed'], 3)
+        self.assertEqual(result['errors'], 0)
+        self.assertEqual(result['found'], 0)
+        drive.service.new_batch_http_request.return_value.execute.assert_called()
+
+    @patch('integrations.recording_service.get_drive_client')
     def test_find_recording_in_drive_by_event_id(self, mock_drive_client_class):
         """Test de búsqueda de grabación por event_id"""
         mock_drive_client = Mock()
@@ -183,7 +221,7 @@ class RecordingSyncServiceTestCase(TestCase):
         self.assertEqual(result['id'], 'drive_file_123')
         mock_drive_client.search_recording_by_event_id.assert_called_once_with('test_event_123')
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_find_recording_in_drive_by_date_range(self, mock_drive_client_class):
         """Test de búsqueda de grabación por rango de fechas"""
         mock_drive_client = Mock()
@@ -198,9 +236,11 @@ class RecordingSyncServiceTestCase(TestCase):
         self.assertEqual(result['id'], 'drive_file_123')
         mock_drive_client.search_recordings_by_date_range.assert_called_once()
 
-    @patch('integrations.recording_service.GoogleDriveClient')
-    def test_find_recording_in_drive_multiple_files(self, mock_drive_client_class):
+    @patch('integrations.google_client.GoogleCalendarClient')
+    @patch('integrations.recording_service.get_drive_client')
+    def test_find_recording_in_drive_multiple_files(self, mock_drive_client_class, mock_calendar_class):
         """Test de búsqueda cuando hay múltiples archivos candidatos"""
+        mock_calendar_class.return_value.get_event.return_value = {'summary': 'Reunión de Google Meet'}
         mock_drive_client = Mock()
         mock_drive_client_class.return_value = mock_drive_client
         mock_drive_client.search_recording_by_event_id.return_value = None
@@ -217,6 +257,102 @@ class RecordingSyncServiceTestCase(TestCase):
         # Debe seleccionar el más cercano a la fecha de la reunión
         self.assertIsNotNone(result)
         self.assertIn(result['id'], ['file1', 'file2'])
+        # La ventana se filtra en la consulta y solo se piden unos pocos candidatos
+        _, kwargs = mock_drive_client.search_recordings_by_date_range.call_args
+        self.assertEqual(kwargs['limit'], 10)
+
+    @patch('integrations.google_client.GoogleCalendarClient')
+    @patch('integrations.recording_service.get_drive_client')
+    def test_find_recording_in_drive_calendar_transport_error(self, mock_drive_client_class, mock_calendar_class):
+        """Test de que un fallo de red en Calendar no descarta los candidatos de Drive"""
+        from google.auth.exceptions import TransportError
+        
+        mock_calendar_class.return_value.get_event.side_effect = TransportError('sin red')
+        mock_drive_client = Mock()
+        mock_drive_client_class.return_value = mock_drive_client
+        mock_drive_client.search_recording_by_event_id.return_value = None
+        file1 = {**self.mock_drive_file, 'id': 'file1', 'name': 'otra-cosa.mp4'}
+        file2 = {**self.mock_drive_file, 'id': 'file2', 'name': 'otra-mas.mp4'}
+        mock_drive_client.search_recordings_by_date_range.return_value = [file1, file2]
+        
+        service = RecordingSyncService()
+        result = service._find_recording_in_drive(self.meeting)
+        
+        # El filtro por título es opcional: se usa la más reciente
+        self.assertEqual(result['id'], 'file1')
+
+    @patch('integrations.google_client.GoogleCalendarClient')
+    def test_fetch_event_cache_lookup_errors(self, mock_calendar_class):
+        """Test de que solo los errores de Google/red dejan el caché de eventos en None"""
+        from core.exceptions import GoogleAuthenticationError
+        
+        mock_calendar_class.side_effect = GoogleAuthenticationError('sin credenciales')
+        self.assertIsNone(self.service._fetch_event_cache([self.meeting]))
+        
+        mock_calendar_class.side_effect = None
+        mock_calendar_class.return_value.get_events_bulk.side_effect = OSError('timeout')
+        self.assertIsNone(self.service._fetch_event_cache([self.meeting]))
+        
+        mock_calendar_class.return_value.get_events_bulk.side_effect = KeyError('id')
+        with self.assertRaises(KeyError):
+            self.service._fetch_event_cache([self.meeting])
+
+    def test_find_recording_in_drive_index_caps_candidates(self):
+        """Test de que con el índice precargado solo se consideran los 10 candidatos más recientes"""
+        now = timezone.now()
+        search_start, _ = self.service._get_search_window(self.meeting, now)
+        # 12 grabaciones en la ventana; el título del evento solo coincide con la más antigua
+        files = [
+            {
+                **self.mock_drive_file,
+                'id': f'file{i}',
+                'name': 'Planeación trimestral.mp4' if i == 0 else f'grabacion-{i}.mp4',
+                'createdTime': (search_start + timedelta(minutes=i + 1)).astimezone(dt_timezone.utc)
+                    .strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            }
+            for i in range(12)
+        ]
+        self.service.drive_client = Mock()
+        index = {
+            'by_code': {},
+            'files': files,
+            'times': [f['createdTime'][:19] for f in files],
+            'complete': True,
+            'searched_codes': set(),
+            'by_event': {self.meeting.google_event_id: None},
+        }
+        event_cache = {self.meeting.google_event_id: {'summary': 'Planeación trimestral'}}
+        
+        result = self.service._find_recording_in_drive(self.meeting, index, event_cache, now)
+        
+        # La más antigua queda fuera de los candidatos: se usa la más reciente
+        self.assertEqual(result['id'], 'file11')
+        self.service.drive_client.search_recordings_by_date_range.assert_not_called()
+
+    def test_filter_recordings_by_meeting_does_not_mutate_files(self):
+        """Test de que el filtro por título no escribe en los dicts de Drive"""
+        file1 = {**self.mock_drive_file, 'id': 'file1', 'name': 'Planeación trimestral.mp4'}
+        file2 = {**self.mock_drive_file, 'id': 'file2', 'name': 'otra-cosa.mp4'}
+        event_cache = {self.meeting.google_event_id: {'summary': 'Planeación trimestral'}}
+        
+        result = self.service._filter_recordings_by_meeting([file2, file1], self.meeting, event_cache)
+        
+        self.assertEqual(result['id'], 'file1')
+        self.assertEqual(set(file1), set(self.mock_drive_file) | {'id'})
+        self.assertEqual(set(file2), set(self.mock_drive_file) | {'id'})
+
+    def test_filter_recordings_by_meeting_uses_index_words(self):
+        """Test de que se usan las palabras precalculadas del índice"""
+        file1 = {**self.mock_drive_file, 'id': 'file1', 'name': 'grabacion-1.mp4'}
+        file2 = {**self.mock_drive_file, 'id': 'file2', 'name': 'grabacion-2.mp4'}
+        event_cache = {self.meeting.google_event_id: {'summary': 'Planeación trimestral'}}
+        words = {'file2': {'planeación', 'trimestral'}}
+        
+        result = self.service._filter_recordings_by_meeting(
+            [file1, file2], self.meeting, event_cache, recording_words=words
+        )
+        
+        self.assertEqual(result['id'], 'file2')
 
     def test_create_or_update_recording(self):
         """Test de creación/actualización de grabación"""
@@ -263,3 +399,53 @@ class RecordingSyncServiceTestCase(TestCase):
         
         self.assertIsNone(available_date)
 
+    def test_extract_available_date_utc_suffix(self):
+        """Test de que createdTime con sufijo 'Z' se interpreta en UTC"""
+        available_date = self.service._extract_available_date(self.mock_drive_file)
+        
+        self.assertEqual(available_date, datetime(2025, 12, 26, 15, 0, tzinfo=dt_timezone.utc))
+
+    def test_find_recordings_in_drive_batch(self):
+        """Test de que las búsquedas por código se resuelven en batch y se agregan al índice"""
+        self.service.drive_client = Mock()
+        self.service.conference_client = None
+        self.service.drive_client.search_recordings_by_meeting_codes_bulk.return_value = {
+            'abc-defg-hij': None
+        }
+        self.service.drive_client.search_recordings_by_event_ids_bulk.return_value = {
+            'test_event_123': self.mock_drive_file
+        }
+        self.meeting.meet_link = 'https://meet.google.com/abc-defg-hij'
+        self.meeting.save()
+        self.meeting.refresh_from_db()
+        
+        index = self.service._find_recordings_in_drive_batch([self.meeting])
+        
+        self.service.drive_client.search_recordings_by_meeting_codes_bulk.assert_called_once_with(['abc-defg-hij'])
+        self.assertEqual(index['by_event']['test_event_123'], self.mock_drive_file)
+        
+        result = self.service._find_recording_in_drive(self.meeting, index)
+        
+        self.assertEqual(result, self.mock_drive_file)
+        self.service.drive_client.search_recording_by_event_id.assert_not_called()
+
+    def test_find_recording_from_conference_record_rechecks_until_ready(self):
+        """Test de que un "sin grabación" no se cachea: la siguiente llamada vuelve a consultar la API"""
+        from django.core.cache import cache
+        
+        ready = {
+            'name': 'conferenceRecords/rec_1/recordings/r1',
+            'state': 'FILE_GENERATED',
+            'endTime': '2025-12-26T16:00:00Z',
+            'driveDestination': {'file': 'drive_file_123'}
+        }
+        self.service.conference_client = Mock()
+        self.service.conference_client.list_recordings.side_effect = [[], [ready]]
+        self.meeting.conference_record_id = 'rec_1'
+        self.addCleanup(cache.delete, 'meet_recording:rec_1')
+        
+        self.assertIsNone(self.service._find_recording_from_conference_record(self.meeting))
+        self.assertEqual(self.service._find_recording_from_conference_record(self.meeting), ready)
+        # Lista: la tercera llamada sale de la caché de Django
+        self.assertEqual(self.service._find_recording_from_conference_record(self.meeting), ready)
+        self.assertEqual(self.service.conference_client.list_recordings.call_count, 2)
@@ -0,0 +1,189 @@
+"""
+Tests unitarios para GoogleMeetService.
+
+Pruebas de:
+- Construcción diferida de los clientes de Calendar y Meet
+- Recuperación tras un fallo transitorio al construirlos
+- Creación de reuniones en batch (create_meeting_events_bulk)
+- Creación de espacios sin Calendar (create_meeting_space_only)
+"""
+
+import itertools
+from unittest.mock import Mock, patch
+from django.test import TestCase
+
+from integrations.google_client import CALENDAR_BATCH_MAX
+from integrations.services import GoogleMeetService
+from integrations.tests.fakes import echo_event, make_fake_calendar_client
+
+
+class GoogleMeetServiceClientsTestCase(TestCase):
+    """Tests para los clientes perezosos de GoogleMeetService"""
+
+    @patch('integrations.services.validate_google_credentials', return_value=True)
+    @patch('integrations.services.GoogleCalendarClient')
+    def test_calendar_client_built_once(self, mock_calendar_class, mock_validate):
+        """Test de que el cliente se construye en el primer acceso y se reutiliza"""
+        service = GoogleMeetService()
+        
+        first = service.calendar_client
+        second = service.calendar_client
+        
+        self.assertIs(first, mock_calendar_class.return_value)
+        self.assertIs(second, first)
+        mock_calendar_class.assert_called_once()
+        mock_validate.assert_called_once()
+
+    @patch('integrations.services.validate_google_credentials', return_value=True)
+    @patch('integrations.services.get_meet_client')
+    def test_meet_client_retried_after_failure(self, mock_meet_class, mock_validate):
+        """Test de que un fallo al construir no deja el cliente en None para siempre"""
+        client = Mock()
+        mock_meet_class.side_effect = [Exception('discovery no disponible'), client]
+        service = GoogleMeetService()
+        
+        self.assertIsNone(service.meet_client)
+        self.assertIs(service.meet_client, client)
+        self.assertIs(service.meet_client, client)
+        self.assertEqual(mock_meet_class.call_count, 2)
+
+    @patch('integrations.services.validate_google_credentials', side_effect=[False, True])
+    @patch('integrations.services.GoogleCalendarClient')
+    def test_credentials_revalidated_after_failure(self, mock_calendar_class, mock_validate):
+        """Test de que credenciales ausentes se vuelven a validar en el siguiente acceso"""
+        service = GoogleMeetService()
+        
+        self.assertIsNone(service.calendar_client)
+        self.assertIs(service.calendar_client, mock_calendar_class.return_value)
+        self.assertEqual(mock_validate.call_count, 2)
+
+
+class CreateMeetingEventsBulkTestCase(TestCase):
+    """Tests para GoogleMeetService.create_meeting_events_bulk"""
+
+    def setUp(self):
+        """Servicio con Calendar en batch falso y Meet simulado"""
+        self.service = GoogleMeetService()
+        self.service.calendar_client = make_fake_calendar_client(echo_event)
+        counter = itertools.count()
+
+        def create_space(**kwargs):
+            n = next(counter)
+            return {
+                'name': f'spaces/space-{n}',
+                'meetingUri': f'https://meet.google.com/space-{n}',
+                'config': {
+                    'accessType': 'OPEN',
+                    'artifactConfig': {'recordingConfig': {'autoRecordingGeneration': 'ON'}},
+                },
+            }
+
+        self.meet_client = Mock()
+        self.meet_client.create_space.side_effect = create_space
+        self.service.meet_client = self.meet_client
+
+    def make_meetings(self, *titles):
+        """Argumentos de create_meeting_events_bulk para los títulos dados"""
+        return [
+            {'organizer_email': 'org@x.com', 'invited_emails': ['a@x.com'], 'title': title}
+            for title in titles
+        ]
+
+    def test_results_keep_order_and_space_data(self):
+        """Test de que cada resultado se completa con el espacio de su reunión"""
+        results = self.service.create_meeting_events_bulk(self.make_meetings('a', 'b'))
+
+        self.assertEqual([r['event_id'] for r in results], ['evt-a', 'evt-b'])
+        self.assertEqual(
+            [r['meet_link'] for r in results],
+            ['https://meet.google.com/space-0', 'https://meet.google.com/space-1']
+        )
+        self.assertEqual([r['space_name'] for r in results], ['spaces/space-0', 'spaces/space-1'])
+        self.assertTrue(all(r['recording_enabled'] for r in results))
+
+    def test_failed_event_is_none(self):
+        """Test de que un evento fallido deja None solo en su posición"""
+        results = self.service.create_meeting_events_bulk(self.make_meetings('a', 'fail-b', 'c'))
+
+        self.assertIsNone(results[1])
+        self.assertEqual(results[0]['event_id'], 'evt-a')
+        self.assertEqual(results[2]['event_id'], 'evt-c')
+
+    def test_without_meet_client_uses_calendar_link(self):
+        """Test de que sin cliente de Meet el link sale del evento de Calendar"""
+        self.service.meet_client = None
+
+        results = self.service.create_meeting_events_bulk(self.make_meetings('a'))
+
+        self.assertEqual(results[0]['meet_link'], 'https://meet.google.com/a')
+        self.assertFalse(results[0]['recording_enabled'])
+        self.assertNotIn('space_name', results[0])
+
+    def test_splits_in_calendar_batches(self):
+        """Test de que los eventos se envían en batches de CALENDAR_BATCH_MAX"""
+        titles = [f'm{i}' for i in range(CALENDAR_BATCH_MAX + 1)]
+
+        results = self.service.create_meeting_events_bulk(self.make_meetings(*titles))
+
+        batches = self.service.calendar_client.service.batches
+        self.assertEqual([len(batch.requests) for batch in batches], [CALENDAR_BATCH_MAX, 1])
+        self.assertEqual(len(results), len(titles))
+        self.assertTrue(all(results))
+
+
+class CreateMeetingSpaceOnlyTestCase(TestCase):
+    """Tests para GoogleMeetService.create_meeting_space_only"""
+
+    def setUp(self):
+        """Servicio con cliente de Meet simulado"""
+        self.meet_client = Mock()
+        self.meet_client.create_space.return_value = {
+            'name': 'spaces/abc',
+            'meetingUri': 'https://meet.google.com/abc',
+            'config': {'accessType': 'TRUSTED'},
+        }
+        self.meet_client.add_space_members.side_effect = (
+            lambda space_name, emails, role: [{'name': f'{space_name}/members/{e}'} for e in emails]
+        )
+        self.service = GoogleMeetService()
+        self.service.meet_client = self.meet_client
+
+    def test_organizer_as_cohost_and_unique_attendees(self):
+        """Test de que el organizador va una vez como COHOST y los invitados sin duplicar"""
+        result = self.service.create_meeting_space_only(
+            auto_record=True,
+            invited_emails=['a@x.com', 'org@x.com', 'b@x.com', 'a@x.com'],
+            organizer_email='org@x.com'
+        )
+
+        self.meet_client.add_space_member.assert_called_once_with('spaces/abc', 'org@x.com', 'COHOST')
+        self.meet_client.add_space_members.assert_called_once_with(
+            'spaces/abc', ['a@x.com', 'b@x.com'], 'ATTENDEE'
+        )
+        self.assertEqual(result['members_added'], 3)
+        self.assertEqual(result['meet_link'], 'https://meet.google.com/abc')
+        self.assertTrue(result['recording_enabled'])
+
+    def test_organizer_failure_still_adds_attendees(self):
+        """Test de que si falla el organizador solo cuentan los invitados agregados"""
+        self.meet_client.add_space_member.side_effect = Exception('forbidden')
+
+        result = self.service.create_meeting_space_only(
+            invited_emails=['a@x.com'], organizer_email='org@x.com'
+        )
+
+        self.meet_client.add_space_members.assert_called_once_with(
+            'spaces/abc', ['a@x.com'], 'ATTENDEE'
+        )
+        self.assertEqual(result['members_added'], 1)
+
+    def test_public_access_adds_no_members(self):
+        """Test de que con acceso público no se agregan miembros"""
+        result = self.service.create_meeting_space_only(
+            invited_emails=['a@x.com'], organizer_email='org@x.com', public_access=True
+        )
+
+        self.meet_client.add_space_member.assert_not_called()
+        self.meet_client.add_space_members.assert_not_called()
+        self.assertEqual(result['members_added'], 0)
+        self.assertTrue(result['public_access'])
@@ -0,0 +1,94 @@
+"""
+Transporte HTTP compartido por los clientes de Google APIs.
+
+Maneja:
+- Un transporte HTTP autorizado por hilo y credenciales (keep-alive)
+- El requestBuilder que asocia cada petición al transporte del hilo
+- El parseo de respuestas JSON con orjson cuando está instalado
+"""
+
+from google.auth.exceptions import GoogleAuthError
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+import google_auth_httplib2
+import httplib2
+import threading
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson es opcional: usar el parser estándar
+    from json import loads as json_loads
+
+# Timeout (segundos) de cada conexión HTTP hacia Google APIs
+HTTP_TIMEOUT = 30
+
+# Fallos de red y de credenciales que no llegan como HttpError (y que los
+# clientes no traducen a core.exceptions): TransportError/RefreshError de
+# google.auth, errores de httplib2 y timeouts o resets de socket
+TRANSPORT_ERRORS = (GoogleAuthError, httplib2.HttpLib2Error, OSError)
+
+# Transportes HTTP por hilo, compartidos entre instancias de los clientes con
+# las mismas credenciales: la conexión keep-alive sobrevive al objeto cliente
+_TRANSPORTS = threading.local()
+
+
+def thread_http(credentials):
+    """
+    Retorna un transporte HTTP autorizado propio del hilo actual.
+    
+    httplib2.Http no es thread-safe, por lo que cada hilo mantiene su
+    propia instancia. Se reutiliza entre peticiones (y entre instancias
+    con las mismas credenciales) para aprovechar keep-alive y evitar un
+    handshake TLS por llamada.
+    
+    Args:
+        credentials: Credenciales con las que se autorizan las peticiones
+    
+    Returns:
+        google_auth_httplib2.AuthorizedHttp: Transporte del hilo actual
+    """
+    transports = getattr(_TRANSPORTS, 'by_credentials', None)
+    if transports is None:
+        transports = _TRANSPORTS.by_credentials = {}
+    # La clave es id(credentials): el transporte guarda una referencia a
+    # las credenciales, así que el id no se reutiliza mientras exista
+    http = transports.get(id(credentials))
+    if http is None:
+        http = google_auth_httplib2.AuthorizedHttp(
+            credentials,
+            http=httplib2.Http(timeout=HTTP_TIMEOUT)
+        )
+        transports[id(credentials)] = http
+    return http
+
+
+def build_request(credentials, http, *args, **kwargs):
+    """
+    requestBuilder para build(): asocia cada petición al transporte del hilo.
+    
+    Se pasa como functools.partial(build_request, credentials); el http que
+    recibe de googleapiclient se ignora en favor de thread_http().
+    
+    Returns:
+        HttpRequest: Petición que se ejecuta sobre thread_http(credentials)
+    """
+    return HttpRequest(thread_http(credentials), *args, **kwargs)
+
+
+class FastJsonModel(JsonModel):
+    """
+    JsonModel que parsea las respuestas con json_loads (orjson si está).
+    
+    Se pasa a build(model=...) en lugar de parchear googleapiclient; el
+    mayor beneficio está en los listados paginados y los batch.
+    """
+    
+    def deserialize(self, content):
+        try:
+            body = json_loads(content)
+        except ValueError:
+            # Cuerpo no JSON: mismo comportamiento que JsonModel
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
@@ -28,8 +28,21 @@ class MeetingRecordingInline(admin.StackedInline):
     readonly_fields = ('created_at',)
 
 
+class BaseMeetingsAdmin(admin.ModelAdmin):
+    """
+    Base de los admins de la app.
+    
+    Cada subclase declara su FK principal en list_select_related (la lista
+    la carga en la misma consulta, sin N+1) y en raw_id_fields (widget de
+    ID en lugar de un <select> con todas las filas). show_full_result_count
+    evita el COUNT(*) sin filtros en cada carga de la lista.
+    """
+    
+    show_full_result_count = False
+
+
 @admin.register(Meeting)
-class MeetingAdmin(admin.ModelAdmin):
+class MeetingAdmin(BaseMeetingsAdmin):
     """
     Configuración del admin para el modelo Meeting.
     """
@@ -45,6 +58,10 @@ class MeetingAdmin(admin.ModelAdmin):
         'created_at'
     )
     
+    # Relación principal (ver BaseMeetingsAdmin)
+    list_select_related = ('organizer',)
+    raw_id_fields = ('organizer',)
+    
     # Filtros laterales
     list_filter = (
         'status',
@@ -129,7 +146,7 @@ class MeetingAdmin(admin.ModelAdmin):
 
 
 @admin.register(MeetingRecording)
-class MeetingRecordingAdmin(admin.ModelAdmin):
+class MeetingRecordingAdmin(BaseMeetingsAdmin):
     """
     Configuración del admin para el modelo MeetingRecording.
     """
@@ -144,6 +161,10 @@ class MeetingRecordingAdmin(admin.ModelAdmin):
         'created_at'
     )
     
+    # Relación principal (ver BaseMeetingsAdmin)
+    list_select_related = ('meeting',)
+    raw_id_fields = ('meeting',)
+    
     # Filtros laterales
     list_filter = (
         'available_at',
@@ -194,7 +215,7 @@ class MeetingRecordingAdmin(admin.ModelAdmin):
 
 
 @admin.register(Participant)
-class ParticipantAdmin(admin.ModelAdmin):
+class ParticipantAdmin(BaseMeetingsAdmin):
     """
     Configuración del admin para el modelo Participant.
     """
@@ -208,6 +229,10 @@ class ParticipantAdmin(admin.ModelAdmin):
         'created_at'
     )
     
+    # Relación principal (ver BaseMeetingsAdmin)
+    list_select_related = ('meeting',)
+    raw_id_fields = ('meeting',)
+    
     # Filtros laterales
     list_filter = (
         'role',
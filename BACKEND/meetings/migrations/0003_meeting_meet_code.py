@@ -0,0 +1,23 @@
+# Generated manually - Add generated meet_code column
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0002_add_conference_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='meet_code',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Replace('meet_link', models.Value('https://meet.google.com/'), models.Value('')), help_text='Código de la reunión derivado de meet_link (ej: abc-defg-hij)', output_field=models.CharField(max_length=200), verbose_name='Código de Meet'),
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['meet_code'], name='meetings_me_meet_co_b9dad6_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated manually - Add composite index on (status, scheduled_start)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0003_meeting_meet_code'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['status', 'scheduled_start'], name='meet_status_start_idx'),
+        ),
+    ]
@@ -9,6 +9,8 @@ Incluye:
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Replace
 
 
 class Meeting(models.Model):
@@ -84,6 +86,14 @@ class Meeting(models.Model):
         help_text='ID del conference record de Google Meet (se crea cuando la conferencia inicia)'
     )
     
+    meet_code = models.GeneratedField(
+        expression=Replace('meet_link', Value('https://meet.google.com/'), Value('')),
+        output_field=models.CharField(max_length=200),
+        db_persist=True,
+        verbose_name='Código de Meet',
+        help_text='Código de la reunión derivado de meet_link (ej: abc-defg-hij)'
+    )
+    
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name='Fecha de Creación'
@@ -103,6 +113,9 @@ class Meeting(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['-created_at']),
             models.Index(fields=['conference_record_id']),
+            models.Index(fields=['meet_code']),
+            # Listado filtrado por status y rango de scheduled_start
+            models.Index(fields=['status', 'scheduled_start'], name='meet_status_start_idx'),
         ]
     
     def __str__(self):
@@ -57,10 +57,10 @@ class MeetingService:
             if create_calendar_event:
                 # Flujo original: crear en Calendar
                 public_access = validated_data.get('public_access', False)
-            google_event_data = self._create_google_meet_event(
-                organizer_email=organizer_email,
-                invited_emails=invited_emails,
-                scheduled_start=scheduled_start,
+                google_event_data = self._create_google_meet_event(
+                    organizer_email=organizer_email,
+                    invited_emails=invited_emails,
+                    scheduled_start=scheduled_start,
                     scheduled_end=scheduled_end,
                     auto_record=auto_record,
                     public_access=public_access
@@ -69,10 +69,10 @@ class MeetingService:
                 meet_link = google_event_data['meet_link']
             else:
                 # Nuevo flujo: solo crear espacio de Meet (sin Calendar)
-                from integrations.services import GoogleMeetService
+                from integrations.services import get_meet_service
                 import uuid
                 
-                google_service = GoogleMeetService()
+                google_service = get_meet_service()
                 
                 # Determinar si usar acceso público
                 # PRIORIDAD: Si no se crea evento en Calendar, acceso público por defecto
@@ -117,7 +117,7 @@ class MeetingService:
                         f"No se pudo crear el espacio de Google Meet. "
                         f"Error: {str(e)}. "
                         f"Verifica la configuración de Google y los logs para más detalles."
-            )
+                    )
             
             # 3. Crear reunión en base de datos
             meeting = Meeting.objects.create(
@@ -209,11 +209,11 @@ class MeetingService:
         if google_configured:
             # Usar integración real con Google
             try:
-                from integrations.services import GoogleMeetService
+                from integrations.services import get_meet_service
                 
                 logger.info("Usando integración REAL con Google Calendar API")
                 
-                google_service = GoogleMeetService()
+                google_service = get_meet_service()
                 event_data = google_service.create_meeting_event(
                     organizer_email=organizer_email,
                     invited_emails=invited_emails,
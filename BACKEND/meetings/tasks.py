@@ -96,7 +96,7 @@ def sync_meeting_recording_task(self, meeting_id: int):
 
 
 @shared_task(name='meetings.sync_all_recordings', bind=True, max_retries=2)
-def sync_all_recordings_task(self, limit: int = None):
+def sync_all_recordings_task(self, limit: int = None, force: bool = False):
     """
     Tarea periódica para sincronizar todas las grabaciones pendientes.
     
@@ -107,6 +107,7 @@ def sync_all_recordings_task(self, limit: int = None):
     
     Args:
         limit (int, optional): Límite de reuniones a procesar
+        force (bool): Si True, ignora las grabaciones cacheadas de Conference Records API
     
     Returns:
         dict: Estadísticas de sincronización
@@ -122,10 +123,10 @@ def sync_all_recordings_task(self, limit: int = None):
         Retry: Si hay error temporal, reintenta hasta 2 veces
     """
     try:
-        logger.info(f"Iniciando sincronización masiva de grabaciones (limit: {limit})")
+        logger.info(f"Iniciando sincronización masiva de grabaciones (limit: {limit}, force: {force})")
         
         sync_service = RecordingSyncService()
-        stats = sync_service.sync_all_recordings(limit=limit)
+        stats = sync_service.sync_all_recordings(limit=limit, force=force)
         
         logger.info(f"Sincronización masiva completada: {stats}")
         
@@ -0,0 +1,45 @@
+"""
+Helpers para crear datos de prueba de reuniones.
+"""
+
+from datetime import timedelta
+from django.test import override_settings
+from django.utils import timezone
+
+from meetings.models import Meeting
+
+# Hasher rápido para las clases de test que usan create_user: no necesitan
+# contraseñas seguras. Uso: @FAST_PASSWORD_HASHERS sobre la clase
+FAST_PASSWORD_HASHERS = override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
+
+
+def make_finished_meetings(user, n, base_offset_days=1):
+    """
+    Crea n reuniones finalizadas con un solo INSERT (bulk_create).
+    
+    La reunión i se llama test_event_{i}, usa el enlace
+    https://meet.google.com/test{i} y empezó hace i + base_offset_days días
+    (una hora de duración).
+    
+    Args:
+        user (User): Organizador de las reuniones
+        n (int): Número de reuniones
+        base_offset_days (int): Días hacia atrás de la reunión más reciente
+    
+    Returns:
+        List[Meeting]: Reuniones creadas, en orden de i
+    """
+    now = timezone.now()
+    return Meeting.objects.bulk_create([
+        Meeting(
+            organizer=user,
+            google_event_id=f'test_event_{i}',
+            meet_link=f'https://meet.google.com/test{i}',
+            scheduled_start=now - timedelta(days=i + base_offset_days),
+            scheduled_end=now - timedelta(days=i + base_offset_days) + timedelta(hours=1),
+            status='FINISHED'
+        )
+        for i in range(n)
+    ])
@@ -16,9 +16,11 @@ from celery import current_app
 
 from meetings.tasks import sync_meeting_recording_task, sync_all_recordings_task
 from meetings.models import Meeting, MeetingRecording
+from meetings.tests.factories import FAST_PASSWORD_HASHERS, make_finished_meetings
 from accounts.models import User
 
 
+@FAST_PASSWORD_HASHERS
 class RecordingTasksTestCase(TestCase):
     """Tests para tareas de Celery de grabaciones"""
 
@@ -123,15 +125,7 @@ class RecordingTasksTestCase(TestCase):
     def test_sync_all_recordings_task_success(self, mock_service_class):
         """Test de tarea de sincronización masiva exitosa"""
         # Crear múltiples reuniones sin grabación
-        for i in range(3):
-            Meeting.objects.create(
-                organizer=self.user,
-                google_event_id=f'test_event_{i}',
-                meet_link=f'https://meet.google.com/test{i}',
-                scheduled_start=timezone.now() - timedelta(days=i+1),
-                scheduled_end=timezone.now() - timedelta(days=i+1) + timedelta(hours=1),
-                status='FINISHED'
-            )
+        make_finished_meetings(self.user, 3)
         
         mock_service = Mock()
         mock_service_class.return_value = mock_service
@@ -153,15 +147,7 @@ class RecordingTasksTestCase(TestCase):
     def test_sync_all_recordings_task_with_limit(self, mock_service_class):
         """Test de tarea de sincronización masiva con límite"""
         # Crear múltiples reuniones
-        for i in range(10):
-            Meeting.objects.create(
-                organizer=self.user,
-                google_event_id=f'test_event_{i}',
-                meet_link=f'https://meet.google.com/test{i}',
-                scheduled_start=timezone.now() - timedelta(days=i+1),
-                scheduled_end=timezone.now() - timedelta(days=i+1) + timedelta(hours=1),
-                status='FINISHED'
-            )
+        make_finished_meetings(self.user, 10)
         
         mock_service = Mock()
         mock_service_class.return_value = mock_service
@@ -176,7 +162,7 @@ class RecordingTasksTestCase(TestCase):
         
         self.assertTrue(result['success'])
         self.assertEqual(result['total_processed'], 5)
-        mock_service.sync_all_recordings.assert_called_once_with(limit=5)
+        mock_service.sync_all_recordings.assert_called_once_with(limit=5, force=False)
 
     @patch('meetings.tasks.RecordingSyncService')
     def test_sync_all_recordings_task_no_limit(self, mock_service_class):
@@ -193,7 +179,7 @@ class RecordingTasksTestCase(TestCase):
         result = sync_all_recordings_task(limit=None)
         
         self.assertTrue(result['success'])
-        mock_service.sync_all_recordings.assert_called_once_with(limit=None)
+        mock_service.sync_all_recordings.assert_called_once_with(limit=None, force=False)
 
     @patch('meetings.tasks.RecordingSyncService')
     def test_sync_all_recordings_task_exception(self, mock_service_class):
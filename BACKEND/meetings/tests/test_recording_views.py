@@ -16,9 +16,11 @@ from datetime import datetime, timedelta
 from django.utils import timezone
 
 from meetings.models import Meeting, MeetingRecording
+from meetings.tests.factories import FAST_PASSWORD_HASHERS
 from accounts.models import User
 
 
+@FAST_PASSWORD_HASHERS
 class RecordingViewsTestCase(TestCase):
     """Tests para endpoints de API de grabaciones"""
 
@@ -102,7 +104,7 @@ class RecordingViewsTestCase(TestCase):
             self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
             self.assertIn('task_id', response.data)
             self.assertEqual(response.data['status'], 'pending')
-            mock_task.delay.assert_called_once_with(limit=None)
+            mock_task.delay.assert_called_once_with(limit=None, force=False)
 
     def test_sync_all_endpoint_with_limit_query_param(self):
         """Test de endpoint de sincronización masiva con límite en query param"""
@@ -115,7 +117,7 @@ class RecordingViewsTestCase(TestCase):
             
             self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
             self.assertEqual(response.data['limit'], 50)
-            mock_task.delay.assert_called_once_with(limit=50)
+            mock_task.delay.assert_called_once_with(limit=50, force=False)
 
     def test_sync_all_endpoint_with_limit_body(self):
         """Test de endpoint de sincronización masiva con límite en body"""
@@ -128,7 +130,20 @@ class RecordingViewsTestCase(TestCase):
             
             self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
             self.assertEqual(response.data['limit'], 30)
-            mock_task.delay.assert_called_once_with(limit=30)
+            mock_task.delay.assert_called_once_with(limit=30, force=False)
+
+    def test_sync_all_endpoint_with_force(self):
+        """Test de endpoint de sincronización masiva forzando la consulta a la API"""
+        url = reverse('recording-sync-all')
+        
+        with patch('meetings.views.sync_all_recordings_task') as mock_task:
+            mock_task.delay.return_value = Mock(id='test_task_id')
+            
+            response = self.client.post(url, {'force': True}, format='json')
+            
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertTrue(response.data['force'])
+            mock_task.delay.assert_called_once_with(limit=None, force=True)
 
     def test_sync_all_endpoint_invalid_limit(self):
         """Test de endpoint con límite inválido"""
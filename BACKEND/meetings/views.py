@@ -377,10 +377,13 @@ class MeetingRecordingViewSet(viewsets.ReadOnlyModelViewSet):
         
         Query Parameters (opcional):
             - limit: Límite de reuniones a procesar (query param o body)
+            - force: Si es true, vuelve a consultar las grabaciones cacheadas
+              de Conference Records API (query param o body)
         
         Request Body (opcional):
             {
-                "limit": 50
+                "limit": 50,
+                "force": false
             }
         
         Returns:
@@ -418,16 +421,22 @@ class MeetingRecordingViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
         
+        force = request.query_params.get('force')
+        if force is None and request.data:
+            force = request.data.get('force')
+        force = str(force).lower() in ('true', '1') if force is not None else False
+        
         # Encolar tarea de sincronización masiva
         try:
-            task = sync_all_recordings_task.delay(limit=limit)
+            task = sync_all_recordings_task.delay(limit=limit, force=force)
             
             return Response(
                 {
                     'message': 'Sincronización masiva de grabaciones iniciada',
                     'task_id': task.id,
                     'status': 'pending',
-                    'limit': limit
+                    'limit': limit,
+                    'force': force
                 },
                 status=status.HTTP_202_ACCEPTED
             )
@@ -16,10 +16,12 @@ from datetime import datetime, timedelta
 from django.utils import timezone
 
 from meetings.models import Meeting, MeetingRecording
+from meetings.tests.factories import FAST_PASSWORD_HASHERS, make_finished_meetings
 from accounts.models import User
 from integrations.recording_service import RecordingSyncService
 
 
+@FAST_PASSWORD_HASHERS
 class RecordingSyncIntegrationTestCase(TransactionTestCase):
     """Tests de integración para sincronización de grabaciones"""
 
@@ -57,7 +59,7 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
             }
         }
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_full_sync_flow(self, mock_drive_client_class):
         """Test de flujo completo de sincronización"""
         # Mock del cliente de Drive
@@ -79,7 +81,7 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
         saved_recording = MeetingRecording.objects.get(meeting=self.meeting)
         self.assertEqual(saved_recording.drive_file_id, 'drive_file_123')
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_sync_via_api_endpoint(self, mock_drive_client_class):
         """Test de sincronización a través del endpoint de API"""
         # Mock del cliente de Drive
@@ -107,21 +109,11 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
             self.assertIsNotNone(recording)
             self.assertEqual(recording.drive_file_id, 'drive_file_123')
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_sync_multiple_meetings(self, mock_drive_client_class):
         """Test de sincronización de múltiples reuniones"""
         # Crear múltiples reuniones
-        meetings = []
-        for i in range(3):
-            meeting = Meeting.objects.create(
-                organizer=self.user,
-                google_event_id=f'test_event_{i}',
-                meet_link=f'https://meet.google.com/test{i}',
-                scheduled_start=timezone.now() - timedelta(days=i+1),
-                scheduled_end=timezone.now() - timedelta(days=i+1) + timedelta(hours=1),
-                status='FINISHED'
-            )
-            meetings.append(meeting)
+        meetings = make_finished_meetings(self.user, 3)
         
         # Mock del cliente de Drive
         mock_drive_client = Mock()
@@ -147,7 +139,7 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
         ).count()
         self.assertEqual(recordings_count, 3)
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_sync_with_date_range_fallback(self, mock_drive_client_class):
         """Test de sincronización usando búsqueda por rango de fechas como fallback"""
         # Mock del cliente de Drive
@@ -167,7 +159,7 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
         self.assertEqual(recording.drive_file_id, 'drive_file_123')
         mock_drive_client.search_recordings_by_date_range.assert_called_once()
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_sync_updates_existing_recording(self, mock_drive_client_class):
         """Test de actualización de grabación existente"""
         # Crear grabación existente
@@ -196,7 +188,7 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
         recordings_count = MeetingRecording.objects.filter(meeting=self.meeting).count()
         self.assertEqual(recordings_count, 1)
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_sync_handles_multiple_candidates(self, mock_drive_client_class):
         """Test de manejo de múltiples archivos candidatos"""
         # Mock del cliente de Drive
@@ -249,7 +241,7 @@ class RecordingSyncIntegrationTestCase(TransactionTestCase):
         self.assertEqual(response.data['drive_file_id'], 'test_file_id')
         self.assertEqual(response.data['drive_file_url'], recording.drive_file_url)
 
-    @patch('integrations.recording_service.GoogleDriveClient')
+    @patch('integrations.recording_service.get_drive_client')
     def test_sync_skips_meetings_with_recording(self, mock_drive_client_class):
         """Test de que sync_all omite reuniones con grabación existente"""
         # Crear grabación para la reunión